@@ -0,0 +1,2 @@
+# this_file: benchmarks/__init__.py
+"""Performance benchmarks for camtasio on synthetic large projects."""
@@ -0,0 +1,133 @@
+# this_file: benchmarks/import_time.py
+"""Measure cold import time of the package entry points.
+
+Usage::
+
+    python -m benchmarks.import_time             # compare to baselines
+    python -m benchmarks.import_time --update    # rewrite the "import" baselines
+    python -m benchmarks.import_time --check     # exit 1 on regressions
+
+Each module is imported in a fresh interpreter run with ``python -X
+importtime``; the cumulative time reported for the module itself is the
+result, so interpreter start-up is not included. The best of ``repeat`` runs
+is compared with the ``import`` preset of ``baselines.json``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import fire
+from rich.console import Console
+from rich.table import Table
+
+from .run_benchmarks import BenchmarkResult, find_regressions, load_baselines, save_baselines
+
+# Baselines preset holding the import benchmarks
+IMPORT_PRESET = "import"
+
+# Modules whose import time is tracked: the library, JSON loading and the CLI
+IMPORT_TARGETS = ("camtasio", "camtasio.serialization", "camtasio.cli.app")
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+console = Console()
+
+
+def parse_importtime(stderr: str, module: str) -> float:
+    """Cumulative import time of a module from ``-X importtime`` output.
+
+    Args:
+        stderr: Standard error of the interpreter run
+        module: Fully qualified module name
+
+    Returns:
+        Seconds
+
+    Raises:
+        ValueError: If the output has no line for the module
+    """
+    # A submodule's own line excludes its parent packages, which are imported
+    # first; the import statement's line that includes them comes last
+    cumulative = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative.append(int(fields[1]))
+    if not cumulative:
+        raise ValueError(f"No import time reported for {module}")
+    return max(cumulative) / 1_000_000
+
+
+def measure_import(module: str, repeat: int = 5) -> float:
+    """Best cumulative import time of a module in fresh interpreters.
+
+    Args:
+        module: Fully qualified module name
+        repeat: Number of interpreter runs
+
+    Returns:
+        Seconds
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_PATH), env.get("PYTHONPATH")]))
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        best = min(best, parse_importtime(completed.stderr, module))
+    return best
+
+
+def main(
+    repeat: int = 5, update: bool = False, check: bool = False, tolerance: float = 0.5
+) -> None:
+    """Measure import times and compare them with the stored baselines.
+
+    Args:
+        repeat: Number of interpreter runs per module
+        update: Write the results to baselines.json
+        check: Exit with status 1 if any import regressed
+        tolerance: Allowed relative slowdown
+    """
+    results = [
+        BenchmarkResult(IMPORT_PRESET, module, measure_import(module, repeat), 0.0)
+        for module in IMPORT_TARGETS
+    ]
+    baselines = load_baselines()
+
+    table = Table(title="Camtasio Import Time")
+    table.add_column("Module", style="cyan", no_wrap=True)
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("vs. baseline", justify="right")
+    for result in results:
+        old_seconds = baselines.get(IMPORT_PRESET, {}).get(result.name, {}).get("seconds")
+        table.add_row(
+            result.name,
+            f"{result.seconds * 1000:.1f}",
+            f"{result.seconds / old_seconds:.2f}x" if old_seconds else "-",
+        )
+    console.print(table)
+
+    regressions = find_regressions(results, baselines, tolerance)
+    for regression in regressions:
+        console.print(f"[yellow]Regression:[/] {regression}")
+
+    if update:
+        save_baselines(results)
+        console.print(f"[green]✓[/] Import baselines written to {IMPORT_PRESET!r} preset")
+
+    if check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    fire.Fire(main)
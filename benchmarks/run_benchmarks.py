@@ -0,0 +1,330 @@
+# this_file: benchmarks/run_benchmarks.py
+"""Time and memory-profile the load, transform and save paths.
+
+Usage::
+
+    python -m benchmarks.run_benchmarks                   # small + medium, compare to baselines
+    python -m benchmarks.run_benchmarks --presets=large   # one preset
+    python -m benchmarks.run_benchmarks --update          # rewrite baselines.json
+    python -m benchmarks.run_benchmarks --check           # exit 1 on regressions
+
+Each benchmark is timed as the best of ``repeat`` runs; peak memory is
+measured with ``tracemalloc`` in a separate run so tracing does not distort
+the timings. Results are compared with ``baselines.json`` and any benchmark
+slower or larger than its baseline by more than ``tolerance`` is reported as
+a regression.
+"""
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import fire
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from camtasio.models import Project
+from camtasio.scaler import TscprojScaler
+from camtasio.serialization import (
+    ProjectLoader,
+    ProjectSaver,
+    TrackedDocument,
+    load_json_file,
+)
+from camtasio.transforms import PropertyTransformer, TransformConfig, TransformType
+
+from .synthetic import SyntheticSpec, write_project
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+PRESETS: dict[str, SyntheticSpec] = {
+    "small": SyntheticSpec(tracks=4, clips=50, keyframes=4, group_depth=2),
+    "medium": SyntheticSpec(tracks=12, clips=250, keyframes=8, group_depth=3),
+    "large": SyntheticSpec(tracks=24, clips=1000, keyframes=16, group_depth=4),
+}
+
+console = Console()
+
+
+@dataclass
+class BenchmarkContext:
+    """Inputs shared by the benchmarks of one preset."""
+
+    path: Path
+    data: dict[str, Any]
+    project: Project
+    document: TrackedDocument
+    workdir: Path
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurement of one benchmark on one preset."""
+
+    preset: str
+    name: str
+    seconds: float
+    peak_mib: float
+
+
+def _bench_load_file(ctx: BenchmarkContext) -> Any:
+    return ProjectLoader().load_file(ctx.path)
+
+
+def _bench_scale_spatial(ctx: BenchmarkContext) -> Any:
+    return ctx.project.scale_spatial(2.0)
+
+
+def _bench_scale_temporal(ctx: BenchmarkContext) -> Any:
+    return ctx.project.scale_temporal(2.0)
+
+
+def _bench_transform_dict_spatial(ctx: BenchmarkContext) -> Any:
+    config = TransformConfig(TransformType.SPATIAL, 2.0)
+    return PropertyTransformer(config).transform_dict(ctx.data)
+
+
+def _bench_transform_dict_temporal(ctx: BenchmarkContext) -> Any:
+    config = TransformConfig(TransformType.TEMPORAL, 2.0)
+    return PropertyTransformer(config).transform_dict(ctx.data)
+
+
+def _bench_transform_dict_parallel(ctx: BenchmarkContext) -> Any:
+    # Same work as transform_dict_spatial, split by track across all cores;
+    # peak memory covers the calling process only
+    config = TransformConfig(TransformType.SPATIAL, 2.0, workers=0)
+    return PropertyTransformer(config).transform_dict(ctx.data)
+
+
+def _bench_scaler_scale_file(ctx: BenchmarkContext) -> Any:
+    TscprojScaler(2.0).scale_file(ctx.path, ctx.workdir / "scaled.tscproj")
+
+
+def _bench_save_file(ctx: BenchmarkContext) -> Any:
+    ProjectSaver().save_file(ctx.project, ctx.workdir / "saved.tscproj")
+
+
+def _bench_save_dict(ctx: BenchmarkContext) -> Any:
+    ctx.data["sourceBin"][0]["src"] = "moved.mp4"
+    ProjectSaver().save_dict(ctx.data, ctx.workdir / "edited.tscproj")
+
+
+def _bench_save_document(ctx: BenchmarkContext) -> Any:
+    ctx.document.data["sourceBin"][0]["src"] = "moved.mp4"
+    ctx.document.mark_dirty("/sourceBin/0/src")
+    ProjectSaver().save_document(ctx.document, ctx.workdir / "edited.tscproj")
+
+
+BENCHMARKS: dict[str, Callable[[BenchmarkContext], Any]] = {
+    "load_file": _bench_load_file,
+    "scale_spatial": _bench_scale_spatial,
+    "scale_temporal": _bench_scale_temporal,
+    "transform_dict_spatial": _bench_transform_dict_spatial,
+    "transform_dict_temporal": _bench_transform_dict_temporal,
+    "transform_dict_parallel": _bench_transform_dict_parallel,
+    "scaler_scale_file": _bench_scaler_scale_file,
+    "save_file": _bench_save_file,
+    "save_dict": _bench_save_dict,
+    "save_document": _bench_save_document,
+}
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> tuple[float, float]:
+    """Time a callable and measure its peak traced memory.
+
+    Args:
+        func: Callable to measure
+        repeat: Number of timed runs; the fastest is reported
+
+    Returns:
+        Tuple of (best seconds, peak MiB)
+    """
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak / (1024 * 1024)
+
+
+def run_preset(
+    preset: str, spec: SyntheticSpec, repeat: int = 3, names: list[str] | None = None
+) -> list[BenchmarkResult]:
+    """Run the benchmarks on one synthetic project.
+
+    Args:
+        preset: Preset name used in the results
+        spec: Shape of the synthetic project
+        repeat: Number of timed runs per benchmark
+        names: Benchmarks to run (default: all)
+
+    Returns:
+        One result per benchmark
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        path = write_project(workdir / f"{preset}.tscproj", spec)
+        ctx = BenchmarkContext(
+            path=path,
+            data=load_json_file(path),
+            project=ProjectLoader().load_file(path),
+            document=TrackedDocument.load(path),
+            workdir=workdir,
+        )
+        for name in names or list(BENCHMARKS):
+            bench = BENCHMARKS[name]
+            seconds, peak = measure(partial(bench, ctx), repeat)
+            results.append(BenchmarkResult(preset, name, seconds, peak))
+    return results
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict[str, dict[str, dict[str, float]]]:
+    """Load stored baselines keyed by preset and benchmark name."""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data: dict[str, dict[str, dict[str, float]]] = json.load(f)
+    return data
+
+
+def save_baselines(results: list[BenchmarkResult], path: Path = BASELINES_PATH) -> None:
+    """Merge results into the baselines file."""
+    baselines = load_baselines(path)
+    for result in results:
+        entry = asdict(result)
+        preset = entry.pop("preset")
+        name = entry.pop("name")
+        baselines.setdefault(preset, {})[name] = {
+            "seconds": round(entry["seconds"], 6),
+            "peak_mib": round(entry["peak_mib"], 3),
+        }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baselines: dict[str, dict[str, dict[str, float]]],
+    tolerance: float = 0.25,
+) -> list[str]:
+    """Compare results with baselines.
+
+    Args:
+        results: Fresh measurements
+        baselines: Stored baselines
+        tolerance: Allowed relative slowdown or memory growth
+
+    Returns:
+        Human-readable description of each regression
+    """
+    regressions = []
+    for result in results:
+        baseline = baselines.get(result.preset, {}).get(result.name)
+        if not baseline:
+            continue
+        for metric in ("seconds", "peak_mib"):
+            old = baseline.get(metric)
+            new = getattr(result, metric)
+            if old and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{result.preset}/{result.name}: {metric} {old:.4g} -> {new:.4g} "
+                    f"({new / old:.2f}x)"
+                )
+    return regressions
+
+
+def _print_results(
+    results: list[BenchmarkResult], baselines: dict[str, dict[str, dict[str, float]]]
+) -> None:
+    table = Table(title="Camtasio Benchmarks")
+    table.add_column("Preset", style="cyan")
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("vs. baseline", justify="right")
+    table.add_column("Peak (MiB)", justify="right")
+    table.add_column("vs. baseline", justify="right")
+
+    for result in results:
+        baseline = baselines.get(result.preset, {}).get(result.name, {})
+        old_seconds = baseline.get("seconds")
+        old_peak = baseline.get("peak_mib")
+        table.add_row(
+            result.preset,
+            result.name,
+            f"{result.seconds * 1000:.1f}",
+            f"{result.seconds / old_seconds:.2f}x" if old_seconds else "-",
+            f"{result.peak_mib:.1f}",
+            f"{result.peak_mib / old_peak:.2f}x" if old_peak else "-",
+        )
+    console.print(table)
+
+
+def main(
+    presets: str | tuple[str, ...] = ("small", "medium"),
+    benchmarks: str | tuple[str, ...] | None = None,
+    repeat: int = 3,
+    update: bool = False,
+    check: bool = False,
+    tolerance: float = 0.25,
+) -> None:
+    """Run benchmarks and compare them with the stored baselines.
+
+    Args:
+        presets: Preset names (small, medium, large)
+        benchmarks: Benchmark names to run (default: all)
+        repeat: Number of timed runs per benchmark
+        update: Write the results to baselines.json
+        check: Exit with status 1 if any benchmark regressed
+        tolerance: Allowed relative slowdown or memory growth
+    """
+    logger.disable("camtasio")
+    preset_names = [presets] if isinstance(presets, str) else list(presets)
+    names = [benchmarks] if isinstance(benchmarks, str) else list(benchmarks or BENCHMARKS)
+
+    for name in [*preset_names, *names]:
+        if name not in PRESETS and name not in BENCHMARKS:
+            console.print(f"[red]Error:[/] Unknown preset or benchmark '{name}'")
+            sys.exit(2)
+
+    results: list[BenchmarkResult] = []
+    for preset in preset_names:
+        with console.status(f"[bold green]Running {preset} benchmarks..."):
+            results.extend(run_preset(preset, PRESETS[preset], repeat, names))
+
+    baselines = load_baselines()
+    _print_results(results, baselines)
+
+    regressions = find_regressions(results, baselines, tolerance)
+    for regression in regressions:
+        console.print(f"[yellow]Regression:[/] {regression}")
+
+    if update:
+        save_baselines(results)
+        console.print(f"[green]✓[/] Baselines written to {BASELINES_PATH}")
+
+    if check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    fire.Fire(main)
@@ -0,0 +1,333 @@
+# this_file: benchmarks/synthetic.py
+"""Generator for synthetic Camtasia projects of arbitrary size.
+
+The generated documents follow the structure of real ``.tscproj`` files
+(source bin, scene tracks, VMFile/AMFile media, animated parameters,
+callouts and nested Groups), so the loaders, transforms and savers exercise
+the same code paths as on user projects.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import fire
+import orjson
+
+# Camtasia edit rate (ticks per second)
+EDIT_RATE = 705600000
+
+
+@dataclass
+class SyntheticSpec:
+    """Shape of a synthetic project.
+
+    Attributes:
+        tracks: Number of timeline tracks
+        clips: Number of media per track
+        keyframes: Keyframes per animated parameter
+        group_depth: Nesting depth of Group media; 0 disables groups
+        group_every: Every n-th clip of a track is a Group when groups are enabled
+        sources: Number of source bin items
+    """
+
+    tracks: int = 10
+    clips: int = 100
+    keyframes: int = 4
+    group_depth: int = 0
+    group_every: int = 10
+    sources: int = 20
+
+
+def _keyframes(count: int, start: int, duration: int, base: float) -> list[dict[str, Any]]:
+    """Keyframes spread evenly over a clip."""
+    step = duration // max(count, 1)
+    return [
+        {
+            "endTime": start + (i + 1) * step,
+            "time": start + i * step,
+            "value": base + i,
+            "interp": "eioe",
+            "duration": step,
+        }
+        for i in range(count)
+    ]
+
+
+def _source_item(item_id: int) -> dict[str, Any]:
+    """A video source bin entry."""
+    return {
+        "id": item_id,
+        "src": f"./media/clip-{item_id:05d}.mp4",
+        "rect": [0, 0, 1920, 1080],
+        "lastMod": "20250101T120000",
+        "loudnessNormalization": True,
+        "sourceTracks": [
+            {
+                "range": [0, 600000],
+                "type": 0,
+                "editRate": 1000,
+                "trackRect": [0, 0, 1920, 1080],
+                "sampleRate": 60,
+                "bitDepth": 0,
+                "numChannels": 0,
+                "integratedLUFS": 100.0,
+                "peakLevel": -1.0,
+                "tag": 0,
+                "metaData": f"clip-{item_id:05d}.mp4;",
+                "parameters": {},
+            }
+        ],
+        "metadata": {"timeAdded": "20250101T120000.000000"},
+    }
+
+
+class _Builder:
+    """Creates media dictionaries with unique ids."""
+
+    def __init__(self, spec: SyntheticSpec):
+        self.spec = spec
+        self.next_id = spec.sources + 1
+
+    def _take_id(self) -> int:
+        media_id = self.next_id
+        self.next_id += 1
+        return media_id
+
+    def _timing(self, start: int, duration: int) -> dict[str, Any]:
+        return {
+            "start": start,
+            "duration": duration,
+            "mediaStart": 0,
+            "mediaDuration": duration,
+            "scalar": 1,
+        }
+
+    def video(self, start: int, duration: int) -> dict[str, Any]:
+        """A VMFile clip with animated position and scale."""
+        media_id = self._take_id()
+        kf = self.spec.keyframes
+        return {
+            "id": media_id,
+            "_type": "VMFile",
+            "src": media_id % self.spec.sources + 1,
+            "trackNumber": 0,
+            "attributes": {"ident": f"clip-{media_id}"},
+            "parameters": {
+                "translation0": {
+                    "type": "double",
+                    "defaultValue": 0.0,
+                    "keyframes": _keyframes(kf, 0, duration, -100.0),
+                },
+                "translation1": 12.5,
+                "scale0": {
+                    "type": "double",
+                    "defaultValue": 1.0,
+                    "keyframes": _keyframes(kf, 0, duration, 0.5),
+                },
+                "scale1": 1.0,
+                "geometryCrop0": 0.0,
+                "geometryCrop1": 0.0,
+                "geometryCrop2": 0.0,
+                "geometryCrop3": 0.0,
+            },
+            "effects": [],
+            **self._timing(start, duration),
+            "metadata": {
+                "clipSpeedAttribute": {"type": "bool", "value": False},
+                "default-width": {"type": "double", "value": 1920.0},
+                "default-height": {"type": "double", "value": 1080.0},
+                "effectApplied": "none",
+            },
+            "animationTracks": {},
+        }
+
+    def audio(self, start: int, duration: int) -> dict[str, Any]:
+        """An AMFile clip with a volume envelope."""
+        media_id = self._take_id()
+        return {
+            "id": media_id,
+            "_type": "AMFile",
+            "src": media_id % self.spec.sources + 1,
+            "trackNumber": 0,
+            "attributes": {"ident": f"audio-{media_id}", "gain": 1.0},
+            "channelNumber": "0,1",
+            "parameters": {
+                "volume": {
+                    "type": "double",
+                    "keyframes": _keyframes(self.spec.keyframes, 0, duration, 0.5),
+                }
+            },
+            "effects": [],
+            **self._timing(start, duration),
+            "metadata": {"effectApplied": "none"},
+            "animationTracks": {},
+        }
+
+    def callout(self, start: int, duration: int) -> dict[str, Any]:
+        """A text callout with a shape definition."""
+        media_id = self._take_id()
+        return {
+            "id": media_id,
+            "_type": "Callout",
+            "def": {
+                "kind": "remix",
+                "shape": "text",
+                "corner-radius": 8.0,
+                "height": 180.0,
+                "width": 640.0,
+                "stroke-width": 2.0,
+                "text": f"Caption {media_id}",
+            },
+            "attributes": {"ident": ""},
+            "parameters": {"translation0": 10.0, "translation1": -20.0},
+            "effects": [],
+            **self._timing(start, duration),
+            "metadata": {},
+            "animationTracks": {},
+        }
+
+    def group(self, start: int, duration: int, depth: int) -> dict[str, Any]:
+        """A Group whose inner tracks nest further Groups down to ``depth``."""
+        media_id = self._take_id()
+        inner = self.group(0, duration, depth - 1) if depth > 1 else self.video(0, duration)
+        return {
+            "id": media_id,
+            "_type": "Group",
+            "parameters": {
+                "geometryCrop0": 0.0,
+                "geometryCrop1": 0.0,
+                "opacity": {
+                    "type": "double",
+                    "defaultValue": 0.0,
+                    "keyframes": _keyframes(self.spec.keyframes, 0, duration, 1.0),
+                },
+            },
+            "tracks": [
+                _track(0, [inner]),
+                _track(1, [self.callout(0, duration)]),
+            ],
+            "attributes": {"ident": f"group-{media_id}", "widthAttr": 1920.0, "heightAttr": 1080.0},
+            **self._timing(start, duration),
+            "metadata": {},
+            "animationTracks": {},
+        }
+
+
+def _track(index: int, medias: list[dict[str, Any]]) -> dict[str, Any]:
+    """A track dictionary holding the given media."""
+    return {
+        "trackIndex": index,
+        "medias": medias,
+        "transitions": [],
+        "parameters": {},
+        "ident": f"Track {index + 1}",
+        "audioMuted": False,
+        "videoHidden": False,
+        "magnetic": False,
+        "matte": 0,
+        "solo": False,
+        "metadata": {"IsLocked": "False", "trackHeight": "56"},
+    }
+
+
+def generate_project(spec: SyntheticSpec) -> dict[str, Any]:
+    """Build a synthetic project dictionary.
+
+    Track 0 holds audio, every fourth track holds callouts and the remaining
+    tracks hold video clips; Groups replace every ``group_every``-th clip when
+    ``group_depth`` is positive.
+
+    Args:
+        spec: Shape of the project
+
+    Returns:
+        Project dictionary in ``.tscproj`` layout
+    """
+    builder = _Builder(spec)
+    clip_duration = 2 * EDIT_RATE
+    tracks = []
+    for track_index in range(spec.tracks):
+        medias = []
+        for clip_index in range(spec.clips):
+            start = clip_index * clip_duration
+            if spec.group_depth > 0 and clip_index % spec.group_every == spec.group_every - 1:
+                medias.append(builder.group(start, clip_duration, spec.group_depth))
+            elif track_index == 0:
+                medias.append(builder.audio(start, clip_duration))
+            elif track_index % 4 == 3:
+                medias.append(builder.callout(start, clip_duration))
+            else:
+                medias.append(builder.video(start, clip_duration))
+        tracks.append(_track(track_index, medias))
+
+    return {
+        "title": "Synthetic benchmark project",
+        "description": "",
+        "author": "",
+        "targetLoudness": -18.0,
+        "shouldApplyLoudnessNormalization": True,
+        "videoFormatFrameRate": 30,
+        "audioFormatSampleRate": 44100,
+        "allowSubFrameEditing": False,
+        "width": 1920.0,
+        "height": 1080.0,
+        "version": "9.0",
+        "editRate": EDIT_RATE,
+        "authoringClientName": {"name": "Camtasia", "platform": "Mac", "version": "2025.0"},
+        "sourceBin": [_source_item(i + 1) for i in range(spec.sources)],
+        "timeline": {
+            "id": builder.next_id,
+            "sceneTrack": {"scenes": [{"csml": {"tracks": tracks}}]},
+            "trackAttributes": [
+                {"ident": f"Track {i + 1}", "audioMuted": False, "videoHidden": False}
+                for i in range(spec.tracks)
+            ],
+            "parameters": {},
+        },
+        "metadata": {"AutoSaveFile": ""},
+    }
+
+
+def write_project(path: str | Path, spec: SyntheticSpec) -> Path:
+    """Write a synthetic project file.
+
+    Args:
+        path: Destination ``.tscproj`` path
+        spec: Shape of the project
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    path.write_bytes(orjson.dumps(generate_project(spec), option=orjson.OPT_INDENT_2))
+    return path
+
+
+def main(
+    output: str,
+    tracks: int = 10,
+    clips: int = 100,
+    keyframes: int = 4,
+    group_depth: int = 0,
+    group_every: int = 10,
+    sources: int = 20,
+) -> None:
+    """Write a synthetic project from the command line.
+
+    Args:
+        output: Destination ``.tscproj`` path
+        tracks: Number of timeline tracks
+        clips: Number of media per track
+        keyframes: Keyframes per animated parameter
+        group_depth: Nesting depth of Group media; 0 disables groups
+        group_every: Every n-th clip of a track is a Group
+        sources: Number of source bin items
+    """
+    spec = SyntheticSpec(tracks, clips, keyframes, group_depth, group_every, sources)
+    path = write_project(output, spec)
+    print(f"Wrote {path} ({path.stat().st_size / 1024 / 1024:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    fire.Fire(main)
@@ -1,54 +1,128 @@
 # this_file: src/camtasio/__init__.py
-"""Camtasio - Python toolkit for programmatically manipulating Camtasia project files."""
+"""Camtasio - Python toolkit for programmatically manipulating Camtasia project files.
+
+The public API is imported lazily: ``import camtasio`` only loads this module,
+and each name below imports its subpackage on first access, so
+``from camtasio import ProjectLoader`` doesn't pay for the CLI or NumPy.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 try:
     from ._version import __version__
 except ImportError:
     __version__ = "0.0.0+unknown"
 
-# Import main components
-from .annotations import (
-    Color,
-    FillStyle,
-    HorizontalAlignment,
-    StrokeStyle,
-    VerticalAlignment,
-    square_callout,
-    text_callout,
-)
+if TYPE_CHECKING:
+    # Main components
+    from .annotations import (
+        Color,
+        FillStyle,
+        HorizontalAlignment,
+        StrokeStyle,
+        VerticalAlignment,
+        square_callout,
+        text_callout,
+    )
+
+    # CLI application
+    from .cli import app
+
+    # Effects and annotations
+    from .effects import ChromaKeyEffect, Effect, VisualEffect
+    from .models import (
+        AudioMedia,
+        Canvas,
+        ImageMedia,
+        Media,
+        Project,
+        ProjectMetadata,
+        SourceBin,
+        SourceItem,
+        Timeline,
+        Track,
+        VideoMedia,
+        create_media_from_dict,
+    )
+
+    # Operations
+    from .operations import (
+        add_media_to_track,
+        duplicate_media,
+        find_media_references,
+        remove_media,
+    )
+    from .serialization import ProjectLoader, ProjectSaver, detect_version
+    from .transforms import (
+        CompositeTransformConfig,
+        PropertyTransformer,
+        TransformConfig,
+        TransformType,
+    )
+
+    # Utilities
+    from .utils import RGBA, FrameStamp, hex_to_rgb
+
+# Public names mapped to the subpackage they are imported from on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "Color",
+            "FillStyle",
+            "HorizontalAlignment",
+            "StrokeStyle",
+            "VerticalAlignment",
+            "square_callout",
+            "text_callout",
+        ),
+        ".annotations",
+    ),
+    "app": ".cli",
+    **dict.fromkeys(("ChromaKeyEffect", "Effect", "VisualEffect"), ".effects"),
+    **dict.fromkeys(
+        (
+            "AudioMedia",
+            "Canvas",
+            "ImageMedia",
+            "Media",
+            "Project",
+            "ProjectMetadata",
+            "SourceBin",
+            "SourceItem",
+            "Timeline",
+            "Track",
+            "VideoMedia",
+            "create_media_from_dict",
+        ),
+        ".models",
+    ),
+    **dict.fromkeys(
+        ("add_media_to_track", "duplicate_media", "find_media_references", "remove_media"),
+        ".operations",
+    ),
+    **dict.fromkeys(("ProjectLoader", "ProjectSaver", "detect_version"), ".serialization"),
+    **dict.fromkeys(
+        ("CompositeTransformConfig", "PropertyTransformer", "TransformConfig", "TransformType"),
+        ".transforms",
+    ),
+    **dict.fromkeys(("RGBA", "FrameStamp", "hex_to_rgb"), ".utils"),
+}
+
 
-# CLI application
-from .cli import app
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Effects and annotations
-from .effects import ChromaKeyEffect, Effect, VisualEffect
-from .models import (
-    AudioMedia,
-    Canvas,
-    ImageMedia,
-    Media,
-    Project,
-    ProjectMetadata,
-    SourceBin,
-    SourceItem,
-    Timeline,
-    Track,
-    VideoMedia,
-    create_media_from_dict,
-)
 
-# Operations
-from .operations import (
-    add_media_to_track,
-    duplicate_media,
-    find_media_references,
-    remove_media,
-)
-from .serialization import ProjectLoader, ProjectSaver, detect_version
-from .transforms import PropertyTransformer, TransformConfig, TransformType
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-# Utilities
-from .utils import RGBA, FrameStamp, hex_to_rgb
 
 __all__ = [
     # Utilities
@@ -59,6 +133,7 @@ __all__ = [
     "ChromaKeyEffect",
     # Annotations
     "Color",
+    "CompositeTransformConfig",
     # Effects
     "Effect",
     "FillStyle",
@@ -1,6 +1,42 @@
 # this_file: src/camtasio/cli/__init__.py
 """Camtasio command-line interface."""
 
-from .app import CamtasioCLI, main
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import CamtasioCLI
+
+
+def main() -> None:
+    """Console script entry point.
+
+    Forwards the command to a running ``camtasio daemon`` and otherwise runs
+    it in this process. Only the daemon client is imported before that
+    decision, so forwarded commands skip loading the CLI.
+    """
+    from .daemon import forward
+
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from .app import main as run_locally
+
+    run_locally()
+
+
+def __getattr__(name: str) -> Any:
+    """Import the CLI and its submodules on first access."""
+    if name == "CamtasioCLI":
+        value = import_module(".app", __name__).CamtasioCLI
+    elif name in ("app", "daemon"):
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = ["CamtasioCLI", "main"]
@@ -1,24 +1,74 @@
 # this_file: src/camtasio/cli/app.py
 """Unified Camtasio CLI application."""
 
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import fire
 from loguru import logger
-from rich.console import Console
 
-from ..scaler import TscprojScaler
-from ..serialization import ProjectSaver, detect_version, load_json_file
-from ..transforms.engine import PropertyTransformer, TransformConfig, TransformType
+from ..operations.project_summary import ProjectSummary, clear_summaries, load_summary
+from ..serialization.cache import ParseCache, cache_enabled, load_json_cached
+from ..serialization.json_handler import load_json_file
+from ..serialization.version import detect_version
+from ..utils.fs import check_files
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .daemon import ProjectCache
+
+
+class _LazyConsole:
+    """Rich console created on first use, so importing the CLI doesn't load rich."""
+
+    def __init__(self) -> None:
+        self._console: Console | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+    @contextmanager
+    def redirected(self, target: "Console") -> Iterator[None]:
+        """Send all output to another console while the context is active."""
+        previous, self._console = self._console, target
+        try:
+            yield
+        finally:
+            self._console = previous
+
+
+console = _LazyConsole()
+
+# Operations supported by ``camtasio batch``
+BATCH_OPERATIONS = ("info", "validate", "xyscale", "timescale")
 
 
 class CamtasioCLI:
     """Camtasio command-line interface."""
 
+    # Set by the daemon to reuse loaded projects across commands
+    _project_cache: "ProjectCache | None" = None
+
+    def _load_summary(self, path: Path) -> ProjectSummary:
+        if self._project_cache is None:
+            return load_summary(path)
+        return self._project_cache.get(path, "summary", load_summary)
+
+    def _load_json(self, path: Path) -> dict[str, Any]:
+        if self._project_cache is None:
+            return load_json_cached(path)
+        return self._project_cache.get(path, "json", load_json_cached)
+
     def info(self, project_path: str, detailed: bool = False) -> None:
         """Display project information and statistics.
 
@@ -29,44 +79,32 @@ class CamtasioCLI:
         path = Path(project_path)
 
         try:
-            # Load raw JSON data for CLI info display
-            project_data = load_json_file(path)
-            version = detect_version(project_data)
-
-            # Extract basic info
-            canvas = project_data.get("timeline", {}).get("sceneTrack", {}).get("timeline", {})
-            width = canvas.get("width", "Unknown")
-            height = canvas.get("height", "Unknown")
-            framerate = canvas.get("framerate", "Unknown")
+            # Render from the precomputed project summary
+            summary = self._load_summary(path)
+            version = detect_version({"version": summary.version})
 
             console.print("[bold blue]═══ Project Information ═══[/]")
             console.print(f"[bold]Project:[/] {path}")
             console.print(f"[bold]Version:[/] {version}")
-            console.print(f"[bold]Canvas:[/] {width}x{height} @ {framerate}fps")
+            console.print(
+                f"[bold]Canvas:[/] {summary.width}x{summary.height} @ {summary.framerate}fps"
+            )
 
             # Analyze media bin
-            source_bin = project_data.get("sourceBin", [])
-            media_count = len(source_bin)
-
-            # Count media types
-            media_types: dict[str, int] = {}
+            media_count = summary.media_count
+            media_types = summary.media_types
             missing_media = []
             total_file_size = 0
 
-            for item in source_bin:
-                media_type = item.get("_type", "Unknown")
-                media_types[media_type] = media_types.get(media_type, 0) + 1
-
-                # Check if media file exists
-                if "src" in item:
-                    media_path = Path(item["src"])
-                    if not media_path.exists():
-                        missing_media.append(str(media_path))
-                    elif media_path.is_file():
-                        try:
-                            total_file_size += media_path.stat().st_size
-                        except OSError:
-                            pass
+            # Check all media files at once
+            statuses = check_files(item.src for item in summary.media if item.src is not None)
+            for item in summary.media:
+                if item.src is not None:
+                    status = statuses[str(item.src)]
+                    if not status.exists:
+                        missing_media.append(str(Path(item.src)))
+                    elif status.is_file and status.size is not None:
+                        total_file_size += status.size
 
             console.print("\n[bold blue]═══ Media Analysis ═══[/]")
             console.print(f"[bold]Total Media Items:[/] {media_count}")
@@ -90,36 +128,18 @@ class CamtasioCLI:
                 console.print("[green]✓ All media files found[/]")
 
             # Analyze timeline
-            tracks = project_data.get("timeline", {}).get("sceneTrack", {}).get("scenes", [])
-            if tracks:
-                scene = tracks[0]
-                timeline_tracks = scene.get("csml", {}).get("tracks", [])
-                track_count = len(timeline_tracks)
-
+            track_count = len(summary.tracks)
+            if summary.has_scenes:
                 console.print("\n[bold blue]═══ Timeline Analysis ═══[/]")
                 console.print(f"[bold]Timeline Tracks:[/] {track_count}")
 
-                if detailed and timeline_tracks:
+                if detailed and summary.tracks:
                     # Analyze track complexity
-                    track_types: dict[str, int] = {}
-                    total_clips = 0
-                    total_effects = 0
-
-                    for track in timeline_tracks:
-                        track_type = track.get("trackType", "Unknown")
-                        track_types[track_type] = track_types.get(track_type, 0) + 1
-
-                        # Count track media/clips
-                        track_media = track.get("medias", [])
-                        total_clips += len(track_media)
-
-                        # Count effects
-                        for media in track_media:
-                            effects = media.get("effects", [])
-                            total_effects += len(effects)
+                    total_clips = summary.total_clips
+                    total_effects = summary.total_effects
 
                     console.print("[bold]Track Types:[/]")
-                    for track_type, count in sorted(track_types.items()):
+                    for track_type, count in sorted(summary.track_types.items()):
                         console.print(f"  • {track_type}: {count}")
 
                     console.print(f"[bold]Total Clips:[/] {total_clips}")
@@ -175,7 +195,7 @@ class CamtasioCLI:
 
         try:
             # Load raw JSON data for validation
-            project_data = load_json_file(path)
+            project_data = self._load_json(path)
             version = detect_version(project_data)
 
             console.print("[green]✓[/] Project loads successfully")
@@ -185,8 +205,9 @@ class CamtasioCLI:
             source_bin = project_data.get("sourceBin", [])
             missing_media = []
 
+            statuses = check_files(item["src"] for item in source_bin if "src" in item)
             for item in source_bin:
-                if "src" in item and not Path(item["src"]).exists():
+                if "src" in item and not statuses[str(item["src"])].exists:
                     missing_media.append(item["src"])
 
             if missing_media:
@@ -234,7 +255,10 @@ class CamtasioCLI:
                     logger.debug(f"Created backup at {backup_path}")
 
                 # Scale the project using TscprojScaler class
-                scaler = TscprojScaler(scale, verbose=True)
+                from ..scaler import TscprojScaler
+                from ..serialization import ProjectSaver
+
+                scaler = TscprojScaler(scale, verbose=True, in_place=True)
                 scaled_data = scaler._scale_object(project_data)
 
                 # Save result
@@ -257,6 +281,7 @@ class CamtasioCLI:
         output_path: str | None = None,
         backup: bool = True,
         preserve_audio: bool = True,
+        jobs: int = 1,
     ) -> None:
         """Scale project timeline duration by the given factor.
 
@@ -266,6 +291,8 @@ class CamtasioCLI:
             output_path: Path for output file (default: overwrite input)
             backup: Create backup before modifying (default: True)
             preserve_audio: Preserve audio duration when scaling (default: True)
+            jobs: Number of workers the tracks are split across (1 = sequential,
+                0 = one per CPU core)
         """
         input_file = Path(input_path)
 
@@ -288,11 +315,16 @@ class CamtasioCLI:
                     logger.debug(f"Created backup at {backup_path}")
 
                 # Create temporal transform configuration
+                from ..serialization import ProjectSaver
+                from ..transforms.engine import PropertyTransformer, TransformConfig, TransformType
+
                 config = TransformConfig(
                     transform_type=TransformType.TEMPORAL,
                     factor=scale,
                     preserve_audio_duration=preserve_audio,
                     verbose=True,
+                    in_place=True,
+                    workers=jobs,
                 )
 
                 # Apply temporal transformation
@@ -314,17 +346,28 @@ class CamtasioCLI:
             console.print(f"[red]Error:[/] Timeline scaling failed: {e}")
             logger.error(f"Failed to scale timeline {input_file}: {e}")
 
-    def batch(self, pattern: str, operation: str, *args: Any, **kwargs: Any) -> None:
+    def batch(
+        self,
+        pattern: str,
+        operation: str,
+        *args: Any,
+        jobs: int = 1,
+        yes: bool = False,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> None:
         """Process multiple files with batch operations.
 
         Args:
             pattern: Glob pattern to match files (e.g., "*.tscproj", "projects/**/*.tscproj")
             operation: Operation to perform (xyscale, timescale, info, validate)
             *args: Arguments to pass to the operation
+            jobs: Number of worker processes (1 = sequential, 0 = one per CPU core)
+            yes: Skip the confirmation prompt for large batches
+            ordered: Report results in input order instead of completion order
             **kwargs: Keyword arguments to pass to the operation
         """
         import glob
-        from pathlib import Path
 
         # Find matching files
         matching_files = []
@@ -337,62 +380,80 @@ class CamtasioCLI:
             console.print(f"[yellow]No .tscproj files found matching pattern: {pattern}[/]")
             return
 
+        if operation not in BATCH_OPERATIONS:
+            console.print(f"[red]Error: Unknown operation '{operation}'[/]")
+            return
+
+        if operation in ("xyscale", "timescale") and not args:
+            console.print(f"[red]Error: {operation} requires scale factor[/]")
+            return
+
+        workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+
         console.print("[bold blue]═══ Batch Processing ═══[/]")
         console.print(f"[bold]Operation:[/] {operation}")
         console.print(f"[bold]Pattern:[/] {pattern}")
         console.print(f"[bold]Found Files:[/] {len(matching_files)}")
+        if workers > 1:
+            console.print(f"[bold]Workers:[/] {workers}")
 
-        if len(matching_files) > 10:
+        if len(matching_files) > 10 and not yes:
             confirm = input(f"Process {len(matching_files)} files? [y/N]: ").lower().strip()
             if confirm != "y":
                 console.print("[yellow]Batch operation cancelled[/]")
                 return
 
-        success_count = 0
-        error_count = 0
-
-        for i, file_path in enumerate(matching_files, 1):
-            console.print(f"\n[bold]Processing {i}/{len(matching_files)}:[/] {file_path}")
-
-            try:
-                # Call the appropriate method
-                if operation == "info":
-                    self.info(str(file_path), *args, **kwargs)
-                elif operation == "validate":
-                    self.validate(str(file_path))
-                elif operation == "xyscale":
-                    if not args:
-                        console.print("[red]Error: xyscale requires scale factor[/]")
-                        error_count += 1
-                        continue
-                    scale = float(args[0])
-                    output_path = str(file_path.with_suffix(".scaled.tscproj"))
-                    self.xyscale(str(file_path), scale, output_path, **kwargs)
-                elif operation == "timescale":
-                    if not args:
-                        console.print("[red]Error: timescale requires scale factor[/]")
-                        error_count += 1
-                        continue
-                    scale = float(args[0])
-                    output_path = str(file_path.with_suffix(".timescaled.tscproj"))
-                    self.timescale(str(file_path), scale, output_path, **kwargs)
-                else:
-                    console.print(f"[red]Error: Unknown operation '{operation}'[/]")
-                    error_count += 1
-                    continue
-
-                success_count += 1
+        started = time.perf_counter()
+        results: list[BatchResult] = []
+        total = len(matching_files)
+
+        if workers == 1:
+            for i, file_path in enumerate(matching_files, 1):
+                console.print(f"\n[bold]Processing {i}/{total}:[/] {file_path}")
+                result = _run_batch_task(operation, str(file_path), args, kwargs, capture=False)
+                if not result.ok:
+                    console.print(f"[red]Error processing {file_path}: {result.error}[/]")
+                results.append(result)
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_run_batch_task, operation, str(file_path), args, kwargs, True)
+                    for file_path in matching_files
+                ]
+                completed = futures if ordered else as_completed(futures)
+                for i, future in enumerate(completed, 1):
+                    result = future.result()
+                    status = "[green]✓[/]" if result.ok else "[red]✗[/]"
+                    console.print(
+                        f"\n[bold]{i}/{total}[/] {status} {result.path} ({result.elapsed:.2f}s)"
+                    )
+                    if result.output:
+                        console.file.write(result.output)
+                    if not result.ok:
+                        console.print(f"[red]Error processing {result.path}: {result.error}[/]")
+                    results.append(result)
 
-            except Exception as e:
-                console.print(f"[red]Error processing {file_path}: {e}[/]")
-                logger.error(f"Batch processing error for {file_path}: {e}")
-                error_count += 1
+        elapsed = time.perf_counter() - started
+        success_count = sum(1 for result in results if result.ok)
+        error_count = len(results) - success_count
 
         # Summary
         console.print("\n[bold blue]═══ Batch Results ═══[/]")
         console.print(f"[green]✓ Successful:[/] {success_count}")
         console.print(f"[red]✗ Errors:[/] {error_count}")
-        console.print(f"[bold]Total:[/] {len(matching_files)}")
+        console.print(f"[bold]Total:[/] {total}")
+        console.print(
+            f"[bold]Elapsed:[/] {elapsed:.2f}s ({total / elapsed if elapsed > 0 else 0:.1f} files/s)"
+        )
+
+        if error_count:
+            console.print("[bold]Failed Files:[/]")
+            for result in [r for r in results if not r.ok][:10]:
+                console.print(f"  • {result.path}: {result.error}")
+            if error_count > 10:
+                console.print(f"  ... and {error_count - 10} more")
 
         if success_count > 0:
             console.print("[green]Batch operation completed successfully![/]")
@@ -409,45 +470,38 @@ class CamtasioCLI:
         path = Path(project_path)
 
         try:
-            project_data = load_json_file(path)
-
-            source_bin = project_data.get("sourceBin", [])
+            summary = self._load_summary(path)
 
             console.print("[bold blue]═══ Media Bin Contents ═══[/]")
             console.print(f"[bold]Project:[/] {path}")
-            console.print(f"[bold]Media Items:[/] {len(source_bin)}")
+            console.print(f"[bold]Media Items:[/] {summary.media_count}")
 
-            if not source_bin:
+            if not summary.media:
                 console.print("[yellow]No media items found[/]")
                 return
 
-            for i, item in enumerate(source_bin, 1):
-                name = item.get("name", "Unnamed")
-                media_type = item.get("_type", "Unknown")
-                src = item.get("src", "No source")
-
-                # Check if file exists
-                if "src" in item:
-                    media_path = Path(item["src"])
-                    exists = "✓" if media_path.exists() else "✗"
-                    status_color = "green" if media_path.exists() else "red"
+            # Check all media files at once
+            statuses = check_files(item.src for item in summary.media if item.src is not None)
+            for i, item in enumerate(summary.media, 1):
+                status = statuses[str(item.src)] if item.src is not None else None
+                if status is not None:
+                    exists = "✓" if status.exists else "✗"
+                    status_color = "green" if status.exists else "red"
                 else:
                     exists = "?"
                     status_color = "yellow"
 
-                console.print(f"[bold]{i:2d}.[/] [{status_color}]{exists}[/] {name}")
+                console.print(f"[bold]{i:2d}.[/] [{status_color}]{exists}[/] {item.name}")
 
                 if detailed:
-                    console.print(f"     Type: {media_type}")
-                    console.print(f"     Source: {src}")
-
-                    if "src" in item and Path(item["src"]).exists():
-                        try:
-                            file_size = Path(item["src"]).stat().st_size
-                            size_mb = file_size / (1024 * 1024)
-                            console.print(f"     Size: {size_mb:.1f} MB")
-                        except OSError:
-                            pass
+                    console.print(f"     Type: {item.type}")
+                    console.print(
+                        f"     Source: {item.src if item.src is not None else 'No source'}"
+                    )
+
+                    if status is not None and status.size is not None:
+                        size_mb = status.size / (1024 * 1024)
+                        console.print(f"     Size: {size_mb:.1f} MB")
                     console.print()
 
         except Exception as e:
@@ -462,10 +516,14 @@ class CamtasioCLI:
             unused_only: Only remove unused media items (default: True)
             backup: Create backup before modifying (default: True)
         """
+        from ..models import find_used_source_ids
+        from ..serialization import ProjectSaver, TrackedDocument
+
         path = Path(project_path)
 
         try:
-            project_data = load_json_file(path)
+            document = TrackedDocument.load(path)
+            project_data = document.data
 
             source_bin = project_data.get("sourceBin", [])
 
@@ -473,16 +531,8 @@ class CamtasioCLI:
                 console.print("[yellow]No media items to remove[/]")
                 return
 
-            # Find used media IDs in timeline
-            used_media_ids = set()
-            tracks = project_data.get("timeline", {}).get("sceneTrack", {}).get("scenes", [])
-
-            if tracks:
-                timeline_tracks = tracks[0].get("csml", {}).get("tracks", [])
-                for track in timeline_tracks:
-                    for media in track.get("medias", []):
-                        if "src" in media:
-                            used_media_ids.add(media["src"])
+            # Find used media IDs in timeline, including media nested in groups
+            used_media_ids = find_used_source_ids(project_data)
 
             # Find unused media
             unused_media = []
@@ -520,13 +570,14 @@ class CamtasioCLI:
                 shutil.copy2(path, backup_path)
                 logger.debug(f"Created backup at {backup_path}")
 
-            # Remove unused media (in reverse order to maintain indices)
+            # Remove unused media (in reverse order to maintain indices); the
+            # document notices removed entries and reuses the remaining ones
             for idx, _ in reversed(unused_media):
                 del project_data["sourceBin"][idx]
 
-            # Save modified project
+            # Save modified project, reusing the bytes of untouched entries
             saver = ProjectSaver()
-            saver.save_dict(project_data, path)
+            saver.save_document(document, path)
 
             console.print(f"[green]✓ Removed {len(unused_media)} unused media items[/]")
 
@@ -545,12 +596,14 @@ class CamtasioCLI:
             new_path: New media file path
             backup: Create backup before modifying (default: True)
         """
+        from ..serialization import ProjectSaver, TrackedDocument
+
         path = Path(project_path)
         old_path = str(old_path)
         new_path = str(new_path)
 
         try:
-            project_data = load_json_file(path)
+            document = TrackedDocument.load(path)
 
             # Create backup if requested
             if backup:
@@ -562,29 +615,30 @@ class CamtasioCLI:
 
             replacements = 0
 
-            def replace_in_dict(obj: Any) -> None:
+            def replace_in_dict(obj: Any, pointer: list[str | int]) -> None:
                 nonlocal replacements
                 if isinstance(obj, dict):
                     for key, value in obj.items():
                         if key == "src" and value == old_path:
                             obj[key] = new_path
+                            document.mark_dirty([*pointer, key])
                             replacements += 1
                         elif isinstance(value, dict | list):
-                            replace_in_dict(value)
+                            replace_in_dict(value, [*pointer, key])
                 elif isinstance(obj, list):
-                    for item in obj:
+                    for i, item in enumerate(obj):
                         if isinstance(item, dict | list):
-                            replace_in_dict(item)
+                            replace_in_dict(item, [*pointer, i])
 
-            replace_in_dict(project_data)
+            replace_in_dict(document.data, [])
 
             if replacements == 0:
                 console.print(f"[yellow]No instances of '{old_path}' found[/]")
                 return
 
-            # Save modified project
+            # Save modified project, re-encoding only the changed entries
             saver = ProjectSaver()
-            saver.save_dict(project_data, path)
+            saver.save_document(document, path)
 
             console.print(
                 f"[green]✓ Replaced {replacements} instances of '{old_path}' with '{new_path}'[/]"
@@ -604,47 +658,34 @@ class CamtasioCLI:
         path = Path(project_path)
 
         try:
-            project_data = load_json_file(path)
-
-            tracks = project_data.get("timeline", {}).get("sceneTrack", {}).get("scenes", [])
+            summary = self._load_summary(path)
 
             console.print("[bold blue]═══ Timeline Tracks ═══[/]")
             console.print(f"[bold]Project:[/] {path}")
 
-            if not tracks:
+            if not summary.has_scenes:
                 console.print("[yellow]No timeline tracks found[/]")
                 return
 
-            timeline_tracks = tracks[0].get("csml", {}).get("tracks", [])
-            console.print(f"[bold]Total Tracks:[/] {len(timeline_tracks)}")
-
-            for i, track in enumerate(timeline_tracks, 1):
-                track_type = track.get("trackType", "Unknown")
-                track_media = track.get("medias", [])
-                media_count = len(track_media)
-
-                # Calculate track duration
-                track_duration = 0
-                for media in track_media:
-                    duration = media.get("duration", 0)
-                    start = media.get("start", 0)
-                    track_duration = max(track_duration, start + duration)
+            console.print(f"[bold]Total Tracks:[/] {len(summary.tracks)}")
 
-                console.print(f"[bold]{i:2d}.[/] {track_type} - {media_count} clips")
+            for i, track in enumerate(summary.tracks, 1):
+                console.print(f"[bold]{i:2d}.[/] {track.track_type} - {track.media_count} clips")
 
                 if detailed:
-                    console.print(f"     Duration: {track_duration / 1000:.2f}s")
-                    if track_media:
+                    console.print(f"     Duration: {track.duration / 1000:.2f}s")
+                    if track.clips:
                         console.print("     Clips:")
-                        for j, media in enumerate(track_media[:5], 1):  # Show first 5 clips
-                            media_name = media.get("name", "Unnamed")
-                            start = media.get("start", 0) / 1000
-                            duration = media.get("duration", 0) / 1000
+                        for j, clip in enumerate(track.clips, 1):  # First clips only
+                            start = clip.start / 1000
+                            duration = clip.duration / 1000
                             console.print(
-                                f"       {j}. {media_name} ({start:.2f}s - {start + duration:.2f}s)"
+                                f"       {j}. {clip.name} ({start:.2f}s - {start + duration:.2f}s)"
+                            )
+                        if track.media_count > len(track.clips):
+                            console.print(
+                                f"       ... and {track.media_count - len(track.clips)} more clips"
                             )
-                        if len(track_media) > 5:
-                            console.print(f"       ... and {len(track_media) - 5} more clips")
                     console.print()
 
         except Exception as e:
@@ -660,26 +701,19 @@ class CamtasioCLI:
         path = Path(project_path)
 
         try:
-            project_data = load_json_file(path)
-
-            # Look for markers in timeline
-            timeline = project_data.get("timeline", {})
-            markers = timeline.get("markers", [])
+            summary = self._load_summary(path)
 
             console.print("[bold blue]═══ Timeline Markers ═══[/]")
             console.print(f"[bold]Project:[/] {path}")
-            console.print(f"[bold]Total Markers:[/] {len(markers)}")
+            console.print(f"[bold]Total Markers:[/] {len(summary.markers)}")
 
-            if not markers:
+            if not summary.markers:
                 console.print("[yellow]No markers found[/]")
                 return
 
-            for i, marker in enumerate(markers, 1):
-                name = marker.get("name", "Unnamed")
-                time = marker.get("time", 0) / 1000  # Convert to seconds
-                marker_type = marker.get("type", "Unknown")
-
-                console.print(f"[bold]{i:2d}.[/] {name} at {time:.2f}s ({marker_type})")
+            for i, marker in enumerate(summary.markers, 1):
+                time = marker.time / 1000  # Convert to seconds
+                console.print(f"[bold]{i:2d}.[/] {marker.name} at {time:.2f}s ({marker.type})")
 
         except Exception as e:
             console.print(f"[red]Error:[/] Failed to list markers: {e}")
@@ -694,40 +728,31 @@ class CamtasioCLI:
         path = Path(project_path)
 
         try:
-            project_data = load_json_file(path)
+            summary = self._load_summary(path)
 
-            version = detect_version(project_data)
+            version = detect_version({"version": summary.version})
 
             console.print("[bold blue]═══ Project Analysis Report ═══[/]")
             console.print(f"[bold]Project:[/] {path}")
             console.print(f"[bold]Generated:[/] {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-            # Basic project info
-            canvas = project_data.get("timeline", {}).get("sceneTrack", {}).get("timeline", {})
-            width = canvas.get("width", "Unknown")
-            height = canvas.get("height", "Unknown")
-            framerate = canvas.get("framerate", "Unknown")
-
             console.print("\n[bold green]📊 Project Overview[/]")
             console.print(f"Version: {version}")
-            console.print(f"Canvas: {width}x{height} @ {framerate}fps")
+            console.print(f"Canvas: {summary.width}x{summary.height} @ {summary.framerate}fps")
 
             # Media analysis
-            source_bin = project_data.get("sourceBin", [])
-            media_count = len(source_bin)
+            media_count = summary.media_count
             missing_count = 0
             total_size = 0
 
-            for item in source_bin:
-                if "src" in item:
-                    media_path = Path(item["src"])
-                    if not media_path.exists():
+            statuses = check_files(item.src for item in summary.media if item.src is not None)
+            for item in summary.media:
+                if item.src is not None:
+                    status = statuses[str(item.src)]
+                    if not status.exists:
                         missing_count += 1
-                    elif media_path.is_file():
-                        try:
-                            total_size += media_path.stat().st_size
-                        except OSError:
-                            pass
+                    elif status.is_file and status.size is not None:
+                        total_size += status.size
 
             console.print("\n[bold green]📁 Media Summary[/]")
             console.print(f"Total Media Items: {media_count}")
@@ -735,17 +760,16 @@ class CamtasioCLI:
             console.print(f"Total Size: {total_size / (1024**2):.1f} MB")
 
             # Timeline analysis
-            tracks = project_data.get("timeline", {}).get("sceneTrack", {}).get("scenes", [])
-            if tracks:
-                timeline_tracks = tracks[0].get("csml", {}).get("tracks", [])
-                total_clips = sum(len(track.get("medias", [])) for track in timeline_tracks)
+            if summary.has_scenes:
+                track_count = len(summary.tracks)
+                total_clips = summary.total_clips
 
                 console.print("\n[bold green]🎬 Timeline Summary[/]")
-                console.print(f"Tracks: {len(timeline_tracks)}")
+                console.print(f"Tracks: {track_count}")
                 console.print(f"Total Clips: {total_clips}")
 
                 # Calculate project complexity
-                complexity_score = len(timeline_tracks) * 2 + total_clips * 1 + media_count * 0.5
+                complexity_score = track_count * 2 + total_clips * 1 + media_count * 0.5
 
                 if complexity_score < 30:
                     complexity = "[green]Simple[/]"
@@ -770,6 +794,126 @@ class CamtasioCLI:
             console.print(f"[red]Error:[/] Analysis failed: {e}")
             logger.error(f"Failed to analyze {path}: {e}")
 
+    def summarize(self, project_path: str, json_output: bool = False) -> None:
+        """Show the precomputed project summary used by the inspection commands.
+
+        The summary is stored in the ``summaries`` directory of the cache
+        directory and recomputed only when the project changes.
+
+        Args:
+            project_path: Path to .tscproj file
+            json_output: Print the summary as JSON
+        """
+        path = Path(project_path)
+
+        try:
+            summary = self._load_summary(path)
+
+            if json_output:
+                console.print_json(data=summary.to_dict())
+                return
+
+            console.print("[bold blue]═══ Project Summary ═══[/]")
+            console.print(f"[bold]Project:[/] {path}")
+            console.print(f"[bold]Version:[/] {summary.version}")
+            console.print(
+                f"[bold]Canvas:[/] {summary.width}x{summary.height} @ {summary.framerate}fps"
+            )
+            console.print(f"[bold]Media Items:[/] {summary.media_count}")
+            console.print(f"[bold]Tracks:[/] {len(summary.tracks)}")
+            console.print(f"[bold]Clips:[/] {summary.total_clips}")
+            console.print(f"[bold]Effects:[/] {summary.total_effects}")
+            console.print(f"[bold]Markers:[/] {len(summary.markers)}")
+            duration = max((track.duration for track in summary.tracks), default=0)
+            console.print(f"[bold]Duration:[/] {duration / 1000:.2f}s")
+
+        except Exception as e:
+            console.print(f"[red]Error:[/] Failed to summarize project: {e}")
+            logger.error(f"Failed to summarize {path}: {e}")
+
+    def cache(self, clear: bool = False) -> None:
+        """Show or clear the parse cache used by inspection commands.
+
+        Args:
+            clear: Remove all cached entries
+        """
+        parse_cache = ParseCache()
+
+        if clear:
+            removed = parse_cache.clear()
+            summaries = clear_summaries()
+            console.print(
+                f"[green]✓ Removed {removed} cached projects and {summaries} summaries[/]"
+            )
+            return
+
+        console.print("[bold blue]═══ Parse Cache ═══[/]")
+        console.print(f"[bold]Directory:[/] {parse_cache.directory}")
+        console.print(f"[bold]Enabled:[/] {'yes' if cache_enabled() else 'no'}")
+        console.print(f"[bold]Entries:[/] {len(parse_cache)}")
+        console.print(
+            f"[bold]Size:[/] {parse_cache.size() / (1024 * 1024):.1f} MB "
+            f"of {parse_cache.max_bytes / (1024 * 1024):.0f} MB"
+        )
+
+    def daemon(
+        self,
+        action: str = "status",
+        socket_path: str | None = None,
+        max_projects: int | None = None,
+    ) -> None:
+        """Run or control the server that answers forwarded commands.
+
+        While the daemon runs, other camtasio commands are sent to it and
+        reuse its loaded projects instead of starting from scratch.
+
+        Args:
+            action: "start" to serve in the foreground, "stop" or "status"
+            socket_path: Socket path (default: $CAMTASIO_DAEMON_SOCKET or the XDG runtime dir)
+            max_projects: Number of loaded projects kept in memory (default: 32)
+        """
+        from .daemon import DEFAULT_MAX_PROJECTS, DaemonError, DaemonServer, call
+
+        if action == "start":
+            server = DaemonServer(socket_path, max_projects or DEFAULT_MAX_PROJECTS)
+            try:
+                server.serve(
+                    ready=lambda: console.print(
+                        f"[green]✓[/] Daemon listening on {server.socket_path}"
+                    )
+                )
+            except KeyboardInterrupt:
+                pass
+            except (OSError, RuntimeError) as e:
+                console.print(f"[red]Error:[/] Could not start daemon: {e}")
+                logger.error(f"Could not start daemon: {e}")
+            return
+
+        if action not in ("stop", "status"):
+            console.print(f"[red]Error: Unknown daemon action '{action}'[/]")
+            return
+
+        try:
+            if action == "stop":
+                call("shutdown", socket_path=socket_path)
+                console.print("[green]✓[/] Daemon stopped")
+                return
+            stats = call("stats", socket_path=socket_path)
+        except ConnectionError:
+            console.print("[yellow]No daemon running[/]")
+            return
+        except DaemonError as e:
+            console.print(f"[red]Error:[/] {e}")
+            logger.error(f"Daemon request failed: {e}")
+            return
+
+        console.print("[bold blue]═══ Daemon ═══[/]")
+        console.print(f"[bold]PID:[/] {stats['pid']}")
+        console.print(f"[bold]Uptime:[/] {stats['uptime']:.0f}s")
+        console.print(f"[bold]Requests:[/] {stats['requests']}")
+        console.print(f"[bold]Projects:[/] {stats['projects']} of {stats['max_projects']}")
+        console.print(f"[bold]Cache:[/] {stats['cache_hits']} hits, {stats['cache_misses']} misses")
+
     def version(self) -> None:
         """Show version information."""
         from .. import __version__
@@ -777,8 +921,77 @@ class CamtasioCLI:
         console.print(f"camtasio version {__version__}")
 
 
+@dataclass
+class BatchResult:
+    """Outcome of one file processed by ``camtasio batch``."""
+
+    path: str
+    ok: bool
+    elapsed: float
+    output: str = ""
+    error: str = ""
+
+
+def _run_batch_task(
+    operation: str,
+    file_path: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    capture: bool,
+) -> BatchResult:
+    """Run one batch operation on one file and record the outcome.
+
+    Commands report failures through ``logger.error`` rather than raising, so
+    errors logged while the command runs mark the result as failed. Runs in a
+    worker process when ``batch`` is called with ``jobs > 1``.
+    """
+    errors: list[str] = []
+    sink_id = logger.add(
+        lambda message: errors.append(message.record["message"]), level="ERROR", format="{message}"
+    )
+    started = time.perf_counter()
+    output = ""
+    cli = CamtasioCLI()
+
+    def dispatch() -> None:
+        if operation == "info":
+            cli.info(file_path, *args, **kwargs)
+        elif operation == "validate":
+            cli.validate(file_path)
+        elif operation == "xyscale":
+            scaled_path = str(Path(file_path).with_suffix(".scaled.tscproj"))
+            cli.xyscale(file_path, float(args[0]), scaled_path, **kwargs)
+        elif operation == "timescale":
+            scaled_path = str(Path(file_path).with_suffix(".timescaled.tscproj"))
+            cli.timescale(file_path, float(args[0]), scaled_path, **kwargs)
+        else:
+            raise ValueError(f"Unknown operation '{operation}'")
+
+    try:
+        if capture:
+            with console.capture() as captured:
+                dispatch()
+            output = captured.get()
+        else:
+            dispatch()
+    except Exception as e:
+        logger.error(f"Batch processing error for {file_path}: {e}")
+    finally:
+        logger.remove(sink_id)
+
+    return BatchResult(
+        path=file_path,
+        ok=not errors,
+        elapsed=time.perf_counter() - started,
+        output=output,
+        error="; ".join(errors),
+    )
+
+
 def main() -> None:
     """Main CLI entry point."""
+    import fire
+
     fire.Fire(CamtasioCLI)
 
 
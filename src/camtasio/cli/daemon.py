@@ -0,0 +1,490 @@
+# this_file: src/camtasio/cli/daemon.py
+"""Long-running server answering forwarded CLI commands over a Unix socket.
+
+Every ``camtasio`` invocation starts a fresh interpreter, imports the CLI and
+loads the project again. ``camtasio daemon start`` runs a server that keeps
+the interpreter warm and the projects it has loaded in an LRU cache keyed by
+path, modification time and size. While it runs, the ``camtasio`` entry
+point forwards commands to it and prints the output it returns; if no server
+answers, the command runs locally as before.
+
+The protocol is JSON-RPC 2.0 with one newline-terminated request and
+response per connection. Methods:
+
+- ``run``: run a CLI command; params ``argv``, ``cwd`` and optionally
+  ``color`` and ``width`` of the client terminal and ``env``, the client's
+  values of ``FORWARDED_ENV``; returns ``stdout``, ``stderr`` and
+  ``exit_code``
+- ``ping``: returns the server's process id and package version
+- ``stats``: returns request and cache counters
+- ``shutdown``: stops the server after replying
+
+Requests are served one at a time, so commands never run concurrently; a
+client that does not finish sending its request within ``REQUEST_TIMEOUT``
+seconds gets an invalid-request error. Requests are limited to
+``MAX_REQUEST_BYTES``; responses are not limited.
+Commands get an empty stdin: the daemon cannot relay prompts to the client,
+so commands that ask for confirmation are not forwarded.
+
+Environment variables:
+    CAMTASIO_DAEMON: Set to ``0``, ``false``, ``no`` or ``off`` to never forward
+    CAMTASIO_DAEMON_SOCKET: Socket path (default: ``$XDG_RUNTIME_DIR/camtasio.sock``,
+        else ``$XDG_CACHE_HOME/camtasio/daemon.sock``)
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+# Only the standard library is imported at module level: clients load this
+# module on every invocation, before deciding whether to run locally.
+
+DAEMON_ENV = "CAMTASIO_DAEMON"
+SOCKET_ENV = "CAMTASIO_DAEMON_SOCKET"
+
+DEFAULT_MAX_PROJECTS = 32
+
+# Commands the entry point forwards. batch and media_rm prompt for
+# confirmation on the client's terminal, batch also starts worker processes,
+# and daemon controls the server itself, so these run locally.
+FORWARDED_COMMANDS = frozenset(
+    {
+        "analyze",
+        "cache",
+        "info",
+        "marker_ls",
+        "media_ls",
+        "media_replace",
+        "summarize",
+        "timescale",
+        "track_ls",
+        "validate",
+        "version",
+        "xyscale",
+    }
+)
+
+# Client environment variables a forwarded command runs with; those unset in
+# the client are unset for the command too, so it behaves like a local run
+FORWARDED_ENV = (
+    "CAMTASIO_CACHE",
+    "CAMTASIO_CACHE_DIR",
+    "CAMTASIO_CACHE_MAX_MB",
+    "NO_COLOR",
+    "XDG_CACHE_HOME",
+)
+
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# Seconds the server waits on a connection for the rest of a request
+REQUEST_TIMEOUT = 10.0
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+T = TypeVar("T")
+
+
+class DaemonError(Exception):
+    """Error response from the daemon, or failure to talk to it."""
+
+    def __init__(self, message: str, code: int = INTERNAL_ERROR):
+        """Initialize error.
+
+        Args:
+            message: Error message
+            code: JSON-RPC error code
+        """
+        super().__init__(message)
+        self.code = code
+
+
+def daemon_enabled() -> bool:
+    """Whether the environment allows forwarding commands to the daemon."""
+    return os.environ.get(DAEMON_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def default_socket_path() -> Path:
+    """Socket path from ``CAMTASIO_DAEMON_SOCKET`` or the XDG directories."""
+    if path := os.environ.get(SOCKET_ENV):
+        return Path(path).expanduser()
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "camtasio.sock"
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache) / "camtasio" / "daemon.sock"
+
+
+class ProjectCache:
+    """LRU cache of loaded projects keyed by path, modification time and size."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_PROJECTS):
+        """Initialize cache.
+
+        Args:
+            max_entries: Number of loaded objects kept
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]] = OrderedDict()
+
+    def get(self, file_path: str | Path, kind: str, load: Callable[[Path], T]) -> T:
+        """Return the cached object for a file, loading it if the file changed.
+
+        Args:
+            file_path: Path of the project file
+            kind: What ``load`` produces, e.g. "summary"; kinds are cached separately
+            load: Loads the object from the file
+
+        Returns:
+            The loaded object, shared between callers
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = (kind, str(path))
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cast(T, entry[1])
+
+        self.misses += 1
+        value = load(path)
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries."""
+        return len(self._entries)
+
+
+def _read_message(conn: socket.socket, max_bytes: int | None = None) -> bytes:
+    """Read one newline-terminated message.
+
+    Args:
+        conn: Connected socket
+        max_bytes: Size limit of the message, or None for no limit
+
+    Raises:
+        DaemonError: If the message exceeds ``max_bytes``
+    """
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        newline = chunk.find(b"\n")
+        if newline >= 0:
+            chunks.append(chunk[:newline])
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if max_bytes is not None and size > max_bytes:
+            raise DaemonError("Request too large", INVALID_REQUEST)
+    return b"".join(chunks)
+
+
+def call(
+    method: str,
+    params: dict[str, Any] | None = None,
+    socket_path: str | Path | None = None,
+    connect_timeout: float = 1.0,
+) -> Any:
+    """Send one JSON-RPC request to the daemon and return its result.
+
+    Args:
+        method: Method name
+        params: Method parameters
+        socket_path: Socket path (default: ``default_socket_path()``)
+        connect_timeout: Seconds to wait for the connection; the call itself
+            waits as long as the command runs
+
+    Returns:
+        The ``result`` member of the response
+
+    Raises:
+        ConnectionError: If no daemon accepts the connection
+        DaemonError: If the daemon replies with an error or an invalid response
+    """
+    path = Path(socket_path) if socket_path is not None else default_socket_path()
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(connect_timeout)
+        try:
+            conn.connect(os.fspath(path))
+        except (FileNotFoundError, ConnectionRefusedError, TimeoutError) as e:
+            raise ConnectionError(f"No daemon listening on {path}") from e
+        conn.settimeout(None)
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        raw = _read_message(conn)
+
+    try:
+        response = json.loads(raw)
+    except ValueError as e:
+        raise DaemonError(f"Invalid response from daemon: {e}") from e
+    if not isinstance(response, dict):
+        raise DaemonError("Invalid response from daemon")
+    if error := response.get("error"):
+        raise DaemonError(error.get("message", "Unknown error"), error.get("code", INTERNAL_ERROR))
+    return response.get("result")
+
+
+def forward(argv: list[str], socket_path: str | Path | None = None) -> int | None:
+    """Run a CLI command on the daemon if one is running.
+
+    Args:
+        argv: Command line arguments without the program name
+        socket_path: Socket path (default: ``default_socket_path()``)
+
+    Returns:
+        Exit status of the command, or None if it must run locally because
+        forwarding is disabled, the command isn't forwarded or no daemon is running
+    """
+    if not argv or argv[0] not in FORWARDED_COMMANDS or not daemon_enabled():
+        return None
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    params = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "color": sys.stdout.isatty() and "NO_COLOR" not in os.environ,
+        "width": os.get_terminal_size().columns if sys.stdout.isatty() else None,
+        "env": {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+    }
+    try:
+        result = call("run", params, socket_path)
+    except ConnectionError:
+        return None
+    except DaemonError as e:
+        sys.stderr.write(f"camtasio daemon: {e}\n")
+        return 1
+
+    sys.stdout.write(result.get("stdout", ""))
+    sys.stderr.write(result.get("stderr", ""))
+    sys.stdout.flush()
+    return int(result.get("exit_code", 0))
+
+
+class DaemonServer:
+    """Unix socket server running forwarded CLI commands."""
+
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        max_projects: int = DEFAULT_MAX_PROJECTS,
+        request_timeout: float = REQUEST_TIMEOUT,
+    ):
+        """Initialize server.
+
+        Args:
+            socket_path: Socket path (default: ``default_socket_path()``)
+            max_projects: Number of loaded projects kept in memory
+            request_timeout: Seconds a client may take to send its request
+                and to receive the response
+        """
+        self.socket_path = Path(socket_path) if socket_path is not None else default_socket_path()
+        self.request_timeout = request_timeout
+        self.cache = ProjectCache(max_projects)
+        self.requests = 0
+        self.started = time.time()
+        self._stopping = False
+        self._methods: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "ping": self._ping,
+            "run": self._run,
+            "shutdown": self._shutdown,
+            "stats": self._stats,
+        }
+
+    def serve(self, ready: Callable[[], None] | None = None) -> None:
+        """Accept requests until a ``shutdown`` request or interrupt.
+
+        Args:
+            ready: Called once the socket accepts connections
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        from loguru import logger
+
+        self._prepare_socket()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            old_umask = os.umask(0o177)  # Socket usable by the owner only
+            try:
+                server.bind(os.fspath(self.socket_path))
+            finally:
+                os.umask(old_umask)
+            try:
+                server.listen()
+                logger.info(f"camtasio daemon listening on {self.socket_path}")
+                if ready is not None:
+                    ready()
+                while not self._stopping:
+                    conn, _ = server.accept()
+                    # A stalled client must not block the callers queued behind it
+                    conn.settimeout(self.request_timeout)
+                    with conn:
+                        self._handle(conn)
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+                logger.info("camtasio daemon stopped")
+
+    def _prepare_socket(self) -> None:
+        """Create the socket directory and remove a stale socket file."""
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+        try:
+            call("ping", socket_path=self.socket_path)
+        except (ConnectionError, DaemonError):
+            self.socket_path.unlink(missing_ok=True)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+
+    def _handle(self, conn: socket.socket) -> None:
+        request_id = None
+        try:
+            try:
+                request = json.loads(_read_message(conn, MAX_REQUEST_BYTES))
+            except ValueError as e:
+                raise DaemonError(f"Parse error: {e}", PARSE_ERROR) from e
+            except TimeoutError as e:
+                raise DaemonError("Timed out reading the request", INVALID_REQUEST) from e
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise DaemonError("Invalid request", INVALID_REQUEST)
+            request_id = request.get("id")
+            method = self._methods.get(request["method"])
+            if method is None:
+                raise DaemonError(f"Method not found: {request['method']}", METHOD_NOT_FOUND)
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise DaemonError("Params must be an object", INVALID_PARAMS)
+            self.requests += 1
+            response: dict[str, Any] = {"result": method(params)}
+        except DaemonError as e:
+            response = {"error": {"code": e.code, "message": str(e)}}
+        except Exception as e:
+            response = {"error": {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}}
+        response = {"jsonrpc": "2.0", "id": request_id, **response}
+        try:
+            conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            pass  # Client went away
+
+    def _ping(self, params: dict[str, Any]) -> dict[str, Any]:
+        from .. import __version__
+
+        return {"pid": os.getpid(), "version": __version__}
+
+    def _stats(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+            "projects": len(self.cache),
+            "max_projects": self.cache.max_entries,
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+        }
+
+    def _shutdown(self, params: dict[str, Any]) -> bool:
+        self._stopping = True
+        return True
+
+    def _run(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run one CLI command, capturing everything it prints."""
+        import io
+        import traceback
+        from contextlib import redirect_stderr, redirect_stdout
+
+        import fire
+        from loguru import logger
+        from rich.console import Console
+
+        from . import app
+
+        argv = params.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            raise DaemonError("argv must be a list of strings", INVALID_PARAMS)
+        if not argv or argv[0] not in FORWARDED_COMMANDS:
+            raise DaemonError(f"Command not forwarded: {argv[:1]}", INVALID_PARAMS)
+        cwd = params.get("cwd")
+        if not isinstance(cwd, str):
+            raise DaemonError("cwd must be a string", INVALID_PARAMS)
+        env = params.get("env", {})
+        if not isinstance(env, dict) or not all(isinstance(v, str) for v in env.values()):
+            raise DaemonError("env must map names to strings", INVALID_PARAMS)
+
+        color = bool(params.get("color"))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        console = Console(file=stdout, force_terminal=color, width=params.get("width") or 80)
+        cli = app.CamtasioCLI()
+        cli._project_cache = self.cache
+
+        exit_code = 0
+        previous_cwd = os.getcwd()
+        previous_stdin = sys.stdin
+        sink_id = logger.add(stderr, level="DEBUG", colorize=color)
+        try:
+            os.chdir(cwd)
+            # input() fails with EOFError instead of reading the daemon's stdin
+            sys.stdin = io.StringIO()
+            with (
+                _client_environment(env),
+                app.console.redirected(console),
+                redirect_stdout(stdout),
+                redirect_stderr(stderr),
+            ):
+                fire.Fire(cli, command=argv, name="camtasio")
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            stderr.write(traceback.format_exc())
+            exit_code = 1
+        finally:
+            logger.remove(sink_id)
+            sys.stdin = previous_stdin
+            os.chdir(previous_cwd)
+
+        return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+@contextmanager
+def _client_environment(env: dict[str, str]) -> Iterator[None]:
+    """Apply the client's values of ``FORWARDED_ENV`` for the duration of a command."""
+    saved = {name: os.environ.get(name) for name in FORWARDED_ENV}
+    try:
+        for name in FORWARDED_ENV:
+            if name in env:
+                os.environ[name] = env[name]
+            else:
+                os.environ.pop(name, None)
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
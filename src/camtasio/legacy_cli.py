@@ -103,7 +103,7 @@ def xyscale(
                 console=console,
             ) as progress:
                 task = progress.add_task("Scaling project directly...", total=None)
-                scaler = TscprojScaler(scale_factor, verbose=verbose)
+                scaler = TscprojScaler(scale_factor, verbose=verbose, in_place=True)
                 scaler.scale_file(input_path, output_path)
                 progress.update(task, completed=True)
         else:
@@ -1,22 +1,48 @@
 # this_file: src/camtasio/models/__init__.py
 """Domain models for Camtasia project structure."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .canvas import Canvas
+from .composite import CompositeMedia, GroupMedia, StitchedMedia, UnifiedMedia
 from .factory import create_media_from_dict, detect_media_type
+from .intervals import IntervalIndex
+from .lazy import LazyList
 from .media import AMFile, AudioMedia, Callout, ImageMedia, IMFile, Media, VideoMedia, VMFile
 from .project import Project, ProjectMetadata
+from .references import MediaReferenceIndex, find_used_source_ids, iter_media_dicts
 from .source import SourceBin, SourceItem, SourceTrack
-from .timeline import Timeline, Track, Transition
+from .timeline import MediaPath, Timeline, Track, Transition, walk_media
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarTimeline, ColumnarTrack, DurationStats
+
+# Names imported on first access; the columnar view would otherwise load NumPy
+_LAZY_IMPORTS = {
+    "ColumnarTimeline": ".columnar",
+    "ColumnarTrack": ".columnar",
+    "DurationStats": ".columnar",
+}
 
 __all__ = [
     "AMFile",
     "AudioMedia",
     "Callout",
     "Canvas",
+    "ColumnarTimeline",
+    "ColumnarTrack",
+    "CompositeMedia",
+    "DurationStats",
+    "GroupMedia",
     "IMFile",
     "ImageMedia",
+    "IntervalIndex",
+    "LazyList",
     # Media types
     "Media",
+    "MediaPath",
+    "MediaReferenceIndex",
     # Core project structure
     "Project",
     "ProjectMetadata",
@@ -24,14 +50,33 @@ __all__ = [
     "SourceBin",
     "SourceItem",
     "SourceTrack",
+    "StitchedMedia",
     # Timeline structure
     "Timeline",
     "Track",
     "Transition",
+    "UnifiedMedia",
     # Specific media file types
     "VMFile",
     "VideoMedia",
     # Factory functions
     "create_media_from_dict",
     "detect_media_type",
+    "find_used_source_ids",
+    "iter_media_dicts",
+    "walk_media",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,497 @@
+# this_file: src/camtasio/models/columnar.py
+"""Columnar (struct-of-arrays) view of timeline timing backed by NumPy.
+
+``ColumnarTimeline`` packs the timing fields of every track's media into
+NumPy arrays so bulk edits run as vectorized operations instead of one
+Python object per clip. The view is built from a ``Timeline`` model or from
+a timeline dictionary, edited in bulk and written back with ``apply()``,
+which updates the original media objects or dictionaries in place.
+
+Temporal scaling follows the rules of ``Timeline.scale_temporal()``:
+start times, transitions and keyframe times always scale, durations scale
+except for audio, media ranges scale for video only, images also scale
+``trimStartSum`` and StitchedMedia ``minMediaStart``. Media nested in
+Groups, StitchedMedia and UnifiedMedia get columns of their own, one set
+per container, which are scaled and written back with their track; they
+are relative to their container, so shifts, overlaps and statistics cover
+only the media directly on the timeline tracks. Float timing values are
+truncated to whole ticks when read.
+
+NumPy is optional; install ``camtasio[fast]`` to use this module.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from .composite import CompositeMedia
+from .media import AudioMedia, Callout, ImageMedia, Media
+from .timeline import Timeline, Track
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Media kinds, one per set of temporal scaling rules
+KIND_VIDEO = 0
+KIND_AUDIO = 1
+KIND_IMAGE = 2
+KIND_CALLOUT = 3
+
+_KIND_BY_TYPE = {"AMFile": KIND_AUDIO, "IMFile": KIND_IMAGE, "Callout": KIND_CALLOUT}
+_KIND_BY_CLASS: dict[type, int] = {
+    AudioMedia: KIND_AUDIO,
+    ImageMedia: KIND_IMAGE,
+    Callout: KIND_CALLOUT,
+}
+
+# Timing columns mapped to their (dictionary key, Media attribute)
+TIMING_COLUMNS: dict[str, tuple[str, str]] = {
+    "start": ("start", "start"),
+    "duration": ("duration", "duration"),
+    "media_start": ("mediaStart", "media_start"),
+    "media_duration": ("mediaDuration", "media_duration"),
+    "trim_start_sum": ("trimStartSum", "trim_start_sum"),
+    "min_media_start": ("minMediaStart", "min_media_start"),
+}
+
+# Keyframe fields scaled with the clip
+_KEYFRAME_KEYS = ("time", "endTime", "duration")
+
+_NUMBER = (int, float)
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError(
+            "The columnar timeline requires NumPy; install it with 'pip install camtasio[fast]'"
+        )
+
+
+def _scaled(values: Any, factor: float) -> Any:
+    """Scale and truncate toward zero, matching ``int(value * factor)``."""
+    return (values * factor).astype(np.int64)
+
+
+@dataclass
+class DurationStats:
+    """Duration statistics of a columnar timeline, in edit-rate ticks."""
+
+    media_count: int
+    timeline_duration: int
+    total_media_duration: int
+    mean_media_duration: float
+    min_media_duration: int
+    max_media_duration: int
+
+
+@dataclass
+class ColumnarTrack:
+    """Timing columns of one track; row ``i`` describes ``items[i]``.
+
+    Attributes:
+        track_index: Index of the track
+        source: The ``Track`` model or track dictionary the rows came from
+        items: Media objects or media dictionaries, one per row
+        kind: Scaling rule of each row (``KIND_*``)
+        columns: Integer timing columns keyed by ``TIMING_COLUMNS`` names
+        writable: Per column, rows whose value is numeric and present in the source
+        scalar: Playback speed of each row as a float
+        transitions: Transition objects or dictionaries
+        transition_duration: Duration of each transition
+        keyframes: Keyframe dictionary of each keyframe time field
+        keyframe_keys: Key of each keyframe time field
+        keyframe_values: Value of each keyframe time field
+        nested: Columns of the media nested in the rows' composite media,
+            one per container, in document order
+    """
+
+    track_index: int
+    source: Any
+    items: list[Any]
+    kind: Any
+    columns: dict[str, Any]
+    writable: dict[str, Any]
+    scalar: Any
+    transitions: list[Any] = field(default_factory=list)
+    transition_duration: Any = None
+    keyframes: list[dict[str, Any]] = field(default_factory=list)
+    keyframe_keys: list[str] = field(default_factory=list)
+    keyframe_values: Any = None
+    nested: list["ColumnarTrack"] = field(default_factory=list)
+
+    @property
+    def start(self) -> Any:
+        """Start times."""
+        return self.columns["start"]
+
+    @property
+    def duration(self) -> Any:
+        """Durations."""
+        return self.columns["duration"]
+
+    @property
+    def end(self) -> Any:
+        """End times (``start + duration``)."""
+        return self.columns["start"] + self.columns["duration"]
+
+    @property
+    def track_duration(self) -> int:
+        """Latest end time on the track, 0 when empty."""
+        return int(self.end.max()) if len(self.items) else 0
+
+    def overlap_mask(self) -> Any:
+        """Rows that start before an earlier-starting media on the track ends.
+
+        Media without duration never overlap.
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        mask = np.zeros(len(self.items), dtype=bool)
+        rows = np.flatnonzero(self.duration > 0)
+        if len(rows) < 2:
+            return mask
+        order = rows[np.argsort(self.start[rows], kind="stable")]
+        running_end = np.maximum.accumulate(self.end[order])
+        mask[order[1:]] = self.start[order[1:]] < running_end[:-1]
+        return mask
+
+    @classmethod
+    def from_track(cls, track: Track) -> "ColumnarTrack":
+        """Build the columns of a ``Track`` model."""
+        return cls._from_models(track.track_index, track, track.medias, track.transitions)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ColumnarTrack":
+        """Build the columns of a track dictionary."""
+        medias = [media for media in data.get("medias", []) if isinstance(media, dict)]
+        transitions = [t for t in data.get("transitions", []) if isinstance(t, dict)]
+        return cls._from_dicts(data.get("trackIndex", 0), data, medias, transitions)
+
+    @classmethod
+    def _from_models(
+        cls, track_index: int, source: Any, medias: list[Media], transitions: list[Any]
+    ) -> "ColumnarTrack":
+        """Build the columns of Media objects held by a track or composite."""
+        nested: list[ColumnarTrack] = []
+        for media in medias:
+            if isinstance(media, CompositeMedia):
+                for track, items in media.nested():
+                    if track is not None:
+                        nested.append(cls.from_track(track))
+                    else:
+                        nested.append(cls._from_models(track_index, media, items, []))
+        return cls._build(
+            track_index,
+            source,
+            list(medias),
+            [_KIND_BY_CLASS.get(type(media), KIND_VIDEO) for media in medias],
+            [_media_fields(media) for media in medias],
+            [media.parameters for media in medias],
+            list(transitions),
+            [transition.duration for transition in transitions],
+            nested,
+        )
+
+    @classmethod
+    def _from_dicts(
+        cls,
+        track_index: int,
+        source: Any,
+        medias: list[dict[str, Any]],
+        transitions: list[dict[str, Any]],
+    ) -> "ColumnarTrack":
+        """Build the columns of media dictionaries held by a track or composite."""
+        nested: list[ColumnarTrack] = []
+        for media in medias:
+            media_type = media.get("_type")
+            if media_type == "Group":
+                tracks = media.get("tracks", [])
+                nested.extend(cls.from_dict(track) for track in tracks if isinstance(track, dict))
+            elif media_type == "StitchedMedia":
+                items = [item for item in media.get("medias", []) if isinstance(item, dict)]
+                nested.append(cls._from_dicts(track_index, media, items, []))
+            elif media_type == "UnifiedMedia":
+                items = [
+                    media[key] for key in ("video", "audio") if isinstance(media.get(key), dict)
+                ]
+                nested.append(cls._from_dicts(track_index, media, items, []))
+        return cls._build(
+            track_index,
+            source,
+            medias,
+            [_KIND_BY_TYPE.get(media.get("_type", ""), KIND_VIDEO) for media in medias],
+            [
+                {name: media.get(key) for name, (key, _) in TIMING_COLUMNS.items()}
+                | {"scalar": media.get("scalar", 1.0)}
+                for media in medias
+            ],
+            [media.get("parameters", {}) for media in medias],
+            transitions,
+            [transition.get("duration", 0) for transition in transitions],
+            nested,
+        )
+
+    @classmethod
+    def _build(
+        cls,
+        track_index: int,
+        source: Any,
+        items: list[Any],
+        kinds: list[int],
+        rows: list[dict[str, Any]],
+        parameters: list[dict[str, Any]],
+        transitions: list[Any],
+        transition_durations: list[Any],
+        nested: list["ColumnarTrack"],
+    ) -> "ColumnarTrack":
+        _require_numpy()
+        columns = {}
+        writable = {}
+        for name in TIMING_COLUMNS:
+            values = [row[name] for row in rows]
+            ok = [isinstance(value, _NUMBER) for value in values]
+            columns[name] = np.array(
+                [int(v) if k else 0 for v, k in zip(values, ok, strict=True)], dtype=np.int64
+            )
+            writable[name] = np.array(ok, dtype=bool)
+
+        keyframes: list[dict[str, Any]] = []
+        keyframe_keys: list[str] = []
+        keyframe_values: list[Any] = []
+        seen: set[int] = set()
+        for params in parameters:
+            for param in params.values():
+                if not isinstance(param, dict) or "keyframes" not in param:
+                    continue
+                for keyframe in param["keyframes"]:
+                    # Shared keyframe dictionaries are scaled once
+                    if id(keyframe) in seen:
+                        continue
+                    seen.add(id(keyframe))
+                    for key in _KEYFRAME_KEYS:
+                        value = keyframe.get(key)
+                        if isinstance(value, _NUMBER):
+                            keyframes.append(keyframe)
+                            keyframe_keys.append(key)
+                            keyframe_values.append(value)
+
+        return cls(
+            track_index=track_index,
+            source=source,
+            items=items,
+            kind=np.array(kinds, dtype=np.int8),
+            columns=columns,
+            writable=writable,
+            scalar=np.array([_to_float(row["scalar"]) for row in rows], dtype=np.float64),
+            transitions=transitions,
+            transition_duration=np.array(
+                [int(d) if isinstance(d, _NUMBER) else 0 for d in transition_durations],
+                dtype=np.int64,
+            ),
+            keyframes=keyframes,
+            keyframe_keys=keyframe_keys,
+            keyframe_values=np.array(keyframe_values, dtype=np.float64),
+            nested=nested,
+        )
+
+    def walk(self) -> Iterator["ColumnarTrack"]:
+        """Yield this track and the columns nested in it, depth first."""
+        yield self
+        for track in self.nested:
+            yield from track.walk()
+
+
+def _media_fields(media: Media) -> dict[str, Any]:
+    """Timing values of a Media object keyed by column name."""
+    return {name: getattr(media, attr, None) for name, (_, attr) in TIMING_COLUMNS.items()} | {
+        "scalar": media.scalar
+    }
+
+
+def _to_float(value: Any) -> float:
+    """Convert a scalar such as ``1``, ``0.5`` or ``"1/2"`` to float."""
+    if isinstance(value, str) and "/" in value:
+        num, _, den = value.partition("/")
+        try:
+            return float(num) / float(den)
+        except (ValueError, ZeroDivisionError):
+            return 1.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+@dataclass
+class ColumnarTimeline:
+    """Struct-of-arrays view of a timeline's media timing.
+
+    Edits change only the arrays; call ``apply()`` to write them back to the
+    media objects or dictionaries the view was built from.
+    """
+
+    tracks: list[ColumnarTrack] = field(default_factory=list)
+    _dirty: set[str] = field(default_factory=set, init=False, repr=False)
+
+    @classmethod
+    def from_timeline(cls, timeline: Timeline) -> "ColumnarTimeline":
+        """Build a columnar view of a ``Timeline`` model.
+
+        Args:
+            timeline: Timeline to view
+
+        Returns:
+            New ColumnarTimeline sharing the timeline's media objects
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        return cls(tracks=[ColumnarTrack.from_track(track) for track in timeline.tracks])
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ColumnarTimeline":
+        """Build a columnar view of a timeline dictionary.
+
+        Args:
+            data: Timeline dictionary (the project's ``timeline`` value)
+
+        Returns:
+            New ColumnarTimeline sharing the dictionary's media
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        _require_numpy()
+        scenes = data.get("sceneTrack", {}).get("scenes", [])
+        track_data = scenes[0].get("csml", {}).get("tracks", []) if scenes else []
+        return cls(tracks=[ColumnarTrack.from_dict(track) for track in track_data])
+
+    @property
+    def media_count(self) -> int:
+        """Total number of rows across all tracks."""
+        return sum(len(track.items) for track in self.tracks)
+
+    @property
+    def duration(self) -> int:
+        """Latest end time on any track."""
+        return max((track.track_duration for track in self.tracks), default=0)
+
+    def scale_temporal(self, factor: float) -> None:
+        """Scale timing in place with the rules of ``Timeline.scale_temporal()``.
+
+        Nested media are scaled too.
+
+        Args:
+            factor: Temporal scale factor
+        """
+        for track in self._walk():
+            columns = track.columns
+            columns["start"] = _scaled(columns["start"], factor)
+            columns["duration"] = np.where(
+                track.kind != KIND_AUDIO, _scaled(columns["duration"], factor), columns["duration"]
+            )
+            video = track.kind == KIND_VIDEO
+            for name in ("media_start", "media_duration"):
+                scale = video & track.writable[name]
+                columns[name] = np.where(scale, _scaled(columns[name], factor), columns[name])
+            image = track.kind == KIND_IMAGE
+            columns["trim_start_sum"] = np.where(
+                image, _scaled(columns["trim_start_sum"], factor), columns["trim_start_sum"]
+            )
+            columns["min_media_start"] = np.where(
+                track.writable["min_media_start"],
+                _scaled(columns["min_media_start"], factor),
+                columns["min_media_start"],
+            )
+            track.transition_duration = _scaled(track.transition_duration, factor)
+            track.keyframe_values = _scaled(track.keyframe_values, factor)
+        self._dirty.update((*TIMING_COLUMNS, "transitions", "keyframes"))
+
+    def _walk(self) -> Iterator[ColumnarTrack]:
+        """Every track and the columns nested in it."""
+        for track in self.tracks:
+            yield from track.walk()
+
+    def shift(self, offset: int, track_indices: Iterable[int] | None = None) -> None:
+        """Move media in time by a fixed offset.
+
+        Args:
+            offset: Ticks to add to every start time
+            track_indices: Only shift tracks with these indices (default: all)
+        """
+        selected = None if track_indices is None else set(track_indices)
+        for track in self.tracks:
+            if selected is None or track.track_index in selected:
+                track.columns["start"] = track.columns["start"] + offset
+        self._dirty.add("start")
+
+    def overlaps(self) -> dict[int, list[Any]]:
+        """Media that overlap an earlier-starting media on their track.
+
+        Returns:
+            Mapping of track index to the overlapping media objects or
+            dictionaries; tracks without overlaps are omitted
+        """
+        result = {}
+        for track in self.tracks:
+            rows = np.flatnonzero(track.overlap_mask())
+            if len(rows):
+                result[track.track_index] = [track.items[row] for row in rows]
+        return result
+
+    def duration_stats(self) -> DurationStats:
+        """Duration statistics over all media."""
+        durations = np.concatenate(
+            [track.duration for track in self.tracks] or [np.zeros(0, dtype=np.int64)]
+        )
+        if not len(durations):
+            return DurationStats(0, self.duration, 0, 0.0, 0, 0)
+        return DurationStats(
+            media_count=len(durations),
+            timeline_duration=self.duration,
+            total_media_duration=int(durations.sum()),
+            mean_media_duration=float(durations.mean()),
+            min_media_duration=int(durations.min()),
+            max_media_duration=int(durations.max()),
+        )
+
+    def apply(self) -> None:
+        """Write edited columns back to the source media, transitions and keyframes."""
+        for track in self._walk():
+            from_dict = isinstance(track.source, dict)
+            for name in TIMING_COLUMNS.keys() & self._dirty:
+                key, attr = TIMING_COLUMNS[name]
+                values = track.columns[name].tolist()
+                for item, value, ok in zip(
+                    track.items, values, track.writable[name].tolist(), strict=True
+                ):
+                    if not ok:
+                        continue
+                    if from_dict:
+                        item[key] = value
+                    else:
+                        setattr(item, attr, value)
+            if "transitions" in self._dirty:
+                for transition, value in zip(
+                    track.transitions, track.transition_duration.tolist(), strict=True
+                ):
+                    if from_dict:
+                        transition["duration"] = value
+                    else:
+                        transition.duration = value
+            if "keyframes" in self._dirty:
+                for keyframe, key, value in zip(
+                    track.keyframes,
+                    track.keyframe_keys,
+                    track.keyframe_values.tolist(),
+                    strict=True,
+                ):
+                    keyframe[key] = value
+            if isinstance(track.source, Track):
+                track.source.invalidate_intervals()
+        self._dirty.clear()
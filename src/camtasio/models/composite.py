@@ -0,0 +1,170 @@
+# this_file: src/camtasio/models/composite.py
+"""Composite media that contain other media: Groups, StitchedMedia and UnifiedMedia."""
+
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Self
+
+from .media import Media, VideoMedia
+
+if TYPE_CHECKING:
+    from .timeline import Track
+
+
+@dataclass(slots=True)
+class CompositeMedia(VideoMedia):
+    """Media item whose content is made of nested media.
+
+    Scaling a composite scales its own timing and parameters like video and
+    then every nested media item, recursively.
+    """
+
+    @abstractmethod
+    def nested(self) -> list[tuple["Track | None", list[Media]]]:
+        """Nested media grouped by container.
+
+        Returns:
+            List of (track, media) pairs in document order; the track is
+            ``None`` for media held directly by this item
+        """
+
+    @abstractmethod
+    def remove_child(self, media: Media) -> bool:
+        """Remove a directly nested media item.
+
+        Args:
+            media: Media to remove (matched by identity)
+
+        Returns:
+            True if the item was removed, False if this composite cannot
+            exist without it and must be removed as a whole
+
+        Raises:
+            ValueError: If the media is not nested directly in this item
+        """
+
+
+@dataclass(slots=True)
+class GroupMedia(CompositeMedia):
+    """Group of media laid out on nested tracks (Group)."""
+
+    tracks: list["Track"] = field(default_factory=list)
+
+    def get_type(self) -> str:
+        """Get the _type value."""
+        return "Group"
+
+    def nested(self) -> list[tuple["Track | None", list[Media]]]:
+        """Media of each nested track."""
+        return [(track, track.medias) for track in self.tracks]
+
+    def remove_child(self, media: Media) -> bool:
+        """Groups hold media on tracks; remove them through the track."""
+        return False
+
+    def scale_spatial(self, factor: float) -> Self:
+        """Scale spatial properties of the group and its tracks."""
+        scaled = VideoMedia.scale_spatial(self, factor)
+        scaled.tracks = [track.scale_spatial(factor) for track in self.tracks]
+        return scaled
+
+    def scale_temporal(self, factor: float) -> Self:
+        """Scale temporal properties of the group and its tracks."""
+        scaled = VideoMedia.scale_temporal(self, factor)
+        scaled.tracks = [track.scale_temporal(factor) for track in self.tracks]
+        return scaled
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        result = Media.to_dict(self)
+        result["tracks"] = [track.to_dict() for track in self.tracks]
+        return result
+
+
+@dataclass(slots=True)
+class StitchedMedia(CompositeMedia):
+    """Clips played back to back as one media item (StitchedMedia)."""
+
+    medias: list[Media] = field(default_factory=list)
+    min_media_start: int = 0
+
+    def get_type(self) -> str:
+        """Get the _type value."""
+        return "StitchedMedia"
+
+    def nested(self) -> list[tuple["Track | None", list[Media]]]:
+        """The stitched clips."""
+        return [(None, self.medias)]
+
+    def remove_child(self, media: Media) -> bool:
+        """Remove a clip from the sequence."""
+        for index, item in enumerate(self.medias):
+            if item is media:
+                del self.medias[index]
+                return True
+        raise ValueError(f"Media {media.id} is not part of stitched media {self.id}")
+
+    def scale_spatial(self, factor: float) -> Self:
+        """Scale spatial properties of the item and its clips."""
+        scaled = VideoMedia.scale_spatial(self, factor)
+        scaled.medias = [media.scale_spatial(factor) for media in self.medias]
+        return scaled
+
+    def scale_temporal(self, factor: float) -> Self:
+        """Scale temporal properties of the item and its clips."""
+        scaled = VideoMedia.scale_temporal(self, factor)
+        scaled.medias = [media.scale_temporal(factor) for media in self.medias]
+        scaled.min_media_start = int(self.min_media_start * factor)
+        return scaled
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        result = Media.to_dict(self)
+        result["medias"] = [media.to_dict() for media in self.medias]
+        if self.min_media_start:
+            result["minMediaStart"] = self.min_media_start
+        return result
+
+
+@dataclass(slots=True)
+class UnifiedMedia(CompositeMedia):
+    """Screen recording with its video and audio kept together (UnifiedMedia)."""
+
+    video: Media | None = None
+    audio: Media | None = None
+
+    def get_type(self) -> str:
+        """Get the _type value."""
+        return "UnifiedMedia"
+
+    def nested(self) -> list[tuple["Track | None", list[Media]]]:
+        """The video followed by the audio."""
+        return [(None, [media for media in (self.video, self.audio) if media is not None])]
+
+    def remove_child(self, media: Media) -> bool:
+        """The video and audio are only removed together with the item."""
+        return False
+
+    def scale_spatial(self, factor: float) -> Self:
+        """Scale spatial properties of the video and audio."""
+        return self._evolve(
+            parameters=self._scale_parameters(factor),
+            video=None if self.video is None else self.video.scale_spatial(factor),
+            audio=None if self.audio is None else self.audio.scale_spatial(factor),
+        )
+
+    def scale_temporal(self, factor: float) -> Self:
+        """Scale temporal properties of the item, its video and its audio."""
+        scaled = VideoMedia.scale_temporal(self, factor)
+        scaled.video = None if self.video is None else self.video.scale_temporal(factor)
+        scaled.audio = None if self.audio is None else self.audio.scale_temporal(factor)
+        return scaled
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        result = Media.to_dict(self)
+        if self.video is not None:
+            result["video"] = self.video.to_dict()
+        if self.audio is not None:
+            result["audio"] = self.audio.to_dict()
+        return result
@@ -5,6 +5,7 @@ from typing import Any, cast
 
 from loguru import logger
 
+from .composite import GroupMedia, StitchedMedia, UnifiedMedia
 from .media import AudioMedia, Callout, ImageMedia, Media, VideoMedia
 
 
@@ -29,9 +30,9 @@ def create_media_from_dict(data: dict[str, Any]) -> Media:
         "AMFile": AudioMedia,
         "IMFile": ImageMedia,
         "Callout": Callout,
-        "UnifiedMedia": VideoMedia,  # Treat as video for now
-        "Group": VideoMedia,  # Groups can contain multiple media, treat as video
-        "StitchedMedia": VideoMedia,  # Stitched media is like concatenated video
+        "UnifiedMedia": UnifiedMedia,
+        "Group": GroupMedia,
+        "StitchedMedia": StitchedMedia,
     }
 
     media_class = type_map.get(media_type)
@@ -64,6 +65,26 @@ def create_media_from_dict(data: dict[str, Any]) -> Media:
         return ImageMedia(**common_fields, trim_start_sum=data.get("trimStartSum", 0))
     elif media_class == Callout:
         return Callout(**common_fields, definition=data.get("def", {}))
+    elif media_class == GroupMedia:
+        # Imported here because the timeline module decodes media with this factory
+        from .timeline import Track
+
+        return GroupMedia(
+            **common_fields, tracks=[Track.from_dict(track) for track in data.get("tracks", [])]
+        )
+    elif media_class == StitchedMedia:
+        return StitchedMedia(
+            **common_fields,
+            medias=[create_media_from_dict(media) for media in data.get("medias", [])],
+            min_media_start=data.get("minMediaStart", 0),
+        )
+    elif media_class == UnifiedMedia:
+        video, audio = data.get("video"), data.get("audio")
+        return UnifiedMedia(
+            **common_fields,
+            video=None if video is None else create_media_from_dict(video),
+            audio=None if audio is None else create_media_from_dict(audio),
+        )
     else:
         # VideoMedia or default
         return cast(Media, media_class(**common_fields))
@@ -0,0 +1,123 @@
+# this_file: src/camtasio/models/intervals.py
+"""Interval index answering time queries over the media of a track."""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+from .media import Media
+
+# Tree value of empty leaves; below every media end time
+_EMPTY = float("-inf")
+
+
+@dataclass
+class IntervalIndex:
+    """Media sorted by start time with a max-end segment tree over them.
+
+    A media item occupies the half-open interval ``[start, start + duration)``.
+    Queries first bisect the sorted start times to bound the candidates and
+    then descend only into subtrees whose largest end time lies past the query
+    start, so they cost O(log n) plus O(log n) per reported media instead of a
+    scan of the whole track.
+
+    Attributes:
+        medias: Media sorted by start time (ties keep track order)
+        revision: ``Track.revision`` the index was built for
+    """
+
+    medias: list[Media] = field(default_factory=list)
+    revision: int = 0
+    starts: list[int] = field(init=False, repr=False)
+    ends: list[int] = field(init=False, repr=False)
+    _size: int = field(init=False, repr=False)
+    _tree: list[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Sort the media and build the tree."""
+        self.medias = sorted(self.medias, key=attrgetter("start"))
+        self.starts = [media.start for media in self.medias]
+        self.ends = [media.start + media.duration for media in self.medias]
+        self._build(len(self.medias))
+
+    @property
+    def max_end(self) -> int:
+        """Latest end time of any media, 0 for an empty index."""
+        return int(self._tree[1]) if self.medias else 0
+
+    def append(self, media: Media) -> bool:
+        """Add media that starts no earlier than every indexed media.
+
+        Args:
+            media: Media to add
+
+        Returns:
+            True if the media was added, False if it would have to be inserted
+            before existing media (the index is left unchanged)
+        """
+        if self.starts and media.start < self.starts[-1]:
+            return False
+        position = len(self.medias)
+        self.medias.append(media)
+        self.starts.append(media.start)
+        self.ends.append(media.start + media.duration)
+        if position >= self._size:
+            self._build(position + 1)
+        else:
+            self._set_leaf(position)
+        return True
+
+    def at(self, time: int) -> list[Media]:
+        """Media playing at ``time`` (``start <= time < end``), sorted by start."""
+        return self._collect(bisect_right(self.starts, time), time)
+
+    def overlapping(self, start: int, end: int) -> list[Media]:
+        """Media overlapping ``[start, end)``, sorted by start."""
+        if end <= start:
+            return []
+        return self._collect(bisect_left(self.starts, end), start)
+
+    def overlaps(self) -> list[tuple[Media, Media]]:
+        """Pairs of media whose intervals overlap, ordered by start time."""
+        pairs = []
+        for i, media in enumerate(self.medias):
+            # Later media starting before this one ends overlap it unless empty
+            for j in range(i + 1, bisect_left(self.starts, self.ends[i], lo=i + 1)):
+                if self.starts[j] < self.ends[j]:
+                    pairs.append((media, self.medias[j]))
+        return pairs
+
+    def _build(self, capacity: int) -> None:
+        size = 1
+        while size < capacity:
+            size *= 2
+        self._size = size
+        self._tree = [_EMPTY] * (2 * size)
+        self._tree[size : size + len(self.ends)] = self.ends
+        for node in range(size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def _set_leaf(self, position: int) -> None:
+        node = self._size + position
+        self._tree[node] = self.ends[position]
+        node //= 2
+        while node and self._tree[node] < self.ends[position]:
+            self._tree[node] = self.ends[position]
+            node //= 2
+
+    def _collect(self, limit: int, after: float) -> list[Media]:
+        """Media among the first ``limit`` whose end lies after ``after``."""
+        found = []
+        tree = self._tree
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= limit or tree[node] <= after:
+                continue
+            if hi - lo == 1:
+                found.append(self.medias[lo])
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        return found
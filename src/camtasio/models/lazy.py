@@ -0,0 +1,249 @@
+# this_file: src/camtasio/models/lazy.py
+"""Lazily decoded collections used by the lazy Project mode."""
+
+import copy
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, SupportsIndex, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class LazyList(list[T]):
+    """List that keeps raw dict slices and decodes each item on first access.
+
+    The list initially stores the raw JSON values. Reading an item through
+    indexing or iteration decodes it once and replaces the raw value in place,
+    so untouched items cost nothing beyond the original parse. ``len()`` never
+    decodes. Structural mutations other than ``append``, comparisons and
+    repetition decode the remaining items first and then behave exactly like
+    a plain list.
+    """
+
+    __slots__ = ("_decode", "_pending")
+
+    def __init__(self, raw: Iterable[Any] = (), decode: Callable[[Any], T] | None = None):
+        """Initialize the list.
+
+        Args:
+            raw: Raw JSON values to decode lazily, or decoded items if no
+                ``decode`` is given
+            decode: Function converting one raw value into a model object;
+                without it the list starts out materialized, which is how
+                ``dataclasses.asdict()`` rebuilds list fields
+        """
+        super().__init__(raw)
+        self._decode: Callable[[Any], T] | None = decode
+        self._pending = bytearray(b"\x01") * len(self) if decode is not None else bytearray()
+        if not self._pending:
+            self._decode = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether every item has been decoded."""
+        return self._decode is None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of items that have not been decoded yet."""
+        return 0 if self._decode is None else self._pending.count(1)
+
+    def _materialize(self, index: int) -> T:
+        """Decode the item at a non-negative index if needed and return it."""
+        if self._decode is not None and self._pending[index]:
+            value = self._decode(list.__getitem__(self, index))
+            list.__setitem__(self, index, value)
+            self._pending[index] = 0
+            return value
+        return list.__getitem__(self, index)
+
+    def _materialize_all(self) -> None:
+        """Decode every remaining item and switch to plain list behavior."""
+        if self._decode is None:
+            return
+        for index in range(len(self)):
+            self._materialize(index)
+        self._decode = None
+        self._pending = bytearray()
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> T | list[T]:
+        """Get item(s), decoding them on first access."""
+        if self._decode is None:
+            return list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self)))]
+        i = index.__index__()
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("list index out of range")
+        return self._materialize(i)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over items, decoding them as they are reached."""
+        if self._decode is None:
+            return list.__iter__(self)
+        return (self._materialize(i) for i in range(len(self)))
+
+    def __reversed__(self) -> Iterator[T]:
+        """Iterate over items in reverse order."""
+        self._materialize_all()
+        return list.__reversed__(self)
+
+    def __contains__(self, value: object) -> bool:
+        """Check membership."""
+        return any(item is value or item == value for item in self)
+
+    def _materialize_both(self, other: object) -> None:
+        """Decode this list and ``other`` if it is lazy too, before comparing."""
+        self._materialize_all()
+        if isinstance(other, LazyList):
+            other._materialize_all()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare as a plain list."""
+        self._materialize_both(other)
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        """Compare as a plain list."""
+        return not self == other
+
+    def __lt__(self, other: list[T]) -> bool:
+        """Compare as a plain list."""
+        self._materialize_both(other)
+        return list.__lt__(self, other)
+
+    def __le__(self, other: list[T]) -> bool:
+        """Compare as a plain list."""
+        self._materialize_both(other)
+        return list.__le__(self, other)
+
+    def __gt__(self, other: list[T]) -> bool:
+        """Compare as a plain list."""
+        self._materialize_both(other)
+        return list.__gt__(self, other)
+
+    def __ge__(self, other: list[T]) -> bool:
+        """Compare as a plain list."""
+        self._materialize_both(other)
+        return list.__ge__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Represent as a plain list."""
+        self._materialize_all()
+        return list.__repr__(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a plain, fully decoded list."""
+        return (list, (list(self),))
+
+    def __copy__(self) -> list[T]:
+        """Return a shallow, fully decoded plain list copy."""
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[T]:
+        """Return a deep, fully decoded plain list copy."""
+        return copy.deepcopy(list(self), memo)
+
+    def __add__(self, other: list[T]) -> list[T]:  # type: ignore[override]
+        """Concatenate into a new plain list."""
+        return list(self) + list(other)
+
+    def __radd__(self, other: list[T]) -> list[T]:
+        """Concatenate after a plain list into a new plain list."""
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def __mul__(self, count: SupportsIndex) -> list[T]:
+        """Repeat into a new plain list."""
+        return list(self) * count
+
+    def __rmul__(self, count: SupportsIndex) -> list[T]:
+        """Repeat into a new plain list."""
+        return list(self) * count
+
+    def copy(self) -> list[T]:
+        """Return a shallow, fully decoded plain list copy."""
+        return list(self)
+
+    def index(self, value: Any, start: SupportsIndex = 0, stop: SupportsIndex = 2**63 - 1) -> int:
+        """Return first index of value."""
+        self._materialize_all()
+        return list.index(self, value, start, stop)
+
+    def count(self, value: Any) -> int:
+        """Return number of occurrences of value."""
+        self._materialize_all()
+        return list.count(self, value)
+
+    def append(self, value: T) -> None:
+        """Append an already decoded item."""
+        list.append(self, value)
+        if self._decode is not None:
+            self._pending.append(0)
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Extend with already decoded items."""
+        self._materialize_all()
+        list.extend(self, values)
+
+    def insert(self, index: SupportsIndex, value: T) -> None:
+        """Insert an already decoded item."""
+        self._materialize_all()
+        list.insert(self, index, value)
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        """Remove and return an item."""
+        self._materialize_all()
+        return list.pop(self, index)
+
+    def remove(self, value: T) -> None:
+        """Remove first occurrence of value."""
+        self._materialize_all()
+        list.remove(self, value)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        list.clear(self)
+        self._decode = None
+        self._pending = bytearray()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sort items in place."""
+        self._materialize_all()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self) -> None:
+        """Reverse items in place."""
+        self._materialize_all()
+        list.reverse(self)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Set item(s)."""
+        self._materialize_all()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        """Delete item(s)."""
+        self._materialize_all()
+        list.__delitem__(self, index)
+
+    def __iadd__(self, values: Iterable[T]) -> "LazyList[T]":  # type: ignore[override]
+        """Extend in place."""
+        self.extend(values)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "LazyList[T]":
+        """Repeat in place."""
+        self._materialize_all()
+        list.__imul__(self, count)
+        return self
@@ -2,11 +2,34 @@
 """Media models representing timeline media items."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any
-
-
-@dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from functools import cache
+from operator import attrgetter
+from typing import Any, Self
+
+# Numeric parameters scaled with the canvas: position, size and crop
+SPATIAL_PARAMETER_KEYS = (
+    "translation0",
+    "translation1",
+    "translation2",
+    "scale0",
+    "scale1",
+    "scale2",
+    "geometryCrop0",
+    "geometryCrop1",
+    "geometryCrop2",
+    "geometryCrop3",
+)
+
+
+@cache
+def _field_getter(cls: type) -> Callable[[Any], tuple[Any, ...]]:
+    """Getter returning the constructor arguments of a media class."""
+    return attrgetter(*(f.name for f in fields(cls)))
+
+
+@dataclass(slots=True)
 class Media(ABC):
     """Base class for all media types on the timeline."""
 
@@ -39,33 +62,69 @@ class Media(ABC):
         """Get the _type value for serialization."""
         pass
 
-    def _scale_parameters(self, factor: float) -> dict[str, Any]:
-        """Scale spatial parameters."""
-        scaled = self.parameters.copy()
+    def _evolve(self, **changes: Any) -> Self:
+        """Shallow copy with some fields replaced.
+
+        Unlike ``copy.deepcopy`` this shares every container that is not
+        replaced, and it is cheaper than ``dataclasses.replace``.
 
-        # Scale position parameters
-        for key in ["translation0", "translation1", "translation2"]:
-            if key in scaled and isinstance(scaled[key], int | float):
-                scaled[key] = scaled[key] * factor
+        Args:
+            **changes: New values for fields of the copy
+
+        Returns:
+            New instance of the same class
+        """
+        new = type(self)(*_field_getter(type(self))(self))
+        for name, value in changes.items():
+            setattr(new, name, value)
+        return new
+
+    def _scale_parameters(self, factor: float) -> dict[str, Any]:
+        """Scale spatial parameters.
 
-        # Scale size parameters
-        for key in ["scale0", "scale1", "scale2"]:
-            if key in scaled and isinstance(scaled[key], int | float):
-                scaled[key] = scaled[key] * factor
+        Returns ``self.parameters`` itself when nothing is scaled; otherwise a
+        new dictionary that shares every unscaled value with the original.
+        """
+        scaled: dict[str, Any] | None = None
 
-        # Scale crop parameters
-        for key in ["geometryCrop0", "geometryCrop1", "geometryCrop2", "geometryCrop3"]:
-            if key in scaled and isinstance(scaled[key], int | float):
-                scaled[key] = scaled[key] * factor
+        # Scale position, size and crop parameters
+        for key in SPATIAL_PARAMETER_KEYS:
+            value = self.parameters.get(key)
+            if isinstance(value, int | float):
+                if scaled is None:
+                    scaled = dict(self.parameters)
+                scaled[key] = value * factor
 
         # Handle keyframe animations
-        for key, value in scaled.items():
-            if isinstance(value, dict) and "keyframes" in value:
+        for key, value in self.parameters.items():
+            if isinstance(value, dict) and value.get("keyframes"):
                 # Scale keyframe values for spatial properties
                 if any(prop in key for prop in ["translation", "scale", "geometryCrop"]):
-                    value["keyframes"] = self._scale_keyframes_spatial(value["keyframes"], factor)
-
-        return scaled
+                    if scaled is None:
+                        scaled = dict(self.parameters)
+                    scaled[key] = {
+                        **value,
+                        "keyframes": self._scale_keyframes_spatial(value["keyframes"], factor),
+                    }
+
+        return self.parameters if scaled is None else scaled
+
+    def _scale_parameters_temporal(self, factor: float) -> dict[str, Any]:
+        """Scale keyframe times of all animated parameters.
+
+        Returns ``self.parameters`` itself when no parameter is animated;
+        otherwise a new dictionary that shares every static value.
+        """
+        scaled: dict[str, Any] | None = None
+        for key, value in self.parameters.items():
+            if isinstance(value, dict) and value.get("keyframes"):
+                if scaled is None:
+                    scaled = dict(self.parameters)
+                scaled[key] = {
+                    **value,
+                    "keyframes": self._scale_keyframes_temporal(value["keyframes"], factor),
+                }
+        return self.parameters if scaled is None else scaled
 
     def _scale_keyframes_spatial(
         self, keyframes: list[dict[str, Any]], factor: float
@@ -123,7 +182,7 @@ class Media(ABC):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMedia(Media):
     """Video media file (VMFile, ScreenVMFile)."""
 
@@ -132,29 +191,13 @@ class VideoMedia(Media):
         # Could be VMFile or ScreenVMFile based on attributes
         return str(self.attributes.get("_type", "VMFile"))
 
-    def scale_spatial(self, factor: float) -> "VideoMedia":
+    def scale_spatial(self, factor: float) -> Self:
         """Scale spatial properties."""
-        return VideoMedia(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=self.start,
-            duration=self.duration,
-            media_start=self.media_start,
-            media_duration=self.media_duration,
-            scalar=self.scalar,
-            attributes=self.attributes.copy(),
-            parameters=self._scale_parameters(factor),
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
-        )
+        return self._evolve(parameters=self._scale_parameters(factor))
 
-    def scale_temporal(self, factor: float) -> "VideoMedia":
+    def scale_temporal(self, factor: float) -> Self:
         """Scale temporal properties."""
         # Scale time properties
-        new_start = int(self.start * factor)
-        new_duration = int(self.duration * factor)
         new_media_start = (
             int(self.media_start * factor)
             if isinstance(self.media_start, int | float)
@@ -165,31 +208,16 @@ class VideoMedia(Media):
             if isinstance(self.media_duration, int | float)
             else self.media_duration
         )
-
-        # Scale keyframe times
-        new_params = self.parameters.copy()
-        for _key, value in new_params.items():
-            if isinstance(value, dict) and "keyframes" in value:
-                value["keyframes"] = self._scale_keyframes_temporal(value["keyframes"], factor)
-
-        return VideoMedia(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=new_start,
-            duration=new_duration,
+        return self._evolve(
+            start=int(self.start * factor),
+            duration=int(self.duration * factor),
             media_start=new_media_start,
             media_duration=new_media_duration,
-            scalar=self.scalar,
-            attributes=self.attributes.copy(),
-            parameters=new_params,
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
+            parameters=self._scale_parameters_temporal(factor),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioMedia(Media):
     """Audio media file (AMFile)."""
 
@@ -201,59 +229,25 @@ class AudioMedia(Media):
 
     def scale_spatial(self, factor: float) -> "AudioMedia":
         """Audio has no spatial properties to scale."""
-        return AudioMedia(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=self.start,
-            duration=self.duration,
-            media_start=self.media_start,
-            media_duration=self.media_duration,
-            scalar=self.scalar,
-            channel_number=self.channel_number,
-            attributes=self.attributes.copy(),
-            parameters=self.parameters.copy(),  # No spatial scaling for audio
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
-        )
+        return self._evolve()
 
     def scale_temporal(self, factor: float) -> "AudioMedia":
         """Scale temporal properties - but preserve audio duration!"""
-        # Only scale start position, not duration
-        new_start = int(self.start * factor)
-
-        # Scale keyframe times (for volume fades, etc.)
-        new_params = self.parameters.copy()
-        for _key, value in new_params.items():
-            if isinstance(value, dict) and "keyframes" in value:
-                value["keyframes"] = self._scale_keyframes_temporal(value["keyframes"], factor)
-
-        return AudioMedia(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=new_start,
-            duration=self.duration,  # Preserved!
-            media_start=self.media_start,  # Preserved!
-            media_duration=self.media_duration,  # Preserved!
-            scalar=self.scalar,
-            channel_number=self.channel_number,
-            attributes=self.attributes.copy(),
-            parameters=new_params,
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
+        # Only scale start position and keyframe times (for volume fades, etc.);
+        # duration, media_start and media_duration are preserved
+        return self._evolve(
+            start=int(self.start * factor),
+            parameters=self._scale_parameters_temporal(factor),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = super().to_dict()
+        result = Media.to_dict(self)
         result["channelNumber"] = self.channel_number
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageMedia(Media):
     """Image media file (IMFile)."""
 
@@ -265,61 +259,26 @@ class ImageMedia(Media):
 
     def scale_spatial(self, factor: float) -> "ImageMedia":
         """Scale spatial properties."""
-        return ImageMedia(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=self.start,
-            duration=self.duration,
-            media_start=self.media_start,
-            media_duration=self.media_duration,
-            scalar=self.scalar,
-            trim_start_sum=self.trim_start_sum,
-            attributes=self.attributes.copy(),
-            parameters=self._scale_parameters(factor),
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
-        )
+        return self._evolve(parameters=self._scale_parameters(factor))
 
     def scale_temporal(self, factor: float) -> "ImageMedia":
         """Scale temporal properties."""
-        new_start = int(self.start * factor)
-        new_duration = int(self.duration * factor)
-        new_trim = int(self.trim_start_sum * factor)
-
-        # Scale keyframe times
-        new_params = self.parameters.copy()
-        for _key, value in new_params.items():
-            if isinstance(value, dict) and "keyframes" in value:
-                value["keyframes"] = self._scale_keyframes_temporal(value["keyframes"], factor)
-
-        return ImageMedia(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=new_start,
-            duration=new_duration,
-            media_start=self.media_start,
-            media_duration=self.media_duration,
-            scalar=self.scalar,
-            trim_start_sum=new_trim,
-            attributes=self.attributes.copy(),
-            parameters=new_params,
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
+        return self._evolve(
+            start=int(self.start * factor),
+            duration=int(self.duration * factor),
+            trim_start_sum=int(self.trim_start_sum * factor),
+            parameters=self._scale_parameters_temporal(factor),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = super().to_dict()
+        result = Media.to_dict(self)
         if self.trim_start_sum:
             result["trimStartSum"] = self.trim_start_sum
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Callout(Media):
     """Callout/annotation object."""
 
@@ -332,59 +291,26 @@ class Callout(Media):
     def scale_spatial(self, factor: float) -> "Callout":
         """Scale spatial properties including definition."""
         # Scale definition properties
-        new_def = self.definition.copy()
+        new_def = self.definition
         for key in ["width", "height", "corner-radius", "stroke-width"]:
-            if key in new_def:
+            if key in self.definition:
+                if new_def is self.definition:
+                    new_def = dict(self.definition)
                 new_def[key] = new_def[key] * factor
 
-        return Callout(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=self.start,
-            duration=self.duration,
-            media_start=self.media_start,
-            media_duration=self.media_duration,
-            scalar=self.scalar,
-            definition=new_def,
-            attributes=self.attributes.copy(),
-            parameters=self._scale_parameters(factor),
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
-        )
+        return self._evolve(definition=new_def, parameters=self._scale_parameters(factor))
 
     def scale_temporal(self, factor: float) -> "Callout":
         """Scale temporal properties."""
-        new_start = int(self.start * factor)
-        new_duration = int(self.duration * factor)
-
-        # Scale keyframe times
-        new_params = self.parameters.copy()
-        for _key, value in new_params.items():
-            if isinstance(value, dict) and "keyframes" in value:
-                value["keyframes"] = self._scale_keyframes_temporal(value["keyframes"], factor)
-
-        return Callout(
-            id=self.id,
-            src=self.src,
-            track_number=self.track_number,
-            start=new_start,
-            duration=new_duration,
-            media_start=self.media_start,
-            media_duration=self.media_duration,
-            scalar=self.scalar,
-            definition=self.definition.copy(),
-            attributes=self.attributes.copy(),
-            parameters=new_params,
-            effects=self.effects.copy(),
-            metadata=self.metadata.copy(),
-            animation_tracks=self.animation_tracks.copy(),
+        return self._evolve(
+            start=int(self.start * factor),
+            duration=int(self.duration * factor),
+            parameters=self._scale_parameters_temporal(factor),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = super().to_dict()
+        result = Media.to_dict(self)
         if self.definition:
             result["def"] = self.definition
         return result
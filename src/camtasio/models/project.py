@@ -7,6 +7,7 @@ from typing import Any, Self, cast
 from loguru import logger
 
 from .canvas import Canvas
+from .references import MediaReferenceIndex
 from .source import SourceBin
 from .timeline import Timeline
 
@@ -71,6 +72,20 @@ class Project:
     source_bin: SourceBin
     timeline: Timeline
     metadata: ProjectMetadata
+    _references: MediaReferenceIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def references(self) -> MediaReferenceIndex:
+        """Reverse index from source bin item IDs to the media using them.
+
+        Built on first access and kept up to date as tracks change, so usage
+        lookups do not rescan the timeline.
+        """
+        if self._references is None or self._references.timeline is not self.timeline:
+            self._references = MediaReferenceIndex(self.timeline)
+        return self._references
 
     @property
     def version(self) -> str:
@@ -135,11 +150,16 @@ class Project:
         return result
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> Self:
         """Create Project from dictionary.
 
+        In lazy mode ``timeline.tracks``, each track's ``medias`` and
+        ``source_bin.items`` keep the raw dict slices and decode them on first
+        access, so read-only inspection costs little more than the JSON parse.
+
         Args:
             data: Dictionary containing project data
+            lazy: Decode tracks, media and source items only when first accessed
 
         Returns:
             New Project instance
@@ -159,14 +179,14 @@ class Project:
         if not isinstance(source_bin_data, list):
             logger.warning(f"Invalid sourceBin type: {type(source_bin_data)}, using empty list")
             source_bin_data = []
-        source_bin = SourceBin.from_list(source_bin_data)
+        source_bin = SourceBin.from_list(source_bin_data, lazy=lazy)
 
         # Extract timeline
         timeline_data = data.get("timeline", {})
         if not isinstance(timeline_data, dict):
             logger.warning(f"Invalid timeline type: {type(timeline_data)}, using empty dict")
             timeline_data = {}
-        timeline = Timeline.from_dict(timeline_data)
+        timeline = Timeline.from_dict(timeline_data, lazy=lazy)
 
         # Log version info
         logger.info(
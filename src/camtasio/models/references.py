@@ -0,0 +1,266 @@
+# this_file: src/camtasio/models/references.py
+"""Reverse index from source bin items to the timeline media that use them."""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from .composite import CompositeMedia
+from .media import Media
+from .timeline import MediaPath, Timeline, Track, walk_media
+
+
+@dataclass
+class _TrackEntry:
+    """Indexed state of one track."""
+
+    track: Track
+    revision: int
+    count: int
+    sources: set[int]
+
+
+@dataclass
+class MediaReferenceIndex:
+    """Reverse index from source bin item ids to the media referencing them.
+
+    Media nested in Groups, StitchedMedia and UnifiedMedia are indexed under
+    the timeline track that holds their outermost container, in one
+    depth-first pass per track. Each track is indexed separately. Every lookup compares the tracks with
+    their indexed state (identity, ``Track.revision`` and media count) and
+    re-indexes only those that changed, so media added or removed through the
+    track API, appended to ``Track.medias`` directly or whole tracks added or
+    removed are picked up automatically at O(tracks) cost. Media replaced in
+    place (``track.medias[i] = other``) and edits inside composite media are
+    not detected; call ``invalidate()`` after such edits.
+
+    ``add_media()`` and ``remove_media()`` edit a track and update the index
+    incrementally, so bulk edits never re-index a track.
+    """
+
+    timeline: Timeline
+    _sources: dict[int, dict[int, list[Media]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _entries: list[_TrackEntry | None] = field(default_factory=list, init=False, repr=False)
+
+    def refresh(self) -> None:
+        """Re-index tracks that changed since the last lookup."""
+        tracks = self.timeline.tracks
+        for position, track in enumerate(tracks):
+            entry = self._entries[position] if position < len(self._entries) else None
+            if (
+                entry is None
+                or entry.track is not track
+                or entry.revision != track.revision
+                or entry.count != len(track.medias)
+            ):
+                self._index_track(position, track)
+        for position in range(len(tracks), len(self._entries)):
+            self._drop_track(position)
+        del self._entries[len(tracks) :]
+
+    def invalidate(self) -> None:
+        """Discard the index so the next lookup rebuilds it."""
+        self._sources.clear()
+        self._entries.clear()
+
+    def find(self, source_id: int) -> list[tuple[int, Media]]:
+        """Find the media referencing a source bin item.
+
+        Args:
+            source_id: Source bin item ID
+
+        Returns:
+            List of (track position, media) tuples in track order, including
+            nested media
+        """
+        self.refresh()
+        by_track = self._sources.get(source_id, {})
+        return [(position, media) for position in sorted(by_track) for media in by_track[position]]
+
+    def is_used(self, source_id: int) -> bool:
+        """Check whether any timeline media references a source bin item."""
+        self.refresh()
+        return source_id in self._sources
+
+    def used_source_ids(self) -> set[int]:
+        """IDs of all source bin items referenced on the timeline."""
+        self.refresh()
+        return set(self._sources)
+
+    def add_media(self, position: int, media: Media) -> None:
+        """Append media to a track and index it.
+
+        Args:
+            position: Position of the track in ``timeline.tracks``
+            media: Media to append
+        """
+        self.refresh()
+        track = self.timeline.tracks[position]
+        track.add_media(media)
+        for _, item in walk_media((media,)):
+            if not isinstance(item, CompositeMedia):
+                self._add(position, item)
+        self._sync_entry(position, track)
+
+    def remove_media(self, position: int, media: Media) -> None:
+        """Remove media from a track and from the index.
+
+        Nested media are removed from their container. A UnifiedMedia is
+        removed as a whole when its video or audio is removed. Removing
+        composite or nested media re-indexes the track.
+
+        Args:
+            position: Position of the track in ``timeline.tracks``
+            media: Media to remove (matched by identity)
+
+        Raises:
+            ValueError: If the media is not on the track
+        """
+        self.refresh()
+        track = self.timeline.tracks[position]
+        path = next((path for path, item in track.iter_media() if item is media), None)
+        if path is None:
+            raise ValueError(f"Media {media.id} is not on track {track.track_index}")
+        if len(path) > 1 or isinstance(media, CompositeMedia):
+            _remove_nested(path, media)
+            self._index_track(position, track)
+            return
+
+        track.remove_media(media)
+        by_track = self._sources[media.src]
+        medias = by_track[position]
+        medias.remove(next(m for m in medias if m is media))
+        if not medias:
+            del by_track[position]
+            entry = self._entries[position]
+            if entry is not None:
+                entry.sources.discard(media.src)
+            if not by_track:
+                del self._sources[media.src]
+        self._sync_entry(position, track)
+
+    def _add(self, position: int, media: Media) -> None:
+        self._sources.setdefault(media.src, {}).setdefault(position, []).append(media)
+        entry = self._entries[position]
+        if entry is not None:
+            entry.sources.add(media.src)
+
+    def _sync_entry(self, position: int, track: Track) -> None:
+        entry = self._entries[position]
+        if entry is not None:
+            entry.revision = track.revision
+            entry.count = len(track.medias)
+
+    def _index_track(self, position: int, track: Track) -> None:
+        if position < len(self._entries):
+            self._drop_track(position)
+        else:
+            self._entries.extend([None] * (position + 1 - len(self._entries)))
+        self._entries[position] = _TrackEntry(track, track.revision, len(track.medias), set())
+        for _, media in track.iter_media():
+            # Composites reference no source; their nested media do
+            if not isinstance(media, CompositeMedia):
+                self._add(position, media)
+
+    def _drop_track(self, position: int) -> None:
+        entry = self._entries[position]
+        if entry is None:
+            return
+        for source_id in entry.sources:
+            by_track = self._sources[source_id]
+            del by_track[position]
+            if not by_track:
+                del self._sources[source_id]
+        self._entries[position] = None
+
+
+def _remove_nested(path: MediaPath, media: Media) -> None:
+    """Remove media from the innermost container on its path."""
+    for depth in range(len(path) - 1, -1, -1):
+        container = path[depth]
+        if isinstance(container, Track):
+            container.remove_media(media)
+            return
+        if isinstance(container, CompositeMedia) and container.remove_child(media):
+            return
+        # The container can't exist without the media; remove the container
+        media = container
+
+
+def _dict_list(value: Any) -> list[dict[str, Any]]:
+    """Dictionaries in ``value`` if it is a list, else nothing."""
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def _track_media_dicts(tracks: Any) -> Iterator[Any]:
+    """Raw media values on a list of track dictionaries."""
+    if isinstance(tracks, list):
+        for track in tracks:
+            if isinstance(track, dict):
+                medias = track.get("medias")
+                if isinstance(medias, list):
+                    yield from medias
+
+
+def _nested_media_dicts(media: dict[str, Any]) -> Iterator[Any]:
+    """Raw media values nested in a media dictionary."""
+    # Groups hold tracks, StitchedMedia a media list, UnifiedMedia video/audio
+    yield from _track_media_dicts(media.get("tracks"))
+    medias = media.get("medias")
+    if isinstance(medias, list):
+        yield from medias
+    for key in ("video", "audio"):
+        if key in media:
+            yield media[key]
+
+
+def iter_media_dicts(tracks: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Yield every media dictionary on the given tracks.
+
+    Media nested in Groups, StitchedMedia and UnifiedMedia are yielded after
+    their container. The walk is depth-first and lazy: it keeps one iterator
+    per open container and copies no media lists.
+
+    Args:
+        tracks: Track dictionaries in ``.tscproj`` layout
+
+    Yields:
+        Media dictionaries in document order
+    """
+    stack = [_track_media_dicts(tracks)]
+    while stack:
+        for media in stack[-1]:
+            if isinstance(media, dict):
+                yield media
+                stack.append(_nested_media_dicts(media))
+                break
+        else:
+            stack.pop()
+
+
+def find_used_source_ids(project_data: dict[str, Any]) -> set[Any]:
+    """Collect the source bin IDs referenced anywhere on a project's timeline.
+
+    Args:
+        project_data: Project dictionary in ``.tscproj`` layout
+
+    Returns:
+        Set of ``src`` values, including those of nested media
+    """
+    timeline = project_data.get("timeline")
+    if not isinstance(timeline, dict):
+        return set()
+    scene_track = timeline.get("sceneTrack")
+    scenes = _dict_list(scene_track.get("scenes")) if isinstance(scene_track, dict) else []
+    used = set()
+    for scene in scenes:
+        csml = scene.get("csml")
+        if isinstance(csml, dict):
+            for media in iter_media_dicts(_dict_list(csml.get("tracks"))):
+                if "src" in media:
+                    used.add(media["src"])
+    return used
@@ -1,11 +1,14 @@
 # this_file: src/camtasio/models/source.py
 """Source media models for Camtasia projects."""
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+from .lazy import LazyList
 
-@dataclass
+
+@dataclass(slots=True)
 class SourceTrack:
     """Represents a track within a source media item."""
 
@@ -86,7 +89,7 @@ class SourceTrack:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceItem:
     """Represents a source media item in the source bin."""
 
@@ -132,39 +135,13 @@ class SourceItem:
             int(self.rect[3] * factor),
         ]
 
-        new_tracks = []
-        for track in self.source_tracks:
-            new_track_rect = [
-                int(track.track_rect[0] * factor),
-                int(track.track_rect[1] * factor),
-                int(track.track_rect[2] * factor),
-                int(track.track_rect[3] * factor),
-            ]
-            new_track = SourceTrack(
-                range=track.range,
-                type=track.type,
-                edit_rate=track.edit_rate,
-                track_rect=new_track_rect,
-                sample_rate=track.sample_rate,
-                bit_depth=track.bit_depth,
-                num_channels=track.num_channels,
-                integrated_lufs=track.integrated_lufs,
-                peak_level=track.peak_level,
-                meta_data=track.meta_data,
-                parameters=track.parameters,
-                tag=track.tag,
-            )
-            new_tracks.append(new_track)
-
-        return SourceItem(
-            id=self.id,
-            src=self.src,
-            rect=new_rect,
-            last_mod=self.last_mod,
-            source_tracks=new_tracks,
-            loudness_normalization=self.loudness_normalization,
-            metadata=self.metadata.copy(),
-        )
+        new_tracks = [
+            replace(track, track_rect=[int(value * factor) for value in track.track_rect[:4]])
+            for track in self.source_tracks
+        ]
+
+        # Metadata and track parameters are shared with this item
+        return replace(self, rect=new_rect, source_tracks=new_tracks)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -211,6 +188,21 @@ class SourceBin:
         """Add a source item to the bin."""
         self.items.append(item)
 
+    def remove_items(self, item_ids: Iterable[int]) -> list[SourceItem]:
+        """Remove source items by ID in a single pass.
+
+        Args:
+            item_ids: IDs of the items to remove
+
+        Returns:
+            The removed items, in bin order
+        """
+        ids = set(item_ids)
+        removed = [item for item in self.items if item.id in ids]
+        if removed:
+            self.items = [item for item in self.items if item.id not in ids]
+        return removed
+
     def scale_spatial(self, factor: float) -> "SourceBin":
         """Return new SourceBin with all items scaled."""
         return SourceBin(items=[item.scale_spatial(factor) for item in self.items])
@@ -220,6 +212,16 @@ class SourceBin:
         return [item.to_dict() for item in self.items]
 
     @classmethod
-    def from_list(cls, data: list[dict[str, Any]]) -> "SourceBin":
-        """Create SourceBin from list of dictionaries."""
+    def from_list(cls, data: list[dict[str, Any]], lazy: bool = False) -> "SourceBin":
+        """Create SourceBin from list of dictionaries.
+
+        Args:
+            data: List of source item dictionaries
+            lazy: Decode items only when first accessed
+
+        Returns:
+            New SourceBin instance
+        """
+        if lazy:
+            return cls(items=LazyList(data, SourceItem.from_dict))
         return cls(items=[SourceItem.from_dict(item) for item in data])
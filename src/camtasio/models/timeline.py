@@ -1,14 +1,51 @@
 # this_file: src/camtasio/models/timeline.py
 """Timeline and track models for Camtasia projects."""
 
-from dataclasses import dataclass, field
-from typing import Any, Self, cast
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from typing import Any, Self, TypeAlias
 
+from .composite import CompositeMedia
 from .factory import create_media_from_dict
+from .intervals import IntervalIndex
+from .lazy import LazyList
 from .media import Media
 
-
-@dataclass
+# Containers enclosing a media item, outermost first: the timeline track, then
+# each enclosing composite media and, inside Groups, the nested track
+MediaPath: TypeAlias = tuple["Track | Media", ...]
+
+
+def walk_media(medias: Iterable[Media], path: MediaPath = ()) -> Iterator[tuple[MediaPath, Media]]:
+    """Walk media and everything nested in them depth-first.
+
+    Each item is yielded before the media nested in it. The walk keeps one
+    iterator per open container and shares each path tuple between siblings,
+    so no list of the visited media is built.
+
+    Args:
+        medias: Media to walk
+        path: Containers enclosing ``medias``
+
+    Yields:
+        (path, media) tuples in document order
+    """
+    stack: list[tuple[MediaPath, Iterator[Media]]] = [(path, iter(medias))]
+    while stack:
+        path, remaining = stack[-1]
+        for media in remaining:
+            yield path, media
+            if isinstance(media, CompositeMedia):
+                # Push in reverse so the first container is walked first
+                for track, nested in reversed(media.nested()):
+                    suffix = (media,) if track is None else (media, track)
+                    stack.append((path + suffix, iter(nested)))
+                break
+        else:
+            stack.pop()
+
+
+@dataclass(slots=True)
 class Transition:
     """Represents a transition between media items."""
 
@@ -20,13 +57,7 @@ class Transition:
 
     def scale_temporal(self, factor: float) -> Self:
         """Scale transition duration."""
-        return self.__class__(
-            name=self.name,
-            duration=int(self.duration * factor),
-            left_media=self.left_media,
-            right_media=self.right_media,
-            attributes=self.attributes.copy(),
-        )
+        return replace(self, duration=int(self.duration * factor))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -53,7 +84,7 @@ class Transition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """Represents a track on the timeline."""
 
@@ -68,18 +99,119 @@ class Track:
     matte: int = 0
     solo: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Bumped by add_media/remove_media so caches can detect changes
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    _intervals: IntervalIndex | None = field(default=None, init=False, repr=False, compare=False)
 
     def add_media(self, media: Media) -> None:
         """Add a media item to the track."""
+        index = self._current_intervals()
         self.medias.append(media)
+        self.revision += 1
+        if index is not None and index.append(media):
+            index.revision = self.revision
+
+    def remove_media(self, media: Media) -> None:
+        """Remove a media item from the track.
+
+        Args:
+            media: Media item to remove (matched by identity)
+
+        Raises:
+            ValueError: If the media item is not on the track
+        """
+        for index, item in enumerate(self.medias):
+            if item is media:
+                del self.medias[index]
+                self.revision += 1
+                return
+        raise ValueError(f"Media {media.id} is not on track {self.track_index}")
+
+    def iter_media(self, recursive: bool = True) -> Iterator[tuple[MediaPath, Media]]:
+        """Iterate over the media on this track.
+
+        Args:
+            recursive: Also yield the media nested in Groups, StitchedMedia
+                and UnifiedMedia, each after its container
+
+        Yields:
+            (path, media) tuples in document order; ``path`` starts with this
+            track
+        """
+        path: MediaPath = (self,)
+        if recursive:
+            yield from walk_media(self.medias, path)
+        else:
+            for media in self.medias:
+                yield path, media
 
     def add_transition(self, transition: Transition) -> None:
         """Add a transition to the track."""
         self.transitions.append(transition)
 
+    @property
+    def intervals(self) -> IntervalIndex:
+        """Interval index over the track's media.
+
+        Built on first use and kept in sync by ``add_media``; rebuilt after
+        ``remove_media`` or changes to the length of the media list. Call
+        ``invalidate_intervals()`` after changing the timing of media on the
+        track in place or replacing items of ``medias``.
+        """
+        index = self._current_intervals()
+        if index is None:
+            index = self._intervals = IntervalIndex(list(self.medias), self.revision)
+        return index
+
+    def invalidate_intervals(self) -> None:
+        """Discard the cached interval index."""
+        self._intervals = None
+
+    def _current_intervals(self) -> IntervalIndex | None:
+        """The cached interval index if it matches the media list."""
+        index = self._intervals
+        if (
+            index is None
+            or index.revision != self.revision
+            or len(index.medias) != len(self.medias)
+        ):
+            return None
+        return index
+
+    def media_at(self, time: int) -> list[Media]:
+        """Media playing at ``time``, sorted by start.
+
+        Args:
+            time: Timeline position in edit-rate ticks
+
+        Returns:
+            Media with ``start <= time < start + duration``
+        """
+        return self.intervals.at(time)
+
+    def media_in_range(self, start: int, end: int) -> list[Media]:
+        """Media overlapping the half-open range ``[start, end)``, sorted by start.
+
+        Args:
+            start: Range start in edit-rate ticks
+            end: Range end in edit-rate ticks
+
+        Returns:
+            Media with ``media.start < end`` and ``media.start + media.duration > start``
+        """
+        return self.intervals.overlapping(start, end)
+
+    def find_overlaps(self) -> list[tuple[Media, Media]]:
+        """Pairs of media on this track whose time ranges overlap."""
+        return self.intervals.overlaps()
+
     @property
     def duration(self) -> int:
-        """Calculate track duration from media items."""
+        """Calculate track duration from media items.
+
+        Computed from the current media on every call rather than from the
+        interval index, so in-place timing edits are always reflected.
+        """
         if not self.medias:
             return 0
         return max(media.start + media.duration for media in self.medias)
@@ -90,41 +222,27 @@ class Track:
         return len(self.medias)
 
     def scale_spatial(self, factor: float) -> Self:
-        """Scale all spatial properties in the track."""
-        return cast(
-            Self,
-            Track(
-                track_index=self.track_index,
-                medias=[media.scale_spatial(factor) for media in self.medias],
-                transitions=self.transitions.copy(),  # Transitions don't have spatial properties
-                parameters=self.parameters.copy(),
-                ident=self.ident,
-                audio_muted=self.audio_muted,
-                video_hidden=self.video_hidden,
-                magnetic=self.magnetic,
-                matte=self.matte,
-                solo=self.solo,
-                metadata=self.metadata.copy(),
-            ),
+        """Scale all spatial properties in the track.
+
+        Parameters and metadata are shared with this track. The transitions
+        are shared but held in a new list, so ``add_transition`` on either
+        track leaves the other unchanged.
+        """
+        return replace(
+            self,
+            medias=[media.scale_spatial(factor) for media in self.medias],
+            transitions=list(self.transitions),
         )
 
     def scale_temporal(self, factor: float) -> Self:
-        """Scale all temporal properties in the track."""
-        return cast(
-            Self,
-            Track(
-                track_index=self.track_index,
-                medias=[media.scale_temporal(factor) for media in self.medias],
-                transitions=[t.scale_temporal(factor) for t in self.transitions],
-                parameters=self.parameters.copy(),
-                ident=self.ident,
-                audio_muted=self.audio_muted,
-                video_hidden=self.video_hidden,
-                magnetic=self.magnetic,
-                matte=self.matte,
-                solo=self.solo,
-                metadata=self.metadata.copy(),
-            ),
+        """Scale all temporal properties in the track.
+
+        Parameters and metadata are shared with this track.
+        """
+        return replace(
+            self,
+            medias=[media.scale_temporal(factor) for media in self.medias],
+            transitions=[t.scale_temporal(factor) for t in self.transitions],
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -154,6 +272,49 @@ class Track:
 
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> Self:
+        """Create Track from dictionary.
+
+        Args:
+            data: Dictionary containing track data
+            lazy: Decode media and transitions only when first accessed
+
+        Returns:
+            New Track instance
+        """
+        medias: list[Media]
+        transitions: list[Transition]
+        if lazy:
+            medias = LazyList(data.get("medias", []), create_media_from_dict)
+            transitions = LazyList(data.get("transitions", []), Transition.from_dict)
+        else:
+            # Parse media items
+            medias = []
+            for media_dict in data.get("medias", []):
+                media = create_media_from_dict(media_dict)
+                medias.append(media)
+
+            # Parse transitions
+            transitions = []
+            for trans_dict in data.get("transitions", []):
+                transition = Transition.from_dict(trans_dict)
+                transitions.append(transition)
+
+        return cls(
+            track_index=data.get("trackIndex", 0),
+            medias=medias,
+            transitions=transitions,
+            parameters=data.get("parameters", {}),
+            ident=data.get("ident", ""),
+            audio_muted=data.get("audioMuted", False),
+            video_hidden=data.get("videoHidden", False),
+            magnetic=data.get("magnetic", False),
+            matte=data.get("matte", 0),
+            solo=data.get("solo", False),
+            metadata=data.get("metadata", {}),
+        )
+
 
 @dataclass
 class Timeline:
@@ -179,6 +340,30 @@ class Timeline:
         """Total media items across all tracks."""
         return sum(track.media_count for track in self.tracks)
 
+    def media_at(self, time: int) -> list[tuple[Track, Media]]:
+        """Media playing at ``time`` on any track.
+
+        Args:
+            time: Timeline position in edit-rate ticks
+
+        Returns:
+            List of (track, media) tuples in track order
+        """
+        return [(track, media) for track in self.tracks for media in track.media_at(time)]
+
+    def iter_media(self, recursive: bool = True) -> Iterator[tuple[MediaPath, Media]]:
+        """Iterate over the media on all tracks in one depth-first pass.
+
+        Args:
+            recursive: Also yield the media nested in Groups, StitchedMedia
+                and UnifiedMedia, each after its container
+
+        Yields:
+            (path, media) tuples in track order; ``path[0]`` is the track
+        """
+        for track in self.tracks:
+            yield from track.iter_media(recursive)
+
     def get_track(self, index: int) -> Track | None:
         """Get track by index."""
         for track in self.tracks:
@@ -192,23 +377,11 @@ class Timeline:
 
     def scale_spatial(self, factor: float) -> Self:
         """Scale all spatial properties in the timeline."""
-        return cast(
-            Self,
-            Timeline(
-                id=self.id,
-                tracks=[track.scale_spatial(factor) for track in self.tracks],
-            ),
-        )
+        return replace(self, tracks=[track.scale_spatial(factor) for track in self.tracks])
 
     def scale_temporal(self, factor: float) -> Self:
         """Scale all temporal properties in the timeline."""
-        return cast(
-            Self,
-            Timeline(
-                id=self.id,
-                tracks=[track.scale_temporal(factor) for track in self.tracks],
-            ),
-        )
+        return replace(self, tracks=[track.scale_temporal(factor) for track in self.tracks])
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -221,10 +394,18 @@ class Timeline:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        """Create Timeline from dictionary."""
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> Self:
+        """Create Timeline from dictionary.
+
+        Args:
+            data: Dictionary containing timeline data
+            lazy: Decode tracks only when first accessed
+
+        Returns:
+            New Timeline instance
+        """
         timeline_id = data.get("id", 0)
-        tracks = []
+        tracks: list[Track] = []
 
         # Navigate the nested structure
         scene_track = data.get("sceneTrack", {})
@@ -233,32 +414,15 @@ class Timeline:
             csml = scenes[0].get("csml", {})
             track_data = csml.get("tracks", [])
 
-            for track_dict in track_data:
-                # Parse media items
-                medias = []
-                for media_dict in track_dict.get("medias", []):
-                    media = create_media_from_dict(media_dict)
-                    medias.append(media)
-
-                # Parse transitions
-                transitions = []
-                for trans_dict in track_dict.get("transitions", []):
-                    transition = Transition.from_dict(trans_dict)
-                    transitions.append(transition)
-
-                track = Track(
-                    track_index=track_dict.get("trackIndex", 0),
-                    medias=medias,
-                    transitions=transitions,
-                    parameters=track_dict.get("parameters", {}),
-                    ident=track_dict.get("ident", ""),
-                    audio_muted=track_dict.get("audioMuted", False),
-                    video_hidden=track_dict.get("videoHidden", False),
-                    magnetic=track_dict.get("magnetic", False),
-                    matte=track_dict.get("matte", 0),
-                    solo=track_dict.get("solo", False),
-                    metadata=track_dict.get("metadata", {}),
-                )
-                tracks.append(track)
+            if lazy:
+                tracks = LazyList(track_data, _lazy_track_from_dict)
+            else:
+                for track_dict in track_data:
+                    tracks.append(Track.from_dict(track_dict))
 
         return cls(id=timeline_id, tracks=tracks)
+
+
+def _lazy_track_from_dict(data: dict[str, Any]) -> Track:
+    """Decode a track whose media are decoded lazily as well."""
+    return Track.from_dict(data, lazy=True)
@@ -6,16 +6,63 @@ including scaling, transforming, and other complex modifications.
 """
 # this_file: src/camtasio/operations/__init__.py
 
-from camtasio.operations.media_operations import (
-    add_media_to_track,
-    duplicate_media,
-    find_media_references,
-    remove_media,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from camtasio.operations.media_operations import (
+        add_media_to_track,
+        duplicate_media,
+        find_media_references,
+        remove_media,
+        remove_unused_media,
+    )
+    from camtasio.operations.project_summary import (
+        ProjectSummary,
+        load_summary,
+        summarize_project,
+    )
+
+# Public names mapped to the module they are imported from on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "add_media_to_track",
+            "duplicate_media",
+            "find_media_references",
+            "remove_media",
+            "remove_unused_media",
+        ),
+        "camtasio.operations.media_operations",
+    ),
+    **dict.fromkeys(
+        ("ProjectSummary", "load_summary", "summarize_project"),
+        "camtasio.operations.project_summary",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
+    "ProjectSummary",
     "add_media_to_track",
     "duplicate_media",
     "find_media_references",
+    "load_summary",
     "remove_media",
+    "remove_unused_media",
+    "summarize_project",
 ]
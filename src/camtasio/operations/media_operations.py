@@ -7,6 +7,8 @@ from typing import Any
 
 from loguru import logger
 
+from camtasio.models import Project, SourceItem
+
 
 def add_media_to_track(
     project: Any,
@@ -53,11 +55,13 @@ def add_media_to_track(
     logger.info(f"Successfully added media {media_id} to track {track_index}")
 
 
-def remove_media(project: Any, media_id: str, clear_tracks: bool = True) -> None:
+def remove_media(project: Any, media_id: str | int, clear_tracks: bool = True) -> None:
     """Remove media from the media bin and optionally from all tracks.
 
     By default, this removes all references to the media from tracks.
     Set clear_tracks=False to prevent removal if track references exist.
+    For a ``Project`` the media is a source bin item and its references are
+    looked up in ``Project.references``.
 
     Args:
         project: The Camtasia project instance
@@ -70,6 +74,10 @@ def remove_media(project: Any, media_id: str, clear_tracks: bool = True) -> None
     """
     logger.debug(f"Removing media {media_id} from project (clear_tracks={clear_tracks})")
 
+    if isinstance(project, Project):
+        _remove_source_item(project, int(media_id), clear_tracks)
+        return
+
     # Validate media exists
     if media_id not in project.media_bin:
         raise KeyError(f"Media ID {media_id} not found in media bin")
@@ -141,9 +149,12 @@ def duplicate_media(project: Any, source_media_id: str, new_media_id: str | None
     return new_media_id
 
 
-def find_media_references(project: Any, media_id: str) -> list[tuple[int, str]]:
+def find_media_references(project: Any, media_id: str | int) -> list[tuple[int, Any]]:
     """Find all track references to a media bin item.
 
+    For a ``Project`` the media is a source bin item and the references come
+    from the memoized ``Project.references`` index instead of a timeline scan.
+
     Args:
         project: The Camtasia project instance
         media_id: ID of the media to search for
@@ -154,10 +165,16 @@ def find_media_references(project: Any, media_id: str) -> list[tuple[int, str]]:
     Raises:
         KeyError: If media ID not found
     """
+    if isinstance(project, Project):
+        source_id = int(media_id)
+        if project.source_bin.get_by_id(source_id) is None:
+            raise KeyError(f"Media ID {media_id} not found in source bin")
+        return [(position, media.id) for position, media in project.references.find(source_id)]
+
     if media_id not in project.media_bin:
         raise KeyError(f"Media ID {media_id} not found in media bin")
 
-    references = []
+    references: list[tuple[int, Any]] = []
     for track_idx, track in enumerate(project.timeline.tracks):
         for track_media_id, track_media in track.medias.items():
             if hasattr(track_media, "source") and track_media.source == media_id:
@@ -165,3 +182,46 @@ def find_media_references(project: Any, media_id: str) -> list[tuple[int, str]]:
 
     logger.debug(f"Found {len(references)} references to media {media_id}")
     return references
+
+
+def remove_unused_media(project: Project) -> list[SourceItem]:
+    """Remove all source bin items that no timeline media references.
+
+    Usage is looked up in ``Project.references`` and the bin is filtered in a
+    single pass, so the cost is linear in the number of items.
+
+    Args:
+        project: The Camtasia project instance
+
+    Returns:
+        The removed source items
+    """
+    references = project.references
+    unused = [item.id for item in project.source_bin.items if not references.is_used(item.id)]
+    removed = project.source_bin.remove_items(unused)
+    logger.info(f"Removed {len(removed)} unused media from source bin")
+    return removed
+
+
+def _remove_source_item(project: Project, source_id: int, clear_tracks: bool) -> None:
+    """Remove a source bin item and, optionally, the media referencing it."""
+    if project.source_bin.get_by_id(source_id) is None:
+        raise KeyError(f"Media ID {source_id} not found in source bin")
+
+    references = project.references.find(source_id)
+    if references and not clear_tracks:
+        raise ValueError(
+            f"Cannot remove media {source_id}: found {len(references)} "
+            f"track references and clear_tracks=False"
+        )
+
+    # Removing nested media can take other references with their container,
+    # as with both halves of a UnifiedMedia, so look them up again each time
+    while references:
+        position, media = references[0]
+        project.references.remove_media(position, media)
+        logger.debug(f"Removed track media {media.id} from track {position}")
+        references = project.references.find(source_id)
+
+    project.source_bin.remove_items([source_id])
+    logger.info(f"Successfully removed media {source_id} from project")
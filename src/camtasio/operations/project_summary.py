@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""Precomputed project statistics shared by the inspection commands."""
+# this_file: src/camtasio/operations/project_summary.py
+
+import hashlib
+import json
+import os
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from camtasio.serialization import cache_enabled, default_cache_dir, load_json_file, loads_json
+from camtasio.serialization.cache import content_digest
+
+# Bumped whenever the summary layout changes; older sidecars are recomputed
+SUMMARY_VERSION = 1
+
+# Subdirectory of the cache directory holding the summary sidecars
+SUMMARY_DIR = "summaries"
+
+# Suffix of the sidecar file names
+SIDECAR_SUFFIX = ".summary.json"
+
+# Clips per track kept for detailed listings
+PREVIEW_CLIPS = 5
+
+
+@dataclass
+class MediaSummary:
+    """A source bin entry.
+
+    Attributes:
+        name: ``name`` of the entry, "Unnamed" if absent
+        type: ``_type`` of the entry, "Unknown" if absent
+        src: Media file path, or None if the entry has no ``src``
+    """
+
+    name: Any = "Unnamed"
+    type: Any = "Unknown"
+    src: Any = None
+
+
+@dataclass
+class ClipSummary:
+    """A media item on a timeline track."""
+
+    name: Any = "Unnamed"
+    start: Any = 0
+    duration: Any = 0
+
+
+@dataclass
+class TrackSummary:
+    """Statistics of one timeline track.
+
+    Attributes:
+        track_type: ``trackType`` of the track, "Unknown" if absent
+        media_count: Number of media items
+        effect_count: Number of effects over all media items
+        duration: Latest end time of any media item
+        clips: The first ``PREVIEW_CLIPS`` media items
+    """
+
+    track_type: Any = "Unknown"
+    media_count: int = 0
+    effect_count: int = 0
+    duration: Any = 0
+    clips: list[ClipSummary] = field(default_factory=list)
+
+
+@dataclass
+class MarkerSummary:
+    """A timeline marker."""
+
+    name: Any = "Unnamed"
+    time: Any = 0
+    type: Any = "Unknown"
+
+
+@dataclass
+class ProjectSummary:
+    """Everything ``info``, ``analyze``, ``media_ls``, ``track_ls`` and ``marker_ls`` show.
+
+    Attributes:
+        version: Raw ``version`` of the project
+        width: Canvas width, "Unknown" if absent
+        height: Canvas height, "Unknown" if absent
+        framerate: Canvas frame rate, "Unknown" if absent
+        media: Source bin entries
+        has_scenes: Whether the timeline has any scene
+        tracks: Tracks of the first scene
+        markers: Timeline markers
+        fingerprint: Path, size, modification time and content hash of the
+            file the summary was computed from
+    """
+
+    version: Any = ""
+    width: Any = "Unknown"
+    height: Any = "Unknown"
+    framerate: Any = "Unknown"
+    media: list[MediaSummary] = field(default_factory=list)
+    has_scenes: bool = False
+    tracks: list[TrackSummary] = field(default_factory=list)
+    markers: list[MarkerSummary] = field(default_factory=list)
+    fingerprint: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def media_count(self) -> int:
+        """Number of source bin entries."""
+        return len(self.media)
+
+    @property
+    def media_types(self) -> dict[Any, int]:
+        """Number of source bin entries per ``_type``."""
+        return dict(Counter(item.type for item in self.media))
+
+    @property
+    def track_types(self) -> dict[Any, int]:
+        """Number of tracks per ``trackType``."""
+        return dict(Counter(track.track_type for track in self.tracks))
+
+    @property
+    def total_clips(self) -> int:
+        """Number of media items over all tracks."""
+        return sum(track.media_count for track in self.tracks)
+
+    @property
+    def total_effects(self) -> int:
+        """Number of effects over all media items."""
+        return sum(track.effect_count for track in self.tracks)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {"summaryVersion": SUMMARY_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProjectSummary":
+        """Create summary from dictionary.
+
+        Raises:
+            ValueError: If the data was written by another summary version
+        """
+        if data.get("summaryVersion") != SUMMARY_VERSION:
+            raise ValueError(f"Unsupported summary version: {data.get('summaryVersion')}")
+        return cls(
+            version=data["version"],
+            width=data["width"],
+            height=data["height"],
+            framerate=data["framerate"],
+            media=[MediaSummary(**item) for item in data["media"]],
+            has_scenes=data["has_scenes"],
+            tracks=[
+                TrackSummary(
+                    **{key: value for key, value in track.items() if key != "clips"},
+                    clips=[ClipSummary(**clip) for clip in track["clips"]],
+                )
+                for track in data["tracks"]
+            ],
+            markers=[MarkerSummary(**marker) for marker in data["markers"]],
+            fingerprint=data["fingerprint"],
+        )
+
+
+def summarize_project(project_data: dict[str, Any]) -> ProjectSummary:
+    """Compute the summary of a project dictionary in one pass.
+
+    Args:
+        project_data: Raw project data
+
+    Returns:
+        Summary without fingerprint
+    """
+    timeline = project_data.get("timeline", {})
+    scene_track = timeline.get("sceneTrack", {})
+    canvas = scene_track.get("timeline", {})
+    scenes = scene_track.get("scenes", [])
+
+    summary = ProjectSummary(
+        version=project_data.get("version", ""),
+        width=canvas.get("width", "Unknown"),
+        height=canvas.get("height", "Unknown"),
+        framerate=canvas.get("framerate", "Unknown"),
+        has_scenes=bool(scenes),
+    )
+
+    for item in project_data.get("sourceBin", []):
+        summary.media.append(
+            MediaSummary(
+                name=item.get("name", "Unnamed"),
+                type=item.get("_type", "Unknown"),
+                src=item.get("src"),
+            )
+        )
+
+    for track in scenes[0].get("csml", {}).get("tracks", []) if scenes else []:
+        medias = track.get("medias", [])
+        duration = 0
+        effect_count = 0
+        for media in medias:
+            duration = max(duration, media.get("start", 0) + media.get("duration", 0))
+            effect_count += len(media.get("effects", []))
+        summary.tracks.append(
+            TrackSummary(
+                track_type=track.get("trackType", "Unknown"),
+                media_count=len(medias),
+                effect_count=effect_count,
+                duration=duration,
+                clips=[
+                    ClipSummary(
+                        name=media.get("name", "Unnamed"),
+                        start=media.get("start", 0),
+                        duration=media.get("duration", 0),
+                    )
+                    for media in medias[:PREVIEW_CLIPS]
+                ],
+            )
+        )
+
+    for marker in timeline.get("markers", []):
+        summary.markers.append(
+            MarkerSummary(
+                name=marker.get("name", "Unnamed"),
+                time=marker.get("time", 0),
+                type=marker.get("type", "Unknown"),
+            )
+        )
+
+    return summary
+
+
+def sidecar_path(project_path: str | Path) -> Path:
+    """Path of the summary sidecar of a project file.
+
+    Sidecars live in the cache directory rather than next to the project, so
+    inspecting a project never writes into its folder or ``.cmproj`` bundle.
+
+    Args:
+        project_path: Path to .tscproj file
+
+    Returns:
+        ``<cache dir>/summaries/<hash of the resolved path>.summary.json``
+    """
+    name = hashlib.sha256(os.fsencode(Path(project_path).resolve())).hexdigest()[:32]
+    return default_cache_dir() / SUMMARY_DIR / f"{name}{SIDECAR_SUFFIX}"
+
+
+def clear_summaries() -> int:
+    """Remove every summary sidecar.
+
+    Returns:
+        Number of sidecars removed
+    """
+    removed = 0
+    try:
+        sidecars = list((default_cache_dir() / SUMMARY_DIR).glob(f"*{SIDECAR_SUFFIX}"))
+    except OSError:
+        return 0
+    for sidecar in sidecars:
+        try:
+            sidecar.unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+def load_summary(project_path: str | Path, use_sidecar: bool | None = None) -> ProjectSummary:
+    """Summary of a project file, read from its sidecar when still current.
+
+    The sidecar is current if it was computed for the same path and the
+    project's size and modification time match its fingerprint, or if only
+    the modification time changed and the content hash still matches.
+    Otherwise the project is parsed, summarized and the sidecar rewritten;
+    failing to write it is not an error.
+
+    Args:
+        project_path: Path to .tscproj file
+        use_sidecar: Read and write the sidecar (default: unless the
+            ``CAMTASIO_CACHE`` environment variable disables caching)
+
+    Returns:
+        Project summary
+
+    Raises:
+        FileNotFoundError: If the project file doesn't exist
+    """
+    path = Path(project_path)
+    if use_sidecar is None:
+        use_sidecar = cache_enabled()
+    stat = path.stat()
+
+    if not use_sidecar:
+        return summarize_project(load_json_file(path))
+
+    resolved = str(path.resolve())
+    sidecar = sidecar_path(path)
+    cached = _read_sidecar(sidecar)
+    raw = None
+    if (
+        cached is not None
+        and cached.fingerprint.get("path") == resolved
+        and cached.fingerprint.get("size") == stat.st_size
+    ):
+        if cached.fingerprint.get("mtime_ns") == stat.st_mtime_ns:
+            return cached
+        raw = path.read_bytes()
+        if cached.fingerprint.get("digest") == content_digest(raw):
+            cached.fingerprint["mtime_ns"] = stat.st_mtime_ns
+            _write_sidecar(sidecar, cached)
+            return cached
+
+    logger.debug(f"Computing project summary for {path}")
+    if raw is None:
+        raw = path.read_bytes()
+    summary = summarize_project(loads_json(raw))
+    summary.fingerprint = {
+        "path": resolved,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "digest": content_digest(raw),
+    }
+    _write_sidecar(sidecar, summary)
+    return summary
+
+
+def _read_sidecar(sidecar: Path) -> ProjectSummary | None:
+    try:
+        with open(sidecar, encoding="utf-8") as f:
+            return ProjectSummary.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable summary {sidecar}: {e}")
+        return None
+
+
+def _write_sidecar(sidecar: Path, summary: ProjectSummary) -> None:
+    tmp_path = sidecar.with_name(f".{sidecar.name}.{uuid.uuid4().hex[:12]}.tmp")
+    try:
+        sidecar.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, "x", encoding="utf-8") as f:
+            json.dump(summary.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, sidecar)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write summary {sidecar}: {e}")
+        tmp_path.unlink(missing_ok=True)
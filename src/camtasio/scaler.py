@@ -1,13 +1,20 @@
 # this_file: src/camtasio/scaler.py
 """Core scaling functionality for Camtasia .tscproj files."""
 
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from loguru import logger
 
 from .serialization import load_json_file, save_json_file
 
+if TYPE_CHECKING:
+    from .transforms.index import PropertyIndex
+
+# Exact types of JSON scalars
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class TscprojScaler:
     """Handles scaling of Camtasia project files."""
@@ -38,15 +45,19 @@ class TscprojScaler:
     # Special array properties that contain dimensions
     DIMENSION_ARRAYS: ClassVar[set[str]] = {"rect", "trackRect"}
 
-    def __init__(self, scale_factor: float, verbose: bool = False):
+    def __init__(self, scale_factor: float, verbose: bool = False, in_place: bool = False):
         """Initialize the scaler with a scale factor.
 
         Args:
             scale_factor: The scaling factor (e.g., 1.5 for 150%)
             verbose: Enable verbose logging
+            in_place: Mutate the input tree instead of building a scaled copy
         """
         self.scale_factor = scale_factor
         self.verbose = verbose
+        self.in_place = in_place
+        self._handlers = self._compile_handlers()
+        self._plain_keys: set[str] = set()
         if verbose:
             logger.enable("tscprojpy")
         else:
@@ -78,69 +89,99 @@ class TscprojScaler:
 
         logger.success(f"Successfully scaled project by {self.scale_factor}x")
 
+    def scale_data(
+        self, data: dict[str, Any], index: "PropertyIndex | None" = None
+    ) -> dict[str, Any]:
+        """Scale a loaded project dictionary.
+
+        Args:
+            data: Project dictionary
+            index: Index built with PropertyIndex.build_for_scaler(). When
+                given, only the indexed leaves are visited.
+
+        Returns:
+            Scaled dictionary
+        """
+        if index is None:
+            return cast(dict[str, Any], self._scale_object(data))
+        if index.rules != "scaler":
+            raise ValueError(f"Index was built for {index.rules!r} rules, expected 'scaler'")
+        logger.debug(f"Scaling {len(index.spatial)} indexed properties")
+        return index.scale_spatial(data, self.scale_factor, in_place=self.in_place)
+
     def _scale_object(self, obj: Any, path: str = "") -> Any:
         """Recursively scale an object.
 
         Args:
             obj: The object to scale (dict, list, or primitive)
-            path: Current path in the object hierarchy (for logging)
+            path: Current path in the object hierarchy for logging
 
         Returns:
             The scaled object
         """
         if isinstance(obj, dict):
-            return self._scale_dict(obj, path)
+            return self._scale_dict(obj, path, path.rsplit(".", 1)[-1])
         elif isinstance(obj, list):
             return self._scale_list(obj, path)
         else:
             return obj
 
-    def _scale_dict(self, d: dict[str, Any], path: str) -> dict[str, Any]:
+    def _compile_handlers(self) -> dict[str, Callable[..., Any]]:
+        """Map each property with a scaling rule to its handler."""
+        handlers: dict[str, Callable[..., Any]] = {}
+        # Assigned from the lowest to the highest precedence
+        handlers["keyframes"] = self._handle_keyframes
+        handlers.update(dict.fromkeys(self.SCALE_PROPERTIES, self._handle_scale_property))
+        handlers.update(dict.fromkeys(self.DIMENSION_ARRAYS, self._handle_dimension_array))
+        handlers["def"] = self._handle_def
+        return handlers
+
+    def _handler(self, key: str) -> Callable[..., Any] | None:
+        """Handler of a property, classifying keys on first sight."""
+        handler = self._handlers.get(key)
+        if handler is None and key not in self._plain_keys:
+            # Default dimension properties in metadata
+            if key.startswith("default-") and any(
+                prop in key for prop in ["width", "height", "scale", "translation"]
+            ):
+                handler = self._handlers[key] = self._handle_default_property
+            else:
+                self._plain_keys.add(key)
+        return handler
+
+    def _scale_dict(self, d: dict[str, Any], path: str, parent: str = "") -> dict[str, Any]:
         """Scale a dictionary object.
 
+        Each key is dispatched through a table of handlers built once per
+        scaler. A dict whose keys are all known to have no rule and whose
+        values are all scalars needs no scaling and is copied, or returned
+        as is in in-place mode, without a Python-level loop over its items.
+
         Args:
             d: Dictionary to scale
             path: Current path for logging
+            parent: Key under which ``d`` is stored, used to find the
+                property a keyframes list belongs to
 
         Returns:
-            Scaled dictionary
+            Scaled dictionary (``d`` itself in in-place mode)
         """
-        result: dict[str, Any] = {}
+        if self._plain_keys.issuperset(d) and _SCALAR_TYPES.issuperset(map(type, d.values())):
+            return d if self.in_place else d.copy()
+
+        # Reassigning existing keys during iteration is safe for in-place mode
+        result: dict[str, Any] = d if self.in_place else {}
 
         for key, value in d.items():
-            current_path = f"{path}.{key}" if path else key
-
-            # Check if this is a special def object with dimensions
-            if key == "def" and isinstance(value, dict):
-                result[key] = self._scale_def_object(value, current_path)
-            # Check if this is a dimension array
-            elif key in self.DIMENSION_ARRAYS and isinstance(value, list):
-                result[key] = self._scale_dimension_array(value, current_path)
-            # Check if this is a scalable property
-            elif key in self.SCALE_PROPERTIES and isinstance(value, int | float):
-                result[key] = self._scale_value(key, value, current_path)
-            # Check for keyframes that might contain scalable values
-            elif key == "keyframes" and isinstance(value, list):
-                result[key] = self._scale_keyframes(value, current_path)
-            # Check for default dimension properties in metadata
-            elif key.startswith("default-") and any(
-                prop in key for prop in ["width", "height", "scale", "translation"]
-            ):
-                if isinstance(value, dict) and "value" in value:
-                    scaled_dict = value.copy()
-                    prop_name = key.replace("default-", "")
-                    if prop_name in self.SCALE_PROPERTIES:
-                        scaled_dict["value"] = self._scale_value(
-                            prop_name, value["value"], current_path
-                        )
-                        result[key] = scaled_dict
-                    else:
-                        result[key] = value
-                else:
-                    result[key] = value
-            else:
-                # Recursively process nested objects
-                result[key] = self._scale_object(value, current_path)
+            handler = self._handler(key)
+            if handler is not None:
+                result[key] = handler(key, value, f"{path}.{key}" if path else key, parent)
+            elif isinstance(value, dict):
+                result[key] = self._scale_dict(value, f"{path}.{key}" if path else key, key)
+            elif isinstance(value, list):
+                result[key] = self._scale_list(value, f"{path}.{key}" if path else key)
+            elif not self.in_place:
+                result[key] = value
 
         return result
 
@@ -152,9 +193,66 @@ class TscprojScaler:
             path: Current path for logging
 
         Returns:
-            Scaled list
+            Scaled list (``lst`` itself in in-place mode)
         """
-        return [self._scale_object(item, f"{path}[{i}]") for i, item in enumerate(lst)]
+        if _SCALAR_TYPES.issuperset(map(type, lst)):
+            return lst if self.in_place else lst.copy()
+        if self.in_place:
+            for i, item in enumerate(lst):
+                lst[i] = self._scale_item(item, f"{path}[{i}]")
+            return lst
+        return [self._scale_item(item, f"{path}[{i}]") for i, item in enumerate(lst)]
+
+    def _scale_item(self, item: Any, path: str) -> Any:
+        """Scale a list item; items have no parent key."""
+        if isinstance(item, dict):
+            return self._scale_dict(item, path)
+        if isinstance(item, list):
+            return self._scale_list(item, path)
+        return item
+
+    def _descend(self, key: str, value: Any, path: str) -> Any:
+        """Scale the value of a property whose rule does not apply to it."""
+        if isinstance(value, dict):
+            return self._scale_dict(value, path, key)
+        if isinstance(value, list):
+            return self._scale_list(value, path)
+        return value
+
+    def _handle_def(self, key: str, value: Any, path: str, parent: str) -> Any:
+        """Scale a callout definition object."""
+        if isinstance(value, dict):
+            return self._scale_def_object(value, path)
+        return self._descend(key, value, path)
+
+    def _handle_dimension_array(self, key: str, value: Any, path: str, parent: str) -> Any:
+        """Scale a rect or trackRect array."""
+        if isinstance(value, list):
+            return self._scale_dimension_array(value, path)
+        return self._descend(key, value, path)
+
+    def _handle_scale_property(self, key: str, value: Any, path: str, parent: str) -> Any:
+        """Scale a numeric dimension property."""
+        if isinstance(value, int | float):
+            return self._scale_value(key, value, path)
+        return self._descend(key, value, path)
+
+    def _handle_keyframes(self, key: str, value: Any, path: str, parent: str) -> Any:
+        """Scale the keyframes of an animated dimension property."""
+        if isinstance(value, list):
+            # Keys may contain dots; the path's last segment names the property
+            return self._scale_keyframes(value, path, parent.rsplit(".", 1)[-1])
+        return self._descend(key, value, path)
+
+    def _handle_default_property(self, key: str, value: Any, path: str, parent: str) -> Any:
+        """Scale the value of a default dimension property in metadata."""
+        if isinstance(value, dict) and "value" in value:
+            prop_name = key.replace("default-", "")
+            if prop_name in self.SCALE_PROPERTIES:
+                scaled_dict = value if self.in_place else value.copy()
+                scaled_dict["value"] = self._scale_value(prop_name, value["value"], path)
+                return scaled_dict
+        return value
 
     def _scale_value(self, property_name: str, value: int | float, path: str) -> int | float:
         """Scale a single numeric value based on property type.
@@ -192,6 +290,9 @@ class TscprojScaler:
             # Scale all four values (x, y, width, height)
             scaled = [v * self.scale_factor if isinstance(v, int | float) else v for v in arr]
             logger.debug(f"Scaling array {path}: {arr} -> {scaled}")
+            if self.in_place:
+                arr[:] = scaled
+                return arr
             return scaled
         else:
             logger.warning(f"Unexpected array length at {path}: {len(arr)}")
@@ -207,45 +308,53 @@ class TscprojScaler:
         Returns:
             Scaled definition object
         """
-        result = def_obj.copy()
+        result = def_obj if self.in_place else def_obj.copy()
 
         # Scale specific properties in def objects
         for prop in ["width", "height", "corner-radius", "stroke-width"]:
             if prop in result and isinstance(result[prop], int | float):
-                result[prop] = result[prop] * self.scale_factor
-                logger.debug(f"Scaling {path}.{prop}: {def_obj[prop]} -> {result[prop]}")
+                original = result[prop]
+                result[prop] = original * self.scale_factor
+                logger.debug(f"Scaling {path}.{prop}: {original} -> {result[prop]}")
 
         return result
 
-    def _scale_keyframes(self, keyframes: list[Any], path: str) -> list[Any]:
+    def _scale_keyframes(
+        self, keyframes: list[Any], path: str, parent_prop: str | None = None
+    ) -> list[Any]:
         """Scale keyframe values if they contain scalable properties.
 
         Args:
             keyframes: List of keyframe objects
             path: Current path for logging
+            parent_prop: Property the keyframes animate; derived from
+                ``path`` if not given
 
         Returns:
             List of scaled keyframe objects
         """
-        result = []
+        if parent_prop is None:
+            parent_prop = path.split(".")[-2] if "." in path else ""
+        scalable = parent_prop in self.SCALE_PROPERTIES
+        result = keyframes if self.in_place else []
 
         for i, keyframe in enumerate(keyframes):
             if isinstance(keyframe, dict):
-                scaled_keyframe = keyframe.copy()
+                scaled_keyframe = keyframe if self.in_place else keyframe.copy()
 
                 # Check if the keyframe has a value that should be scaled
-                if "value" in scaled_keyframe and isinstance(scaled_keyframe["value"], int | float):
-                    # Determine if this keyframe is for a scalable property
-                    # by checking the parent path
-                    parent_prop = path.split(".")[-2] if "." in path else ""
-
-                    if parent_prop in self.SCALE_PROPERTIES:
-                        scaled_keyframe["value"] = self._scale_value(
-                            parent_prop, keyframe["value"], f"{path}[{i}].value"
-                        )
-
-                result.append(scaled_keyframe)
-            else:
+                if (
+                    scalable
+                    and "value" in scaled_keyframe
+                    and isinstance(scaled_keyframe["value"], int | float)
+                ):
+                    scaled_keyframe["value"] = self._scale_value(
+                        parent_prop, keyframe["value"], f"{path}[{i}].value"
+                    )
+
+                if not self.in_place:
+                    result.append(scaled_keyframe)
+            elif not self.in_place:
                 result.append(keyframe)
 
         return result
@@ -1,22 +1,91 @@
 # this_file: src/camtasio/serialization/__init__.py
 """Serialization and deserialization for Camtasia projects."""
 
-from .json_encoder import CamtasiaJSONEncoder
-from .json_handler import dumps_json, load_json_file, loads_json, save_json_file
-from .loader import ProjectLoader
-from .saver import ProjectSaver
-from .version import ProjectVersion, detect_version, get_version_features, is_supported_version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import ParseCache, cache_enabled, default_cache_dir, load_json_cached
+    from .incremental import TrackedDocument, make_pointer
+    from .json_encoder import CamtasiaJSONEncoder, sanitize_floats
+    from .json_handler import (
+        dumps_json,
+        iter_json_bytes,
+        load_json_file,
+        loads_json,
+        save_json_file,
+        write_atomic,
+    )
+    from .loader import ProjectLoader
+    from .saver import ProjectSaver
+    from .streaming import StreamEvent, StreamingProjectLoader, iter_project_events
+    from .version import ProjectVersion, detect_version, get_version_features, is_supported_version
+
+# Public names mapped to the module they are imported from on first access, so
+# that reading JSON doesn't load the domain models
+_LAZY_IMPORTS: dict[str, str] = {
+    **dict.fromkeys(
+        ("ParseCache", "cache_enabled", "default_cache_dir", "load_json_cached"), ".cache"
+    ),
+    **dict.fromkeys(("TrackedDocument", "make_pointer"), ".incremental"),
+    **dict.fromkeys(("CamtasiaJSONEncoder", "sanitize_floats"), ".json_encoder"),
+    **dict.fromkeys(
+        (
+            "dumps_json",
+            "iter_json_bytes",
+            "load_json_file",
+            "loads_json",
+            "save_json_file",
+            "write_atomic",
+        ),
+        ".json_handler",
+    ),
+    "ProjectLoader": ".loader",
+    "ProjectSaver": ".saver",
+    **dict.fromkeys(("StreamEvent", "StreamingProjectLoader", "iter_project_events"), ".streaming"),
+    **dict.fromkeys(
+        ("ProjectVersion", "detect_version", "get_version_features", "is_supported_version"),
+        ".version",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "CamtasiaJSONEncoder",
+    "ParseCache",
     "ProjectLoader",
     "ProjectSaver",
     "ProjectVersion",
+    "StreamEvent",
+    "StreamingProjectLoader",
+    "TrackedDocument",
+    "cache_enabled",
+    "default_cache_dir",
     "detect_version",
     "dumps_json",
     "get_version_features",
     "is_supported_version",
+    "iter_json_bytes",
+    "iter_project_events",
+    "load_json_cached",
     "load_json_file",
     "loads_json",
+    "make_pointer",
+    "sanitize_floats",
     "save_json_file",
+    "write_atomic",
 ]
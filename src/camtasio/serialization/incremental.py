@@ -0,0 +1,361 @@
+# this_file: src/camtasio/serialization/incremental.py
+"""Incremental re-save of loaded project documents.
+
+A ``TrackedDocument`` keeps the raw bytes a project was loaded from together
+with the span each subtree occupied in them. When the document is written
+back, every subtree that is still the object that was loaded and has not been
+marked dirty is copied from the original bytes; only changed subtrees are
+encoded again. Small edits to very large projects therefore cost little more
+than the file I/O.
+
+Spans are recorded for the entries of the containers named in
+``STREAM_LAYOUT`` (root properties, source items, timeline properties and
+individual media), so the unit of re-encoding is a single media or source
+item. Replacing a value or adding and removing list entries is detected
+automatically; changes made *inside* a loaded subtree must be reported with
+``TrackedDocument.mark_dirty``.
+"""
+
+import json
+from collections.abc import Callable, Iterator, Sequence
+from functools import partial
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from json.scanner import make_scanner
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .json_encoder import sanitize_floats
+from .json_handler import HAS_ORJSON, STREAM_LAYOUT, _orjson_dumps, _reindent
+
+if HAS_ORJSON:
+    import orjson
+
+_WHITESPACE = " \t\n\r"
+
+# Loaded value and its [start, end) span in the source text
+_Span = tuple[Any, int, int]
+
+
+class TrackedDocument:
+    """A JSON document loaded together with the source spans of its subtrees.
+
+    Attributes:
+        data: The decoded document; edit it like any loaded project dictionary
+        source: Raw bytes the document was decoded from
+        path: File the document was loaded from, if any
+    """
+
+    def __init__(self, source: bytes, path: Path | None = None):
+        """Decode a document and record the spans of its subtrees.
+
+        Args:
+            source: UTF-8 encoded JSON text
+            path: File the bytes were read from
+
+        Raises:
+            json.JSONDecodeError: If the source is not valid JSON
+        """
+        self.source = source
+        self.path = path
+        self._text = source.decode("utf-8")
+        # Byte offsets equal character offsets for ASCII-only sources
+        self._ascii = len(self._text) == len(source)
+        # Dict containers: id -> (dict, {key: span}); lists: id -> (list, {id(item): span})
+        self._slots: dict[int, tuple[Any, dict[Any, _Span]]] = {}
+        self._dirty: list[str] = []
+        self._special_float = False
+        decoder = json.JSONDecoder(parse_constant=self._parse_constant)
+        self._scan_once = make_scanner(decoder)  # type: ignore[arg-type]
+        self.data: Any = self._parse_root()
+
+    @classmethod
+    def load(cls, file_path: str | Path) -> "TrackedDocument":
+        """Load a document from a file.
+
+        Args:
+            file_path: Path to a ``.tscproj`` file
+
+        Returns:
+            Tracked document for the file
+        """
+        path = Path(file_path)
+        logger.debug(f"Loading tracked document from: {path}")
+        return cls(path.read_bytes(), path)
+
+    @property
+    def dirty_pointers(self) -> list[str]:
+        """JSON pointers marked dirty since the document was loaded."""
+        return list(self._dirty)
+
+    def mark_dirty(self, pointer: str | Sequence[str | int]) -> None:
+        """Report an in-place change below a loaded subtree.
+
+        The subtree at the pointer and every subtree on the path to it are
+        re-encoded on the next save. Pointers that no longer resolve (for
+        example because the entry was removed) only invalidate the part of the
+        path that still exists.
+
+        Args:
+            pointer: RFC 6901 JSON pointer such as ``"/sourceBin/3/src"``, or
+                the sequence of keys and list indices it consists of
+        """
+        tokens = _split_pointer(pointer) if isinstance(pointer, str) else list(pointer)
+        self._dirty.append(pointer if isinstance(pointer, str) else make_pointer(tokens))
+
+        node = self.data
+        for token in tokens:
+            entry = self._slots.get(id(node))
+            try:
+                if isinstance(node, list):
+                    child = node[int(token)]
+                    slot_key: Any = id(child)
+                else:
+                    child = node[token]
+                    slot_key = token
+            except (KeyError, IndexError, TypeError, ValueError):
+                return
+            if entry is not None and entry[0] is node:
+                entry[1].pop(slot_key, None)
+            node = child
+        self._forget(node)
+
+    def iter_bytes(
+        self, indent: int = 2, ensure_ascii: bool = False, sanitize: bool = True
+    ) -> Iterator[bytes]:
+        """Serialize the current document, reusing the spans of clean subtrees.
+
+        The output has the same structure as ``iter_json_bytes``; reused
+        subtrees keep the formatting they had in the source, so re-saving a
+        file written by ``save_json_file`` with the same options produces
+        exactly the bytes a full save would.
+
+        Args:
+            indent: Indentation level
+            ensure_ascii: Whether to escape non-ASCII characters
+            sanitize: Replace NaN and infinite floats with values Camtasia accepts
+
+        Yields:
+            Consecutive pieces of the JSON document
+        """
+        dumps, unit = _make_dumps(indent, ensure_ascii, sanitize)
+        # Raw non-ASCII text cannot be reused when the output must be ASCII
+        reuse = self._ascii or not ensure_ascii
+        stats = [0, 0]
+        yield from self._iter_chunks(self.data, STREAM_LAYOUT, 0, dumps, unit, reuse, stats)
+        logger.debug(f"Reused {stats[0]} and re-encoded {stats[1]} subtrees")
+
+    def _forget(self, node: Any) -> None:
+        """Drop the recorded spans of every subtree below a layout container."""
+        entry = self._slots.get(id(node))
+        if entry is None or entry[0] is not node:
+            return
+        entry[1].clear()
+        for child in node.values() if isinstance(node, dict) else node:
+            if isinstance(child, dict | list):
+                self._forget(child)
+
+    def _parse_constant(self, name: str) -> float:
+        self._special_float = True
+        return float(name)
+
+    def _skip(self, idx: int) -> int:
+        text = self._text
+        while idx < len(text) and text[idx] in _WHITESPACE:
+            idx += 1
+        return idx
+
+    def _parse_root(self) -> Any:
+        idx = self._skip(0)
+        value, idx = self._parse(idx, STREAM_LAYOUT)
+        idx = self._skip(idx)
+        if idx != len(self._text):
+            raise json.JSONDecodeError("Extra data", self._text, idx)
+        return value
+
+    def _parse(self, idx: int, layout: dict[str, Any] | None) -> tuple[Any, int]:
+        """Decode the value at ``idx``, descending into layout containers."""
+        text = self._text
+        if idx < len(text):
+            if text[idx] == "{" and layout:
+                return self._parse_object(idx, layout)
+            if text[idx] == "[":
+                return self._parse_array(idx, layout)
+        return self._scan(idx)
+
+    def _scan(self, idx: int) -> tuple[Any, int]:
+        try:
+            value, end = self._scan_once(self._text, idx)
+        except StopIteration:
+            raise json.JSONDecodeError("Expecting value", self._text, idx) from None
+        return value, end
+
+    def _leaf(self, idx: int, slots: dict[Any, _Span], slot_key: Any = None) -> tuple[Any, int]:
+        """Decode a value that is reused whole and record its span."""
+        self._special_float = False
+        value, end = self._scan(idx)
+        # Spans holding NaN or infinities are re-encoded so they get sanitized
+        if not self._special_float:
+            slots[id(value) if slot_key is None else slot_key] = (value, idx, end)
+        return value, end
+
+    def _parse_object(self, idx: int, layout: dict[str, Any]) -> tuple[Any, int]:
+        text = self._text
+        obj: dict[str, Any] = {}
+        slots: dict[Any, _Span] = {}
+        self._slots[id(obj)] = (obj, slots)
+        idx = self._skip(idx + 1)
+        if idx < len(text) and text[idx] == "}":
+            return obj, idx + 1
+        while True:
+            if idx >= len(text) or text[idx] != '"':
+                raise json.JSONDecodeError(
+                    "Expecting property name enclosed in double quotes", text, idx
+                )
+            key, idx = scanstring(text, idx + 1)
+            idx = self._skip(idx)
+            if idx >= len(text) or text[idx] != ":":
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, idx)
+            idx = self._skip(idx + 1)
+            if key in layout and idx < len(text) and text[idx] in "{[":
+                obj[key], idx = self._parse(idx, layout[key])
+            else:
+                obj[key], idx = self._leaf(idx, slots, key)
+            idx = self._skip(idx)
+            if idx < len(text) and text[idx] == ",":
+                idx = self._skip(idx + 1)
+            elif idx < len(text) and text[idx] == "}":
+                return obj, idx + 1
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+    def _parse_array(self, idx: int, layout: dict[str, Any] | None) -> tuple[Any, int]:
+        text = self._text
+        items: list[Any] = []
+        slots: dict[Any, _Span] = {}
+        self._slots[id(items)] = (items, slots)
+        idx = self._skip(idx + 1)
+        if idx < len(text) and text[idx] == "]":
+            return items, idx + 1
+        while True:
+            if layout and idx < len(text) and text[idx] == "{":
+                item, idx = self._parse(idx, layout)
+            else:
+                item, idx = self._leaf(idx, slots)
+            items.append(item)
+            idx = self._skip(idx)
+            if idx < len(text) and text[idx] == ",":
+                idx = self._skip(idx + 1)
+            elif idx < len(text) and text[idx] == "]":
+                return items, idx + 1
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+    def _span_bytes(self, start: int, end: int) -> bytes:
+        if self._ascii:
+            return self.source[start:end]
+        return self._text[start:end].encode("utf-8")
+
+    def _slots_of(self, obj: Any) -> dict[Any, _Span]:
+        entry = self._slots.get(id(obj))
+        return entry[1] if entry is not None and entry[0] is obj else {}
+
+    def _iter_chunks(
+        self,
+        obj: Any,
+        layout: dict[str, Any] | None,
+        depth: int,
+        dumps: Callable[[Any], bytes],
+        unit: bytes,
+        reuse: bool,
+        stats: list[int],
+    ) -> Iterator[bytes]:
+        """Yield ``obj`` at nesting ``depth`` the way ``json_handler._iter_chunks`` does."""
+        newline = b"\n" + unit * depth if unit else b""
+        inner = b"\n" + unit * (depth + 1) if unit else b""
+
+        def leaf(value: Any, span: _Span | None) -> bytes:
+            if reuse and span is not None and span[0] is value:
+                stats[0] += 1
+                return self._span_bytes(span[1], span[2])
+            stats[1] += 1
+            return _reindent(dumps(value), inner)
+
+        if (
+            layout
+            and isinstance(obj, dict)
+            and obj
+            and all(type(key) is str for key in obj)
+            and not layout.keys().isdisjoint(obj)
+        ):
+            slots = self._slots_of(obj)
+            separator = b": " if unit else b":"
+            prefix = b"{" + inner
+            for key, value in obj.items():
+                head = prefix + dumps(key) + separator
+                prefix = b"," + inner
+                if key in layout and isinstance(value, dict | list):
+                    yield head
+                    yield from self._iter_chunks(
+                        value, layout[key], depth + 1, dumps, unit, reuse, stats
+                    )
+                else:
+                    yield head + leaf(value, slots.get(key))
+            yield newline + b"}"
+        elif isinstance(obj, list) and obj:
+            slots = self._slots_of(obj)
+            prefix = b"[" + inner
+            for item in obj:
+                if layout and isinstance(item, dict):
+                    yield prefix
+                    yield from self._iter_chunks(item, layout, depth + 1, dumps, unit, reuse, stats)
+                else:
+                    yield prefix + leaf(item, slots.get(id(item)))
+                prefix = b"," + inner
+            yield newline + b"]"
+        else:
+            yield _reindent(dumps(obj), newline)
+
+
+def make_pointer(tokens: Sequence[str | int]) -> str:
+    """Build an RFC 6901 JSON pointer from keys and list indices.
+
+    Args:
+        tokens: Path from the document root
+
+    Returns:
+        Pointer such as ``"/timeline/sceneTrack"``
+    """
+    return "".join("/" + str(token).replace("~", "~0").replace("/", "~1") for token in tokens)
+
+
+def _split_pointer(pointer: str) -> list[str]:
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _make_dumps(
+    indent: int, ensure_ascii: bool, sanitize: bool
+) -> tuple[Callable[[Any], bytes], bytes]:
+    """Encoder for single subtrees and the indentation unit it uses."""
+    if HAS_ORJSON and not ensure_ascii:
+        # Same options as iter_json_bytes
+        options = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            options |= orjson.OPT_INDENT_2
+        unit = b"  " if indent == 2 else b""
+        return partial(_orjson_dumps, options=options, sanitize=sanitize), unit
+
+    def dumps(value: Any) -> bytes:
+        if sanitize:
+            value = sanitize_floats(value)
+        text = json.dumps(
+            value, indent=indent or None, ensure_ascii=ensure_ascii, separators=(",", ": ")
+        )
+        return text.encode("utf-8")
+
+    return dumps, b" " * indent if indent else b""
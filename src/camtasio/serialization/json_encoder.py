@@ -8,39 +8,71 @@ from typing import Any
 
 from loguru import logger
 
+# Largest finite float; Camtasia rejects infinities, so they are clamped to it
+MAX_SAFE_FLOAT = 1.7976931348623157e308
+
+
+def sanitize_floats(obj: Any) -> Any:
+    """Replace NaN and infinite floats with values Camtasia accepts.
+
+    Infinities become the largest finite float of the same sign and NaN
+    becomes 0.0. Containers are copied only along the paths to replaced
+    values; when nothing needs replacing the original object is returned
+    unchanged, so checking a clean tree allocates nothing.
+
+    Args:
+        obj: JSON-compatible value
+
+    Returns:
+        Sanitized value, ``obj`` itself if it contains no special floats
+    """
+    if isinstance(obj, float):
+        if math.isinf(obj):
+            if obj < 0:
+                logger.warning("Converting -Infinity to safe minimum value")
+                return -MAX_SAFE_FLOAT
+            logger.warning("Converting Infinity to safe maximum value")
+            return MAX_SAFE_FLOAT
+        if math.isnan(obj):
+            logger.warning("Converting NaN to 0.0")
+            return 0.0
+        return obj
+    if isinstance(obj, dict):
+        changed: dict[Any, Any] | None = None
+        for key, value in obj.items():
+            if isinstance(value, float | dict | list):
+                new_value = sanitize_floats(value)
+                if new_value is not value:
+                    if changed is None:
+                        changed = dict(obj)
+                    changed[key] = new_value
+        return obj if changed is None else changed
+    if isinstance(obj, list):
+        changed_list: list[Any] | None = None
+        for index, item in enumerate(obj):
+            if isinstance(item, float | dict | list):
+                new_item = sanitize_floats(item)
+                if new_item is not item:
+                    if changed_list is None:
+                        changed_list = list(obj)
+                    changed_list[index] = new_item
+        return obj if changed_list is None else changed_list
+    return obj
+
 
 class CamtasiaJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles special float values for Camtasia."""
 
     # Maximum negative value that Camtasia seems to accept
     # Use slightly smaller than the max to avoid infinity
-    MIN_SAFE_FLOAT = -1.7976931348623157e308
-
-    def encode(self, o: Any) -> str:
-        """Encode object to JSON string."""
-        # First, preprocess the object to handle special values
-        processed = self._preprocess(o)
-        return super().encode(processed)
+    MIN_SAFE_FLOAT = -MAX_SAFE_FLOAT
 
     def _preprocess(self, obj: Any) -> Any:
-        """Preprocess object to handle special float values."""
-        if isinstance(obj, float):
-            if math.isinf(obj):
-                if obj < 0:
-                    logger.warning("Converting -Infinity to safe minimum value")
-                    return self.MIN_SAFE_FLOAT
-                else:
-                    logger.warning("Converting Infinity to safe maximum value")
-                    return -self.MIN_SAFE_FLOAT  # Positive max
-            elif math.isnan(obj):
-                logger.warning("Converting NaN to 0.0")
-                return 0.0
-            return obj
-        elif isinstance(obj, dict):
-            return {k: self._preprocess(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._preprocess(item) for item in obj]
-        return obj
+        """Preprocess object to handle special float values.
+
+        Unchanged containers are returned as-is rather than rebuilt.
+        """
+        return sanitize_floats(obj)
 
     def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
         """Encode object to JSON string iteratively."""
@@ -2,6 +2,11 @@
 """Centralized JSON handling with orjson support."""
 
 import json
+import os
+import stat
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,6 +19,20 @@ except ImportError:
 
 from loguru import logger
 
+from .json_encoder import sanitize_floats
+
+# Containers written element by element instead of as one blob: the path
+# from the root to every source item and to every track's media list. Dict
+# values map child keys to descend into; for lists they apply to each item,
+# and None means the items are serialized whole.
+STREAM_LAYOUT: dict[str, Any] = {
+    "sourceBin": None,
+    "timeline": {"sceneTrack": {"scenes": {"csml": {"tracks": {"medias": None}}}}},
+}
+
+# Write buffer size for the output file
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def load_json_file(file_path: str | Path) -> dict[str, Any]:
     """Load JSON from file using orjson if available.
@@ -37,47 +56,201 @@ def load_json_file(file_path: str | Path) -> dict[str, Any]:
 
 
 def save_json_file(
-    data: dict[str, Any], file_path: str | Path, indent: int = 2, ensure_ascii: bool = False
+    data: dict[str, Any],
+    file_path: str | Path,
+    indent: int = 2,
+    ensure_ascii: bool = False,
+    sanitize: bool = True,
 ) -> None:
     """Save JSON to file using orjson if available.
 
+    The document is streamed in chunks into a temporary file in the target
+    directory, which is fsynced and then atomically renamed over the target.
+    A crash mid-write therefore never leaves a truncated project behind, and
+    the serialized document is never held in memory as a whole.
+
     Args:
         data: Data to save
         file_path: Path to save to
         indent: Indentation level (only 2 supported with orjson)
         ensure_ascii: Whether to escape non-ASCII characters
+        sanitize: Replace NaN and infinite floats with values Camtasia accepts
     """
     path = Path(file_path)
 
     if HAS_ORJSON:
         logger.debug("Using orjson for faster JSON serialization")
-        # orjson handles formatting differently
-        options = orjson.OPT_INDENT_2 if indent == 2 else 0
-        if not ensure_ascii:
-            options |= orjson.OPT_NON_STR_KEYS
-
-        # orjson returns bytes, so we write in binary mode
-        with open(path, "wb") as f:
-            f.write(orjson.dumps(data, option=options))
+        chunks = iter_json_bytes(data, indent=indent, ensure_ascii=ensure_ascii, sanitize=sanitize)
     else:
         logger.debug("Using standard json library")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(
-                data,
-                f,
-                indent=indent,
-                ensure_ascii=ensure_ascii,
-                separators=(",", ": "),
-            )
+        if sanitize:
+            data = sanitize_floats(data)
+        encoder = json.JSONEncoder(indent=indent, ensure_ascii=ensure_ascii, separators=(",", ": "))
+        chunks = (chunk.encode("utf-8") for chunk in encoder.iterencode(data))
+
+    write_atomic(path, chunks)
+
+
+def iter_json_bytes(
+    data: dict[str, Any], indent: int = 2, ensure_ascii: bool = False, sanitize: bool = True
+) -> Iterator[bytes]:
+    """Serialize a project dictionary with orjson in chunks.
+
+    Containers named in ``STREAM_LAYOUT`` are emitted element by element, so each
+    source item and media entry is serialized separately. The concatenated
+    output is byte-identical to a single ``orjson.dumps`` call with the same
+    options.
+
+    Args:
+        data: Data to serialize
+        indent: Indentation level (only 2 supported with orjson)
+        ensure_ascii: Whether to escape non-ASCII characters
+        sanitize: Replace NaN and infinite floats with values Camtasia accepts
+
+    Yields:
+        Consecutive pieces of the JSON document
+    """
+    # orjson handles formatting differently
+    options = orjson.OPT_INDENT_2 if indent == 2 else 0
+    if not ensure_ascii:
+        options |= orjson.OPT_NON_STR_KEYS
+    pretty = bool(options & orjson.OPT_INDENT_2)
+    dumps = partial(_orjson_dumps, options=options, sanitize=sanitize)
+    return _iter_chunks(data, STREAM_LAYOUT, 0, dumps, pretty)
+
+
+def _orjson_dumps(value: Any, options: int, sanitize: bool) -> bytes:
+    """Serialize with orjson, sanitizing special floats only where present.
+
+    orjson writes NaN and infinities as ``null``. Only output containing that
+    token is checked for special floats, and only the containers holding one
+    are copied, so clean data costs a single substring search.
+    """
+    chunk: bytes = orjson.dumps(value, option=options)
+    if sanitize and b"null" in chunk:
+        clean = sanitize_floats(value)
+        if clean is not value:
+            chunk = orjson.dumps(clean, option=options)
+    return chunk
+
+
+def _iter_chunks(
+    obj: Any,
+    layout: dict[str, Any] | None,
+    depth: int,
+    dumps: Callable[[Any], bytes],
+    pretty: bool,
+) -> Iterator[bytes]:
+    """Yield the orjson serialization of ``obj`` at nesting ``depth``.
+
+    ``layout`` names the children of ``obj`` to stream further (see
+    ``STREAM_LAYOUT``); everything else is serialized in one call.
+    """
+    newline = b"\n" + b"  " * depth if pretty else b""
+    inner = b"\n" + b"  " * (depth + 1) if pretty else b""
+
+    if (
+        layout
+        and isinstance(obj, dict)
+        and obj
+        and all(type(key) is str for key in obj)
+        and not layout.keys().isdisjoint(obj)
+    ):
+        separator = b": " if pretty else b":"
+        prefix = b"{" + inner
+        for key, value in obj.items():
+            head = prefix + orjson.dumps(key) + separator
+            prefix = b"," + inner
+            if key in layout and isinstance(value, dict | list):
+                yield head
+                yield from _iter_chunks(value, layout[key], depth + 1, dumps, pretty)
+            else:
+                yield head + _reindent(dumps(value), inner)
+        yield newline + b"}"
+    elif isinstance(obj, list) and obj:
+        prefix = b"[" + inner
+        for item in obj:
+            if layout and isinstance(item, dict):
+                yield prefix
+                yield from _iter_chunks(item, layout, depth + 1, dumps, pretty)
+            else:
+                yield prefix + _reindent(dumps(item), inner)
+            prefix = b"," + inner
+        yield newline + b"]"
+    else:
+        yield _reindent(dumps(obj), newline)
+
+
+def _reindent(chunk: bytes, newline: bytes) -> bytes:
+    """Shift a pretty-printed chunk to start at the indentation of ``newline``.
+
+    orjson escapes newlines inside strings, so every raw newline in its output
+    is structural and can be replaced safely.
+    """
+    if len(newline) > 1 and b"\n" in chunk:
+        return chunk.replace(b"\n", newline)
+    return chunk
+
+
+def write_atomic(file_path: str | Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a file atomically.
+
+    Data goes to a temporary file next to the target, which is flushed,
+    fsynced and renamed over the target with ``os.replace``. The target keeps
+    its permission bits; on any error the temporary file is removed and the
+    original file is left untouched.
+
+    Args:
+        file_path: Destination path; symlinks are resolved so the link survives
+        chunks: Byte strings to write in order
+    """
+    path = Path(os.path.realpath(file_path))
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:12]}.tmp")
+
+    try:
+        with open(tmp_path, "xb", buffering=WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass  # New file keeps the umask-derived mode
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory where the platform allows it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
-def dumps_json(data: dict[str, Any], indent: int = 2, ensure_ascii: bool = False) -> str:
+def dumps_json(
+    data: dict[str, Any], indent: int = 2, ensure_ascii: bool = False, sanitize: bool = True
+) -> str:
     """Convert data to JSON string using orjson if available.
 
     Args:
         data: Data to serialize
         indent: Indentation level (only 2 supported with orjson)
         ensure_ascii: Whether to escape non-ASCII characters
+        sanitize: Replace NaN and infinite floats with values Camtasia accepts
 
     Returns:
         JSON string
@@ -86,6 +259,8 @@ def dumps_json(data: dict[str, Any], indent: int = 2, ensure_ascii: bool = False
         # orjson doesn't support ensure_ascii or custom indents
         # Fall back to standard json for these cases
         if ensure_ascii or (indent != 2 and indent is not None):
+            if sanitize:
+                data = sanitize_floats(data)
             return json.dumps(
                 data,
                 indent=indent,
@@ -95,9 +270,11 @@ def dumps_json(data: dict[str, Any], indent: int = 2, ensure_ascii: bool = False
         # Use orjson for fast serialization with standard options
         options = orjson.OPT_INDENT_2 if indent == 2 else 0
         options |= orjson.OPT_NON_STR_KEYS  # Allow non-string keys
-        result: str = orjson.dumps(data, option=options).decode("utf-8")
+        result: str = _orjson_dumps(data, options, sanitize).decode("utf-8")
         return result
     else:
+        if sanitize:
+            data = sanitize_floats(data)
         return json.dumps(
             data,
             indent=indent,
@@ -106,11 +283,11 @@ def dumps_json(data: dict[str, Any], indent: int = 2, ensure_ascii: bool = False
         )
 
 
-def loads_json(json_str: str) -> dict[str, Any]:
+def loads_json(json_str: str | bytes) -> dict[str, Any]:
     """Parse JSON string using orjson if available.
 
     Args:
-        json_str: JSON string to parse
+        json_str: JSON text to parse, as a string or UTF-8 bytes
 
     Returns:
         Parsed data
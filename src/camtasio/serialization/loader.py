@@ -14,13 +14,15 @@ from .version import is_supported_version
 class ProjectLoader:
     """Loads and deserializes Camtasia project files."""
 
-    def __init__(self, strict_version_check: bool = False):
+    def __init__(self, strict_version_check: bool = False, lazy: bool = False):
         """Initialize loader.
 
         Args:
             strict_version_check: If True, fail on unsupported versions
+            lazy: If True, decode tracks, media and source items on first access
         """
         self.strict_version_check = strict_version_check
+        self.lazy = lazy
 
     def load_file(self, file_path: str | Path) -> Project:
         """Load project from file.
@@ -60,6 +62,29 @@ class ProjectLoader:
         Raises:
             ValueError: If version is unsupported and strict checking is enabled
         """
+        self._check_data(data)
+
+        # Create project from dictionary
+        try:
+            project = Project.from_dict(data, lazy=self.lazy)
+            logger.info(f"Successfully loaded project (version {project.version})")
+            return project
+        except Exception as e:
+            logger.error(f"Failed to load project: {e}")
+            raise
+
+    def _check_data(self, data: dict[str, Any]) -> None:
+        """Validate structure and version before a project is built.
+
+        Problems are logged, and raised in strict mode.
+
+        Args:
+            data: Project dictionary data
+
+        Raises:
+            ValueError: If the structure is invalid or the version is
+                unsupported and strict checking is enabled
+        """
         # Validate structure first
         validation_errors = self.validate_structure(data)
         if validation_errors:
@@ -74,15 +99,6 @@ class ProjectLoader:
             else:
                 logger.warning("Loading unsupported version - some features may not work correctly")
 
-        # Create project from dictionary
-        try:
-            project = Project.from_dict(data)
-            logger.info(f"Successfully loaded project (version {project.version})")
-            return project
-        except Exception as e:
-            logger.error(f"Failed to load project: {e}")
-            raise
-
     def validate_structure(self, data: dict[str, Any]) -> list[str]:
         """Validate project structure and return any issues.
 
@@ -7,7 +7,8 @@ from typing import Any
 from loguru import logger
 
 from ..models import Project
-from .json_handler import dumps_json, save_json_file
+from .incremental import TrackedDocument
+from .json_handler import dumps_json, save_json_file, write_atomic
 
 
 class ProjectSaver:
@@ -62,6 +63,29 @@ class ProjectSaver:
         # Write JSON using centralized handler
         save_json_file(data, path, indent=self.indent, ensure_ascii=self.ensure_ascii)
 
+    def save_document(self, document: TrackedDocument, file_path: str | Path | None = None) -> None:
+        """Save a tracked document, re-encoding only its changed subtrees.
+
+        Args:
+            document: Document loaded with ``TrackedDocument.load``
+            file_path: Path to save to; defaults to the file it was loaded from
+
+        Raises:
+            ValueError: If no path is given and the document has no source file
+        """
+        if file_path is None:
+            if document.path is None:
+                raise ValueError("No file path given for a document not loaded from a file")
+            file_path = document.path
+        path = Path(file_path)
+
+        # Ensure parent directory exists
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Saving data to: {path} ({len(document.dirty_pointers)} changes)")
+
+        write_atomic(path, document.iter_bytes(indent=self.indent, ensure_ascii=self.ensure_ascii))
+
     def project_to_dict(self, project: Project) -> dict[str, Any]:
         """Convert project to dictionary for serialization.
 
@@ -0,0 +1,360 @@
+# this_file: src/camtasio/serialization/streaming.py
+"""Streaming, event-based loader for very large Camtasia projects.
+
+The regular loader parses the whole ``.tscproj`` document into one dict tree
+before any model object is built. For multi-hour recordings that tree can be
+hundreds of megabytes. The streaming loader instead walks the document
+incrementally: ``sourceBin`` items and the ``medias`` of every timeline track
+are decoded one entry at a time and turned into model objects as soon as they
+are complete, so peak memory is bounded by the largest single entry rather
+than the whole file.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from json.scanner import make_scanner
+from pathlib import Path
+from typing import IO, Any
+
+from loguru import logger
+
+from ..models import (
+    Canvas,
+    Media,
+    Project,
+    ProjectMetadata,
+    SourceBin,
+    SourceItem,
+    Timeline,
+    Track,
+    Transition,
+    create_media_from_dict,
+)
+from .loader import ProjectLoader
+
+# Characters read from disk per refill
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+# Stand-ins for streamed entries in the structure outline; one object is
+# shared by all entries so the outline stays small
+_VALID_ENTRY: dict[str, Any] = {"id": None}
+_ENTRY_WITHOUT_ID: dict[str, Any] = {}
+
+
+@dataclass
+class StreamEvent:
+    """A single item produced while streaming a project file.
+
+    Attributes:
+        kind: One of ``"source_item"``, ``"media"``, ``"transition"``,
+            ``"track"``, ``"timeline"``, ``"structure"`` or ``"root"``
+        value: The decoded model object; for ``"timeline"`` and ``"root"``,
+            the dictionary of remaining scalar properties; for
+            ``"structure"``, an outline of ``sourceBin`` and ``timeline``
+            for ``ProjectLoader.validate_structure()``
+        track_position: Position of the owning track in ``csml.tracks`` for
+            ``"media"``, ``"transition"`` and ``"track"`` events
+    """
+
+    kind: str
+    value: Any
+    track_position: int | None = None
+
+
+class _ChunkedReader:
+    """Minimal pull parser over a text stream read in fixed-size chunks."""
+
+    def __init__(self, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._scan_once = make_scanner(json.JSONDecoder())  # type: ignore[arg-type]
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Append more data to the buffer, dropping consumed text."""
+        if self._eof:
+            return False
+        data = self._stream.read(max(self._chunk_size, min_size))
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` or raise ``json.JSONDecodeError``."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def consume_if(self, char: str) -> bool:
+        """Consume ``char`` if it is the next token."""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def read_value(self) -> Any:
+        """Decode one complete JSON value, refilling the buffer as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._scan_once(self._buf, self._pos)
+            except (StopIteration, json.JSONDecodeError) as e:
+                # Value is truncated at the end of the buffer - read more
+                if not self._fill(len(self._buf) - self._pos):
+                    if isinstance(e, json.JSONDecodeError):
+                        raise
+                    raise json.JSONDecodeError("Expecting value", self._buf, self._pos) from None
+                continue
+            # A number or literal touching the buffer end may continue in the next chunk
+            if end == len(self._buf) and self._fill(len(self._buf) - self._pos):
+                continue
+            self._pos = end
+            return value
+
+    def read_key(self) -> str:
+        """Decode an object key and the following colon."""
+        key = self.read_value()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name", self._buf, self._pos)
+        self.expect(":")
+        return key
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield keys of the object at the cursor; the caller consumes each value."""
+        self.expect("{")
+        if self.consume_if("}"):
+            return
+        while True:
+            yield self.read_key()
+            if self.consume_if("}"):
+                return
+            self.expect(",")
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield indices of the array at the cursor; the caller consumes each item."""
+        self.expect("[")
+        if self.consume_if("]"):
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.consume_if("]"):
+                return
+            self.expect(",")
+
+
+def iter_project_events(
+    file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[StreamEvent]:
+    """Stream model objects out of a ``.tscproj`` file.
+
+    Source items, media and transitions are yielded as soon as their JSON entry
+    has been read. A ``"track"`` event follows the last media of each track and
+    carries a ``Track`` without media, so consumers that only need counts or
+    per-clip statistics never hold a whole track in memory. A ``"structure"``
+    event precedes the final ``"root"`` event; merged into the root
+    properties it validates like the full document.
+
+    Args:
+        file_path: Path to .tscproj file
+        chunk_size: Number of characters read per refill
+
+    Yields:
+        StreamEvent instances in document order
+    """
+    with open(file_path, encoding="utf-8-sig") as f:
+        reader = _ChunkedReader(f, chunk_size)
+        root: dict[str, Any] = {}
+        structure: dict[str, Any] = {}
+
+        if reader.peek() != "{":
+            raise ValueError("Project data must be a JSON object")
+
+        for key in reader.iter_object():
+            if key == "sourceBin" and reader.peek() == "[":
+                entries = structure[key] = []
+                for _ in reader.iter_array():
+                    item = reader.read_value()
+                    if not isinstance(item, dict):
+                        logger.warning(f"Skipping invalid sourceBin entry: {type(item).__name__}")
+                        entries.append(item)
+                        continue
+                    entries.append(_VALID_ENTRY if "id" in item else _ENTRY_WITHOUT_ID)
+                    yield StreamEvent("source_item", SourceItem.from_dict(item))
+            elif key == "timeline" and reader.peek() == "{":
+                structure[key] = {}
+                yield from _iter_timeline(reader)
+            elif key in ("sourceBin", "timeline"):
+                logger.warning(f"Invalid {key} type, ignoring")
+                structure[key] = reader.read_value()
+            else:
+                root[key] = reader.read_value()
+
+        yield StreamEvent("structure", structure)
+        yield StreamEvent("root", root)
+
+
+def _iter_timeline(reader: _ChunkedReader) -> Iterator[StreamEvent]:
+    """Stream the ``timeline`` object, descending into the first scene."""
+    timeline: dict[str, Any] = {}
+    for key in reader.iter_object():
+        if key == "sceneTrack" and reader.peek() == "{":
+            for scene_key in reader.iter_object():
+                if scene_key == "scenes" and reader.peek() == "[":
+                    for scene_index in reader.iter_array():
+                        if scene_index == 0 and reader.peek() == "{":
+                            yield from _iter_scene(reader)
+                        else:
+                            # Only the first scene is modeled, like Timeline.from_dict
+                            reader.read_value()
+                else:
+                    reader.read_value()
+        else:
+            timeline[key] = reader.read_value()
+    yield StreamEvent("timeline", timeline)
+
+
+def _iter_scene(reader: _ChunkedReader) -> Iterator[StreamEvent]:
+    """Stream the tracks of a scene's ``csml`` object."""
+    for key in reader.iter_object():
+        if key == "csml" and reader.peek() == "{":
+            for csml_key in reader.iter_object():
+                if csml_key == "tracks" and reader.peek() == "[":
+                    for position in reader.iter_array():
+                        yield from _iter_track(reader, position)
+                else:
+                    reader.read_value()
+        else:
+            reader.read_value()
+
+
+def _iter_track(reader: _ChunkedReader, position: int) -> Iterator[StreamEvent]:
+    """Stream one track, yielding its media and transitions individually."""
+    header: dict[str, Any] = {}
+    for key in reader.iter_object():
+        if key == "medias" and reader.peek() == "[":
+            for _ in reader.iter_array():
+                media_dict = reader.read_value()
+                yield StreamEvent("media", create_media_from_dict(media_dict), position)
+        elif key == "transitions" and reader.peek() == "[":
+            for _ in reader.iter_array():
+                trans_dict = reader.read_value()
+                yield StreamEvent("transition", Transition.from_dict(trans_dict), position)
+        else:
+            header[key] = reader.read_value()
+    yield StreamEvent("track", Track.from_dict(header), position)
+
+
+class StreamingProjectLoader(ProjectLoader):
+    """Loads Camtasia projects incrementally instead of via one dict tree."""
+
+    def __init__(self, strict_version_check: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initialize loader.
+
+        Args:
+            strict_version_check: If True, fail on unsupported versions
+            chunk_size: Number of characters read per refill
+        """
+        super().__init__(strict_version_check=strict_version_check)
+        self.chunk_size = chunk_size
+
+    def iter_file(self, file_path: str | Path) -> Iterator[StreamEvent]:
+        """Stream model objects from a project file.
+
+        Args:
+            file_path: Path to .tscproj file
+
+        Returns:
+            Iterator of StreamEvent instances
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"Project file not found: {path}")
+
+        return iter_project_events(path, self.chunk_size)
+
+    def load_file(self, file_path: str | Path) -> Project:
+        """Load project from file by streaming its entries.
+
+        Args:
+            file_path: Path to .tscproj file
+
+        Returns:
+            Loaded Project instance
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If file is not valid JSON
+            ValueError: If the structure is invalid or the version is
+                unsupported and strict checking is enabled
+        """
+        path = Path(file_path)
+        logger.info(f"Streaming project from: {path}")
+
+        source_items: list[SourceItem] = []
+        pending_media: dict[int, list[Media]] = {}
+        pending_transitions: dict[int, list[Transition]] = {}
+        tracks: list[Track] = []
+        timeline_data: dict[str, Any] = {}
+        structure: dict[str, Any] = {}
+        root: dict[str, Any] = {}
+
+        for event in self.iter_file(path):
+            if event.kind == "source_item":
+                source_items.append(event.value)
+            elif event.kind == "media":
+                pending_media.setdefault(event.track_position or 0, []).append(event.value)
+            elif event.kind == "transition":
+                pending_transitions.setdefault(event.track_position or 0, []).append(event.value)
+            elif event.kind == "track":
+                track = event.value
+                track.medias = pending_media.pop(event.track_position or 0, [])
+                track.transitions = pending_transitions.pop(event.track_position or 0, [])
+                tracks.append(track)
+            elif event.kind == "timeline":
+                timeline_data = event.value
+            elif event.kind == "structure":
+                structure = event.value
+            elif event.kind == "root":
+                root = event.value
+
+        # Same checks as ProjectLoader.load_dict on the whole document
+        self._check_data({**root, **structure})
+
+        if "width" not in root or "height" not in root:
+            logger.warning("Missing width/height in project data, using defaults (1920x1080)")
+
+        project = Project(
+            canvas=Canvas.from_dict(root),
+            source_bin=SourceBin(items=source_items),
+            timeline=Timeline(id=timeline_data.get("id", 0), tracks=tracks),
+            metadata=ProjectMetadata.from_dict(root),
+        )
+        logger.info(f"Successfully loaded project (version {project.version})")
+        return project
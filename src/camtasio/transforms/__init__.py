@@ -1,6 +1,26 @@
 # this_file: src/camtasio/transforms/__init__.py
 """Transform operations for Camtasia projects."""
 
-from .engine import PropertyTransformer, TransformConfig, TransformType
+from .engine import (
+    CompiledTransform,
+    CompositeTransformConfig,
+    LeafTransform,
+    PropertyTransformer,
+    TransformConfig,
+    TransformType,
+)
+from .index import PropertyIndex, index_path
+from .parallel import partition_paths, transform_parallel
 
-__all__ = ["PropertyTransformer", "TransformConfig", "TransformType"]
+__all__ = [
+    "CompiledTransform",
+    "CompositeTransformConfig",
+    "LeafTransform",
+    "PropertyIndex",
+    "PropertyTransformer",
+    "TransformConfig",
+    "TransformType",
+    "index_path",
+    "partition_paths",
+    "transform_parallel",
+]
@@ -1,14 +1,18 @@
 # this_file: src/camtasio/transforms/engine.py
 """Transform engine for applying transformations to Camtasia projects."""
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from loguru import logger
 
 from ..models import Project
 
+if TYPE_CHECKING:
+    from .index import PropertyIndex
+
 
 class TransformType(Enum):
     """Types of transformations that can be applied."""
@@ -25,18 +29,99 @@ class TransformConfig:
     factor: float
     preserve_audio_duration: bool = True  # For temporal transforms
     verbose: bool = False
+    in_place: bool = False  # Mutate the input dict in transform_dict
+    workers: int = 1  # Split transform_dict across workers (0 = one per CPU core)
+
+
+# Custom leaf transform: (key, value, enclosing _type) -> new value
+LeafTransform = Callable[[str, Any, str | None], Any]
+
+
+@dataclass
+class CompositeTransformConfig:
+    """Several transforms applied together in one traversal.
+
+    Spatial and temporal steps are applied in list order to the leaves they
+    affect, so the result matches running them one after another. Custom
+    handlers are called for every scalar property value of every dict, after
+    the built-in steps, with the key, the value and the enclosing ``_type``.
+    """
+
+    transforms: list[TransformConfig] = field(default_factory=list)
+    custom: list[LeafTransform] = field(default_factory=list)
+    verbose: bool = False
+    in_place: bool = False
+    workers: int = 1
+
+
+# Properties scaled by spatial transforms
+SPATIAL_PROPERTIES = frozenset(
+    {
+        "width",
+        "height",
+        "translation0",
+        "translation1",
+        "translation2",
+        "scale0",
+        "scale1",
+        "scale2",
+        "geometryCrop0",
+        "geometryCrop1",
+        "geometryCrop2",
+        "geometryCrop3",
+        "corner-radius",
+        "stroke-width",
+        "widthAttr",
+        "heightAttr",
+    }
+)
+
+# Properties scaled by temporal transforms
+TEMPORAL_PROPERTIES = frozenset(
+    {
+        "start",
+        "duration",
+        "mediaStart",
+        "mediaDuration",
+        "trimStartSum",
+        "time",
+        "endTime",
+        "markIn",
+        "markOut",
+    }
+)
+
+# Temporal properties left alone on AMFile media when preserving audio duration
+AUDIO_PRESERVED_PROPERTIES = frozenset({"duration", "mediaStart", "mediaDuration"})
+
+
+def _map_list(values: list[Any], func: Callable[[Any], Any], in_place: bool) -> list[Any]:
+    """Apply ``func`` to every item, writing into ``values`` when ``in_place``."""
+    if in_place:
+        for i, item in enumerate(values):
+            values[i] = func(item)
+        return values
+    return [func(item) for item in values]
 
 
 class PropertyTransformer:
     """Engine for transforming project properties."""
 
-    def __init__(self, config: TransformConfig):
+    def __init__(self, config: TransformConfig | CompositeTransformConfig):
         """Initialize transformer with configuration.
 
         Args:
-            config: Transform configuration
+            config: Transform configuration, or a composite of several
         """
         self.config = config
+        self._compiled_cache: tuple[Any, CompiledTransform] | None = None
+
+    @property
+    def _step(self) -> TransformConfig:
+        """Configuration of a single-step transform."""
+        if not isinstance(self.config, TransformConfig):
+            raise TypeError("Composite configurations have no single step")
+        return self.config
 
     def transform_project(self, project: Project) -> Project:
         """Apply transformation to a project.
@@ -47,6 +132,9 @@ class PropertyTransformer:
         Returns:
             New transformed project instance
         """
+        if isinstance(self.config, CompositeTransformConfig):
+            return self._transform_project_composite(project, self.config)
+
         # Validate scale factor
         if self.config.factor <= 0:
             raise ValueError(f"Scale factor must be positive, got {self.config.factor}")
@@ -63,6 +151,25 @@ class PropertyTransformer:
         else:
             raise ValueError(f"Unknown transform type: {self.config.transform_type}")
 
+    def _transform_project_composite(
+        self, project: Project, config: CompositeTransformConfig
+    ) -> Project:
+        """Apply each step of a composite config to a project model.
+
+        Args:
+            project: The project to transform
+            config: Composite configuration
+
+        Returns:
+            New transformed project instance
+        """
+        if config.custom:
+            raise ValueError("Custom leaf transforms can only be applied with transform_dict")
+
+        for step in config.transforms:
+            project = PropertyTransformer(step).transform_project(project)
+        return project
+
     def _transform_spatial(self, project: Project) -> Project:
         """Apply spatial transformation.
 
@@ -72,10 +179,10 @@ class PropertyTransformer:
         Returns:
             New spatially scaled project
         """
-        logger.info(f"Scaling project spatially by {self.config.factor}x")
+        logger.info(f"Scaling project spatially by {self._step.factor}x")
 
         # Use the project's built-in spatial scaling
-        return project.scale_spatial(self.config.factor)
+        return project.scale_spatial(self._step.factor)
 
     def _transform_temporal(self, project: Project) -> Project:
         """Apply temporal transformation.
@@ -86,172 +193,468 @@ class PropertyTransformer:
         Returns:
             New temporally scaled project
         """
-        logger.info(f"Scaling project temporally by {self.config.factor}x")
+        logger.info(f"Scaling project temporally by {self._step.factor}x")
 
-        if self.config.preserve_audio_duration:
+        if self._step.preserve_audio_duration:
             logger.info("Audio duration will be preserved")
 
         # Use the project's built-in temporal scaling
         # The Media models already handle audio preservation
-        return project.scale_temporal(self.config.factor)
+        return project.scale_temporal(self._step.factor)
 
-    def transform_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+    def transform_dict(
+        self, data: dict[str, Any], index: "PropertyIndex | None" = None
+    ) -> dict[str, Any]:
         """Apply transformation to raw dictionary data.
 
         This is for direct JSON manipulation without domain models.
 
         Args:
             data: Project dictionary data
+            index: Precompiled index of the data's scalable leaves. When given,
+                only the indexed leaves are visited and, unless the config is
+                in-place, only the containers on their paths are copied.
 
         Returns:
             Transformed dictionary
         """
+        if index is not None:
+            return self._transform_dict_indexed(data, index)
+
+        if self.config.workers != 1:
+            return self._transform_dict_parallel(data)
+
+        if isinstance(self.config, CompositeTransformConfig):
+            return self._transform_dict_fused(data, self.config)
+
         # Validate scale factor
-        if self.config.factor <= 0:
-            raise ValueError(f"Scale factor must be positive, got {self.config.factor}")
+        if self._step.factor <= 0:
+            raise ValueError(f"Scale factor must be positive, got {self._step.factor}")
 
-        if self.config.transform_type == TransformType.SPATIAL:
-            return self._transform_dict_spatial(data)
-        elif self.config.transform_type == TransformType.TEMPORAL:
-            return self._transform_dict_temporal(data)
+        if self._step.transform_type not in (TransformType.SPATIAL, TransformType.TEMPORAL):
+            raise ValueError(f"Unknown transform type: {self._step.transform_type}")
+        return self._transform_dict_compiled(data)
+
+    def _transform_dict_indexed(
+        self, data: dict[str, Any], index: "PropertyIndex"
+    ) -> dict[str, Any]:
+        """Apply transformation to the leaves recorded in a property index.
+
+        Args:
+            data: Project dictionary with the indexed structure
+            index: Index built with PropertyIndex.build()
+
+        Returns:
+            Transformed dictionary
+        """
+        if index.rules != "engine":
+            raise ValueError(f"Index was built for {index.rules!r} rules, expected 'engine'")
+
+        if isinstance(self.config, CompositeTransformConfig):
+            if self.config.custom:
+                raise ValueError("Custom leaf transforms cannot be applied with a property index")
+            steps = self.config.transforms
+            in_place = self.config.in_place
         else:
-            raise ValueError(f"Unknown transform type: {self.config.transform_type}")
+            steps = [self.config]
+            in_place = self.config.in_place
+
+        result = data
+        for step in steps:
+            if step.factor <= 0:
+                raise ValueError(f"Scale factor must be positive, got {step.factor}")
+            if step.transform_type == TransformType.SPATIAL:
+                result = index.scale_spatial(result, step.factor, in_place=in_place)
+            elif step.transform_type == TransformType.TEMPORAL:
+                result = index.scale_temporal(
+                    result,
+                    step.factor,
+                    preserve_audio_duration=step.preserve_audio_duration,
+                    in_place=in_place,
+                )
+            else:
+                raise ValueError(f"Unknown transform type: {step.transform_type}")
+            if step.verbose:
+                logger.info(
+                    f"Applied indexed {step.transform_type.name} transform "
+                    f"with factor {step.factor}"
+                )
+        return result
 
-    def _transform_dict_spatial(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Apply spatial transformation to dictionary.
+    def _transform_dict_parallel(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the transformation with the timeline tracks split across workers.
 
         Args:
             data: Project dictionary
 
         Returns:
-            Spatially transformed dictionary
+            Transformed dictionary, equal to the serial result
         """
-        # Define properties to scale
-        scale_properties = {
-            "width",
-            "height",
-            "translation0",
-            "translation1",
-            "translation2",
-            "scale0",
-            "scale1",
-            "scale2",
-            "geometryCrop0",
-            "geometryCrop1",
-            "geometryCrop2",
-            "geometryCrop3",
-            "corner-radius",
-            "stroke-width",
-            "widthAttr",
-            "heightAttr",
-        }
-
-        def scale_value(key: str, value: Any) -> Any:
-            """Scale a single value if it's a scalable property."""
-            if key in scale_properties and isinstance(value, int | float):
-                return value * self.config.factor
-            return value
-
-        def transform_dict_recursive(obj: Any, parent_key: str | None = None) -> Any:
-            """Recursively transform dictionary values."""
-            if isinstance(obj, dict):
-                result = {}
-                for key, value in obj.items():
-                    if key == "rect" and isinstance(value, list) and len(value) == 4:
-                        # Scale rect arrays [x, y, width, height]
-                        result[key] = [v * self.config.factor for v in value]
-                    elif key == "trackRect" and isinstance(value, list) and len(value) == 4:
-                        # Scale trackRect arrays
-                        result[key] = [v * self.config.factor for v in value]
-                    elif key == "keyframes" and isinstance(value, list):
-                        # Handle keyframes specially
-                        result[key] = []
-                        for kf in value:
-                            new_kf = kf.copy() if isinstance(kf, dict) else kf
-                            if isinstance(new_kf, dict) and "value" in new_kf:
-                                # Scale the value if parent is a spatial property
-                                if parent_key in scale_properties:
-                                    new_kf["value"] = new_kf["value"] * self.config.factor
-                            result[key].append(new_kf)
-                    elif isinstance(value, dict | list):
-                        result[key] = transform_dict_recursive(value, key)
-                    else:
-                        result[key] = scale_value(key, value)
-                return result
-            elif isinstance(obj, list):
-                return [transform_dict_recursive(item, parent_key) for item in obj]
-            else:
-                return obj
+        from .parallel import transform_parallel
 
-        return cast(dict[str, Any], transform_dict_recursive(data))
+        if isinstance(self.config, CompositeTransformConfig):
+            steps, custom = self.config.transforms, self.config.custom
+        else:
+            steps, custom = [self.config], []
+        return transform_parallel(
+            data, steps, custom, in_place=self.config.in_place, workers=self.config.workers
+        )
 
-    def _transform_dict_temporal(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Apply temporal transformation to dictionary.
+    def _transform_dict_compiled(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the single configured step to dictionary.
 
         Args:
             data: Project dictionary
 
         Returns:
-            Temporally transformed dictionary
+            Transformed dictionary
         """
-        # Define temporal properties to scale
-        time_properties = {
-            "start",
-            "duration",
-            "mediaStart",
-            "mediaDuration",
-            "trimStartSum",
-            "time",
-            "endTime",
-            "markIn",
-            "markOut",
-        }
-
-        def should_scale_temporal(parent_type: str, key: str) -> bool:
-            """Determine if a temporal property should be scaled."""
-            if key not in time_properties:
-                return False
-
-            # Don't scale audio duration if preserving
-            if self.config.preserve_audio_duration and parent_type == "AMFile":
-                if key in {"duration", "mediaStart", "mediaDuration"}:
-                    return False
-
-            return True
-
-        def transform_dict_recursive(obj: Any, parent_type: str | None = None) -> Any:
-            """Recursively transform dictionary values."""
-            if isinstance(obj, dict):
-                result: dict[str, Any] = {}
-                current_type = obj.get("_type", parent_type)
-
-                for key, value in obj.items():
-                    if key == "range" and isinstance(value, list) and len(value) == 2:
-                        # Scale time ranges [start, end]
-                        result[key] = [int(v * self.config.factor) for v in value]
-                    elif key == "keyframes" and isinstance(value, list):
-                        # Special handling for keyframes list
-                        result[key] = [
-                            {
-                                k: int(v * self.config.factor) if k == "time" and isinstance(v, int | float) else v
-                                for k, v in item.items()
-                            }
-                            if isinstance(item, dict)
-                            else item
-                            for item in value
-                        ]
-                    elif current_type is not None and should_scale_temporal(current_type, key) and isinstance(
-                        value, int | float
-                    ):
-                        result[key] = int(value * self.config.factor)
-                    elif isinstance(value, dict | list):
-                        result[key] = transform_dict_recursive(value, current_type)
-                    else:
-                        result[key] = value
-                return result
-            elif isinstance(obj, list):
-                return [transform_dict_recursive(item, parent_type) for item in obj]
+        return self._compiled().transform(data)
+
+    # Spatial and temporal steps share the compiled path
+    _transform_dict_spatial = _transform_dict_temporal = _transform_dict_compiled
+
+    def _transform_dict_fused(
+        self, data: dict[str, Any], config: CompositeTransformConfig
+    ) -> dict[str, Any]:
+        """Apply every step of a composite config in one traversal.
+
+        Spatial and temporal properties are disjoint, so each leaf is touched
+        by at most one kind of step. Applying that kind's factors in order
+        gives the same result as running the steps one after another, while
+        the tree is walked and copied only once.
+
+        Args:
+            data: Project dictionary
+            config: Composite configuration
+
+        Returns:
+            Transformed dictionary
+        """
+        compiled = self._compiled()
+        if config.verbose:
+            logger.info(
+                f"Applying {len(config.transforms)} transforms and "
+                f"{len(config.custom)} custom handlers in one pass"
+            )
+        return compiled.transform(data)
+
+    def _compiled(self) -> "CompiledTransform":
+        """Dispatch tables for the current configuration, compiled once.
+
+        The tables are rebuilt only when the configuration changes.
+
+        Raises:
+            ValueError: If a step has a non-positive factor or an unknown type
+        """
+        if isinstance(self.config, CompositeTransformConfig):
+            steps, custom = self.config.transforms, self.config.custom
+        else:
+            steps, custom = [self.config], []
+        key = (
+            tuple((s.transform_type, s.factor, s.preserve_audio_duration) for s in steps),
+            tuple(custom),
+            self.config.in_place,
+        )
+        cached = self._compiled_cache
+        if cached is None or cached[0] != key:
+            cached = self._compiled_cache = (
+                key,
+                CompiledTransform(steps, custom, self.config.in_place),
+            )
+        return cached[1]
+
+
+# Nested JSON containers, and the exact types of JSON scalars
+_CONTAINERS = (dict, list)
+_NUMBERS = (int, float)
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Handler of one property: (key, value, key of the enclosing dict) -> new value
+KeyHandler = Callable[[str, Any, str | None], Any]
+
+
+class CompiledTransform:
+    """A transform configuration compiled into per-``_type`` dispatch tables.
+
+    Each table maps the property names a node type can have transformed to
+    a handler with the step factors bound in, so visiting a dict costs one
+    lookup per key instead of the generic chain of rule checks. Tables are
+    built on the first node of each ``_type`` (untyped nodes included) and
+    reused for the rest of the tree and for later calls. Keys without a
+    handler are never inspected: their scalar values are copied with the
+    dict in one C-level call, or left alone in place, and only nested
+    containers are descended into. Dicts and lists holding only such values
+    are copied without visiting their items at all. In copy mode every
+    container of the result is new, so it can be edited without affecting
+    the input.
+
+    The rules match ``PropertyIndex.build()`` and running the steps one after
+    another: spatial properties, ``rect``/``trackRect`` and the values of
+    spatial keyframes are multiplied by each spatial factor; temporal
+    properties of typed nodes, ``range`` and keyframe times are multiplied by
+    each temporal factor and truncated, except AMFile durations when audio
+    duration is preserved. Custom handlers see every scalar property value
+    after the built-in steps.
+    """
+
+    def __init__(
+        self,
+        steps: list[TransformConfig],
+        custom: list[LeafTransform] | None = None,
+        in_place: bool = False,
+    ):
+        """Compile a list of transform steps.
+
+        Args:
+            steps: Spatial and temporal steps, applied in order
+            custom: Custom leaf transforms
+            in_place: Mutate the input instead of building a copy
+
+        Raises:
+            ValueError: If a step has a non-positive factor or an unknown type
+        """
+        self.spatial_factors: list[float] = []
+        self.temporal_steps: list[tuple[float, bool]] = []
+        for step in steps:
+            if step.factor <= 0:
+                raise ValueError(f"Scale factor must be positive, got {step.factor}")
+            if step.transform_type == TransformType.SPATIAL:
+                self.spatial_factors.append(step.factor)
+            elif step.transform_type == TransformType.TEMPORAL:
+                self.temporal_steps.append((step.factor, step.preserve_audio_duration))
             else:
-                return obj
+                raise ValueError(f"Unknown transform type: {step.transform_type}")
+        self.custom = list(custom or [])
+        self.in_place = in_place
+        self._tables: dict[str | None, dict[str, KeyHandler]] = {}
+        self._scale_spatial = _chain([_multiplying(f) for f in self.spatial_factors])
+        self._scale_temporal = _chain([_truncating(f) for f, _ in self.temporal_steps])
+
+    def transform(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Transform a project dictionary.
 
-        return cast(dict[str, Any], transform_dict_recursive(data))
+        Args:
+            data: Project dictionary
+
+        Returns:
+            Transformed dictionary (``data`` itself in in-place mode)
+        """
+        return cast(dict[str, Any], self._visit(data, None, None))
+
+    def transform_list(
+        self, items: list[Any], parent_key: str | None = None, parent_type: str | None = None
+    ) -> list[Any]:
+        """Transform the items of a list taken out of a project dictionary.
+
+        Args:
+            items: Items of the list
+            parent_key: Key under which the list is stored
+            parent_type: ``_type`` of the nearest typed node enclosing the list
+
+        Returns:
+            Transformed items (``items`` itself in in-place mode)
+        """
+        return cast(list[Any], self._visit(items, parent_key, parent_type))
+
+    def table(self, node_type: str | None) -> dict[str, KeyHandler]:
+        """Handlers for the properties of a node type.
+
+        Args:
+            node_type: ``_type`` of the node or its nearest typed ancestor
+
+        Returns:
+            Mapping from property name to handler
+        """
+        table = self._tables.get(node_type)
+        if table is None:
+            table = self._tables[node_type] = self._compile(node_type)
+        return table
+
+    def _compile(self, node_type: str | None) -> dict[str, KeyHandler]:
+        """Build the handler table of one node type."""
+        table: dict[str, KeyHandler] = {}
+        if self.spatial_factors:
+            table.update(
+                dict.fromkeys(
+                    SPATIAL_PROPERTIES, self._leaf_handler(node_type, self._scale_spatial)
+                )
+            )
+            table["rect"] = table["trackRect"] = self._array_handler(
+                node_type, 4, self._scale_spatial
+            )
+        if self.temporal_steps:
+            # Temporal properties of untyped nodes are never scaled
+            if node_type is not None:
+                temporal = self._leaf_handler(node_type, self._scale_temporal)
+                table.update(dict.fromkeys(TEMPORAL_PROPERTIES, temporal))
+                if node_type == "AMFile":
+                    audio_factors = [f for f, preserve in self.temporal_steps if not preserve]
+                    for key in AUDIO_PRESERVED_PROPERTIES:
+                        if audio_factors:
+                            table[key] = self._leaf_handler(
+                                node_type, _chain([_truncating(f) for f in audio_factors])
+                            )
+                        else:
+                            del table[key]
+            table["range"] = self._array_handler(node_type, 2, self._scale_temporal)
+        if self.spatial_factors or self.temporal_steps:
+            table["keyframes"] = self._keyframes_handler(node_type)
+        return table
+
+    def _visit(self, obj: Any, parent_key: str | None, parent_type: str | None) -> Any:
+        """Transform a container; other values are returned unchanged."""
+        if isinstance(obj, dict):
+            node_type = obj.get("_type", parent_type)
+            try:
+                table = self._tables[node_type]
+            except KeyError:
+                table = self.table(node_type)
+            except TypeError:
+                # Malformed, unhashable _type
+                table = self._compile(node_type)
+            custom = self.custom
+            # A node with no handled key and only scalar values needs no
+            # per-key work; the check runs without a Python-level loop
+            if (
+                not custom
+                and table.keys().isdisjoint(obj)
+                and _SCALAR_TYPES.issuperset(map(type, obj.values()))
+            ):
+                return obj if self.in_place else obj.copy()
+            # Reassigning existing keys during iteration is safe in place
+            result = obj if self.in_place else obj.copy()
+            for key, value in obj.items():
+                handler = table.get(key)
+                if handler is not None:
+                    result[key] = handler(key, value, parent_key)
+                elif isinstance(value, _CONTAINERS):
+                    result[key] = self._visit(value, key, node_type)
+                elif custom:
+                    result[key] = self._apply_custom(key, value, node_type)
+            return result
+        if isinstance(obj, list):
+            if _SCALAR_TYPES.issuperset(map(type, obj)):
+                return obj if self.in_place else obj.copy()
+            visit = self._visit
+            if self.in_place:
+                for i, item in enumerate(obj):
+                    if isinstance(item, _CONTAINERS):
+                        obj[i] = visit(item, parent_key, parent_type)
+                return obj
+            return [
+                visit(item, parent_key, parent_type) if isinstance(item, _CONTAINERS) else item
+                for item in obj
+            ]
+        return obj
+
+    def _apply_custom(self, key: str, value: Any, node_type: str | None) -> Any:
+        """Run the custom handlers on a scalar value."""
+        for handler in self.custom:
+            value = handler(key, value, node_type)
+        return value
+
+    def _fallback(self, key: str, value: Any, node_type: str | None) -> Any:
+        """Treat a value that no rule applies to like an unhandled property."""
+        if isinstance(value, dict | list):
+            return self._visit(value, key, node_type)
+        if self.custom:
+            return self._apply_custom(key, value, node_type)
+        return value
+
+    def _leaf_handler(self, node_type: str | None, scale: Callable[[Any], Any]) -> KeyHandler:
+        """Handler scaling a numeric property."""
+        custom = self.custom
+        fallback = self._fallback
+
+        def handle(key: str, value: Any, parent_key: str | None) -> Any:
+            if isinstance(value, _NUMBERS):
+                value = scale(value)
+                for handler in custom:
+                    value = handler(key, value, node_type)
+                return value
+            return fallback(key, value, node_type)
+
+        return handle
+
+    def _array_handler(
+        self, node_type: str | None, length: int, scale: Callable[[Any], Any]
+    ) -> KeyHandler:
+        """Handler scaling every item of a fixed-length list property."""
+        in_place = self.in_place
+        fallback = self._fallback
+
+        def handle(key: str, value: Any, parent_key: str | None) -> Any:
+            if isinstance(value, list) and len(value) == length:
+                return _map_list(value, scale, in_place)
+            return fallback(key, value, node_type)
+
+        return handle
+
+    def _keyframes_handler(self, node_type: str | None) -> KeyHandler:
+        """Handler scaling keyframe values and times.
+
+        Keyframe values are spatial when the enclosing dict belongs to a
+        spatial property; keyframe times are always temporal.
+        """
+        in_place = self.in_place
+        custom = self.custom
+        has_spatial = bool(self.spatial_factors)
+        has_temporal = bool(self.temporal_steps)
+        scale_spatial = self._scale_spatial
+        scale_temporal = self._scale_temporal
+        fallback = self._fallback
+
+        def handle(key: str, value: Any, parent_key: str | None) -> Any:
+            if not isinstance(value, list):
+                return fallback(key, value, node_type)
+            spatial_parent = has_spatial and parent_key in SPATIAL_PROPERTIES
+            if not (spatial_parent or has_temporal or custom):
+                # Nothing to scale
+                if in_place:
+                    return value
+                return [kf.copy() if isinstance(kf, dict) else kf for kf in value]
+
+            result = value if in_place else []
+            for kf in value:
+                if isinstance(kf, dict):
+                    if not in_place:
+                        kf = kf.copy()
+                    if spatial_parent and "value" in kf:
+                        kf["value"] = scale_spatial(kf["value"])
+                    if has_temporal:
+                        time = kf.get("time")
+                        if isinstance(time, _NUMBERS):
+                            kf["time"] = scale_temporal(time)
+                    for handler in custom:
+                        for k, v in kf.items():
+                            if not isinstance(v, _CONTAINERS):
+                                kf[k] = handler(k, v, node_type)
+                if not in_place:
+                    result.append(kf)
+            return result
+
+        return handle
+
+
+def _multiplying(factor: float) -> Callable[[Any], Any]:
+    """Function multiplying a value by ``factor``."""
+    return lambda value: value * factor
+
+
+def _truncating(factor: float) -> Callable[[Any], Any]:
+    """Function multiplying a value by ``factor`` and truncating to int."""
+    return lambda value: int(value * factor)
+
+
+def _chain(funcs: list[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Compose single-argument functions, applied in list order."""
+    if len(funcs) == 1:
+        return funcs[0]
+
+    def chained(value: Any) -> Any:
+        for func in funcs:
+            value = func(value)
+        return value
+
+    return chained
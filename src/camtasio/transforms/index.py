@@ -0,0 +1,401 @@
+# this_file: src/camtasio/transforms/index.py
+"""Precompiled index of the scalable leaves of a project dictionary.
+
+Every dict transform walks the whole tree and tests each key against the
+spatial and temporal property sets. The locations of those leaves only depend
+on the structure of the project, so they can be collected once as JSON
+pointers and reused: repeated transforms on the same project (for example a
+preview loop trying several scale factors) then visit only the indexed leaves.
+
+An index stays valid as long as the structure of the project does not change.
+Scaling does not change it, so an index built for the original data also
+applies to its scaled results.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ..scaler import TscprojScaler
+from ..serialization import load_json_file
+from .engine import AUDIO_PRESERVED_PROPERTIES, SPATIAL_PROPERTIES, TEMPORAL_PROPERTIES
+
+# Format version of saved index files
+INDEX_FORMAT_VERSION = 1
+
+# Index rule sets: PropertyTransformer semantics or TscprojScaler semantics
+ENGINE_RULES = "engine"
+SCALER_RULES = "scaler"
+
+# Nested dict of pointer tokens; None marks a leaf
+_Trie = dict[str, Any]
+
+
+def _escape(token: str) -> str:
+    """Escape a key for use as a JSON pointer token (RFC 6901)."""
+    if "~" in token or "/" in token:
+        return token.replace("~", "~0").replace("/", "~1")
+    return token
+
+
+def _unescape(token: str) -> str:
+    """Reverse ``_escape``."""
+    if "~" in token:
+        return token.replace("~1", "/").replace("~0", "~")
+    return token
+
+
+def index_path(project_path: str | Path) -> Path:
+    """Return the sidecar index path stored next to a project file.
+
+    Args:
+        project_path: Path to .tscproj file
+
+    Returns:
+        Path of the ``<name>.index.json`` sidecar
+    """
+    path = Path(project_path)
+    return path.with_name(f"{path.name}.index.json")
+
+
+def _file_fingerprint(path: Path) -> dict[str, int]:
+    """Identify a file version by size and modification time."""
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+@dataclass
+class PropertyIndex:
+    """JSON-pointer locations of every spatial and temporal leaf.
+
+    Attributes:
+        rules: ``"engine"`` for PropertyTransformer semantics or ``"scaler"``
+            for TscprojScaler semantics
+        spatial: Leaves multiplied by spatial factors
+        temporal: Leaves multiplied by temporal factors and truncated to int
+        temporal_audio: Temporal leaves of AMFile media that are left alone
+            when audio duration is preserved
+        fingerprint: Size and mtime of the project file the index was built
+            from, if any
+    """
+
+    rules: str = ENGINE_RULES
+    spatial: list[str] = field(default_factory=list)
+    temporal: list[str] = field(default_factory=list)
+    temporal_audio: list[str] = field(default_factory=list)
+    fingerprint: dict[str, int] | None = None
+    _tries: dict[tuple[str, ...], _Trie] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(cls, data: dict[str, Any]) -> "PropertyIndex":
+        """Index a project dictionary using PropertyTransformer rules.
+
+        Args:
+            data: Project dictionary
+
+        Returns:
+            New PropertyIndex
+        """
+        index = cls(rules=ENGINE_RULES)
+        _walk_spatial(data, None, "", index.spatial)
+        _walk_temporal(data, None, "", index.temporal, index.temporal_audio)
+        logger.debug(
+            f"Indexed {len(index.spatial)} spatial and "
+            f"{len(index.temporal) + len(index.temporal_audio)} temporal leaves"
+        )
+        return index
+
+    @classmethod
+    def build_for_scaler(cls, data: dict[str, Any]) -> "PropertyIndex":
+        """Index a project dictionary using TscprojScaler rules.
+
+        Args:
+            data: Project dictionary
+
+        Returns:
+            New PropertyIndex with only spatial leaves
+        """
+        index = cls(rules=SCALER_RULES)
+        _walk_scaler(data, "", "", index.spatial)
+        logger.debug(f"Indexed {len(index.spatial)} scaler leaves")
+        return index
+
+    @classmethod
+    def for_file(cls, project_path: str | Path, rules: str = ENGINE_RULES) -> "PropertyIndex":
+        """Load the sidecar index of a project file, rebuilding it if stale.
+
+        Args:
+            project_path: Path to .tscproj file
+            rules: ``"engine"`` or ``"scaler"``
+
+        Returns:
+            Index matching the current file contents
+        """
+        path = Path(project_path)
+        sidecar = index_path(path)
+        fingerprint = _file_fingerprint(path)
+
+        if sidecar.exists():
+            try:
+                cached = cls.load(sidecar)
+                if cached.fingerprint == fingerprint and cached.rules == rules:
+                    logger.debug(f"Using cached property index {sidecar}")
+                    return cached
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable property index {sidecar}: {e}")
+
+        data = load_json_file(path)
+        index = cls.build_for_scaler(data) if rules == SCALER_RULES else cls.build(data)
+        index.fingerprint = fingerprint
+        try:
+            index.save(sidecar)
+        except OSError as e:
+            logger.warning(f"Could not save property index {sidecar}: {e}")
+        return index
+
+    @property
+    def leaf_count(self) -> int:
+        """Total number of indexed leaves."""
+        return len(self.spatial) + len(self.temporal) + len(self.temporal_audio)
+
+    def scale_spatial(
+        self, data: dict[str, Any], factor: float, in_place: bool = False
+    ) -> dict[str, Any]:
+        """Multiply every spatial leaf by ``factor``.
+
+        Args:
+            data: Project dictionary with the indexed structure
+            factor: Scale factor
+            in_place: Mutate ``data`` instead of copying the touched paths
+
+        Returns:
+            Scaled dictionary; untouched containers are shared with ``data``
+            unless ``in_place`` is set
+        """
+        return self._apply(data, ("spatial",), lambda v: v * factor, in_place)
+
+    def scale_temporal(
+        self,
+        data: dict[str, Any],
+        factor: float,
+        preserve_audio_duration: bool = True,
+        in_place: bool = False,
+    ) -> dict[str, Any]:
+        """Multiply every temporal leaf by ``factor`` and truncate to int.
+
+        Args:
+            data: Project dictionary with the indexed structure
+            factor: Scale factor
+            preserve_audio_duration: Leave AMFile durations unchanged
+            in_place: Mutate ``data`` instead of copying the touched paths
+
+        Returns:
+            Scaled dictionary; untouched containers are shared with ``data``
+            unless ``in_place`` is set
+        """
+        categories = ("temporal",) if preserve_audio_duration else ("temporal", "temporal_audio")
+        return self._apply(data, categories, lambda v: int(v * factor), in_place)
+
+    def _apply(
+        self,
+        data: dict[str, Any],
+        categories: tuple[str, ...],
+        func: Callable[[Any], Any],
+        in_place: bool,
+    ) -> dict[str, Any]:
+        """Apply ``func`` to the leaves of the given categories."""
+        trie = self._tries.get(categories)
+        if trie is None:
+            trie = {}
+            for category in categories:
+                for pointer in getattr(self, category):
+                    _insert(trie, pointer)
+            self._tries[categories] = trie
+        if not trie:
+            return data if in_place else data.copy()
+        result: dict[str, Any] = _apply_trie(data, trie, func, in_place)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        result: dict[str, Any] = {
+            "version": INDEX_FORMAT_VERSION,
+            "rules": self.rules,
+            "spatial": self.spatial,
+            "temporal": self.temporal,
+            "temporal_audio": self.temporal_audio,
+        }
+        if self.fingerprint is not None:
+            result["fingerprint"] = self.fingerprint
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PropertyIndex":
+        """Create from a dictionary produced by ``to_dict``.
+
+        Raises:
+            ValueError: If the index format version is not supported
+        """
+        version = data.get("version")
+        if version != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported property index version: {version}")
+        return cls(
+            rules=data.get("rules", ENGINE_RULES),
+            spatial=list(data.get("spatial", [])),
+            temporal=list(data.get("temporal", [])),
+            temporal_audio=list(data.get("temporal_audio", [])),
+            fingerprint=data.get("fingerprint"),
+        )
+
+    def save(self, file_path: str | Path) -> None:
+        """Save the index as JSON.
+
+        Args:
+            file_path: Destination path
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, file_path: str | Path) -> "PropertyIndex":
+        """Load an index saved with ``save``.
+
+        Args:
+            file_path: Index file path
+
+        Returns:
+            Loaded PropertyIndex
+        """
+        with open(file_path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _insert(trie: _Trie, pointer: str) -> None:
+    """Add a JSON pointer to a trie of tokens."""
+    tokens = [_unescape(token) for token in pointer.split("/")[1:]]
+    node = trie
+    for token in tokens[:-1]:
+        node = node.setdefault(token, {})
+    node[tokens[-1]] = None
+
+
+def _apply_trie(node: Any, trie: _Trie, func: Callable[[Any], Any], in_place: bool) -> Any:
+    """Apply ``func`` at the trie leaves, copying containers on the way unless in place."""
+    target = node if in_place else node.copy()
+    is_list = isinstance(target, list)
+    for token, child in trie.items():
+        key = int(token) if is_list else token
+        if child is None:
+            target[key] = func(target[key])
+        else:
+            target[key] = _apply_trie(target[key], child, func, in_place)
+    return target
+
+
+def _walk_spatial(obj: Any, parent_key: str | None, pointer: str, out: list[str]) -> None:
+    """Collect spatial leaves following PropertyTransformer spatial rules."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            path = f"{pointer}/{_escape(key)}"
+            if key in ("rect", "trackRect") and isinstance(value, list) and len(value) == 4:
+                out.extend(f"{path}/{i}" for i in range(4))
+            elif key == "keyframes" and isinstance(value, list):
+                if parent_key in SPATIAL_PROPERTIES:
+                    out.extend(
+                        f"{path}/{i}/value"
+                        for i, kf in enumerate(value)
+                        if isinstance(kf, dict) and "value" in kf
+                    )
+            elif isinstance(value, dict | list):
+                _walk_spatial(value, key, path, out)
+            elif key in SPATIAL_PROPERTIES and isinstance(value, int | float):
+                out.append(path)
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            _walk_spatial(item, parent_key, f"{pointer}/{i}", out)
+
+
+def _walk_temporal(
+    obj: Any, parent_type: str | None, pointer: str, temporal: list[str], audio: list[str]
+) -> None:
+    """Collect temporal leaves following PropertyTransformer temporal rules."""
+    if isinstance(obj, dict):
+        current_type = obj.get("_type", parent_type)
+        for key, value in obj.items():
+            path = f"{pointer}/{_escape(key)}"
+            if key == "range" and isinstance(value, list) and len(value) == 2:
+                temporal.extend((f"{path}/0", f"{path}/1"))
+            elif key == "keyframes" and isinstance(value, list):
+                temporal.extend(
+                    f"{path}/{i}/time"
+                    for i, kf in enumerate(value)
+                    if isinstance(kf, dict) and isinstance(kf.get("time"), int | float)
+                )
+            elif (
+                current_type is not None
+                and key in TEMPORAL_PROPERTIES
+                and isinstance(value, int | float)
+            ):
+                if current_type == "AMFile" and key in AUDIO_PRESERVED_PROPERTIES:
+                    audio.append(path)
+                else:
+                    temporal.append(path)
+            elif isinstance(value, dict | list):
+                _walk_temporal(value, current_type, path, temporal, audio)
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            _walk_temporal(item, parent_type, f"{pointer}/{i}", temporal, audio)
+
+
+def _walk_scaler(obj: Any, dotted: str, pointer: str, out: list[str]) -> None:
+    """Collect spatial leaves following TscprojScaler rules.
+
+    ``dotted`` mirrors the scaler's logging path, which it also uses to find
+    the property that owns a keyframes list.
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            current = f"{dotted}.{key}" if dotted else key
+            path = f"{pointer}/{_escape(key)}"
+            if key == "def" and isinstance(value, dict):
+                out.extend(
+                    f"{path}/{prop}"
+                    for prop in ("width", "height", "corner-radius", "stroke-width")
+                    if isinstance(value.get(prop), int | float)
+                )
+            elif key in TscprojScaler.DIMENSION_ARRAYS and isinstance(value, list):
+                if len(value) == 4:
+                    out.extend(
+                        f"{path}/{i}" for i, v in enumerate(value) if isinstance(v, int | float)
+                    )
+            elif key in TscprojScaler.SCALE_PROPERTIES and isinstance(value, int | float):
+                out.append(path)
+            elif key == "keyframes" and isinstance(value, list):
+                parent_prop = current.split(".")[-2] if "." in current else ""
+                if parent_prop in TscprojScaler.SCALE_PROPERTIES:
+                    out.extend(
+                        f"{path}/{i}/value"
+                        for i, kf in enumerate(value)
+                        if isinstance(kf, dict) and isinstance(kf.get("value"), int | float)
+                    )
+            elif key.startswith("default-") and any(
+                prop in key for prop in ["width", "height", "scale", "translation"]
+            ):
+                prop_name = key.replace("default-", "")
+                if (
+                    isinstance(value, dict)
+                    and "value" in value
+                    and prop_name in TscprojScaler.SCALE_PROPERTIES
+                ):
+                    out.append(f"{path}/value")
+            else:
+                _walk_scaler(value, current, path, out)
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            _walk_scaler(item, f"{dotted}[{i}]", f"{pointer}/{i}", out)
@@ -0,0 +1,213 @@
+# this_file: src/camtasio/transforms/parallel.py
+"""Transform one large project on several cores.
+
+The timeline tracks of every scene and the source bin are split into
+chunks that are transformed by a pool of workers, while the rest of the
+document is transformed in the calling thread. The results are put back in
+document order, so the output equals a serial ``transform_dict``.
+
+Chunks go to worker processes by default. On a free-threaded interpreter
+(no GIL) threads are used instead, which avoids pickling the chunks.
+"""
+
+import os
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from loguru import logger
+
+from .engine import CompiledTransform, LeafTransform, TransformConfig
+
+# Location of a list in a project dictionary, as keys and indices from the root
+PartitionPath = tuple[str | int, ...]
+
+# Chunks per worker; more, smaller chunks even out tracks of different sizes
+CHUNKS_PER_WORKER = 4
+
+EXECUTORS = ("process", "thread")
+
+
+def free_threaded() -> bool:
+    """Whether the interpreter runs Python code without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def partition_paths(data: dict[str, Any]) -> list[PartitionPath]:
+    """Find the lists whose items can be transformed independently.
+
+    Args:
+        data: Project dictionary
+
+    Returns:
+        Paths of the source bin and of the ``csml.tracks`` list of every
+        scene, in document order; malformed or missing parts are skipped
+    """
+    paths: list[PartitionPath] = []
+    if isinstance(data.get("sourceBin"), list):
+        paths.append(("sourceBin",))
+    timeline = data.get("timeline")
+    scene_track = timeline.get("sceneTrack") if isinstance(timeline, dict) else None
+    scenes = scene_track.get("scenes") if isinstance(scene_track, dict) else None
+    if isinstance(scenes, list):
+        for i, scene in enumerate(scenes):
+            csml = scene.get("csml") if isinstance(scene, dict) else None
+            if isinstance(csml, dict) and isinstance(csml.get("tracks"), list):
+                paths.append(("timeline", "sceneTrack", "scenes", i, "csml", "tracks"))
+    return paths
+
+
+def transform_parallel(
+    data: dict[str, Any],
+    steps: list[TransformConfig],
+    custom: list[LeafTransform] | None = None,
+    in_place: bool = False,
+    workers: int = 0,
+    executor: str | None = None,
+) -> dict[str, Any]:
+    """Transform a project dictionary with its tracks split across workers.
+
+    Args:
+        data: Project dictionary
+        steps: Spatial and temporal steps, applied in order
+        custom: Custom leaf transforms; they must be picklable to run in
+            worker processes
+        in_place: Mutate ``data`` instead of building a copy. With worker
+            processes the transformed items replace the originals in their
+            lists rather than being mutated.
+        workers: Number of workers (0 = one per CPU core, 1 = serial)
+        executor: ``"process"`` or ``"thread"`` (default: threads on
+            free-threaded interpreters, processes otherwise)
+
+    Returns:
+        Transformed dictionary, equal to the serial result
+
+    Raises:
+        ValueError: If a step is invalid or the executor is unknown
+    """
+    compiled = CompiledTransform(steps, custom, in_place)
+    if executor is None:
+        executor = "thread" if free_threaded() else "process"
+    elif executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}, expected one of {EXECUTORS}")
+
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    paths = partition_paths(data)
+    if workers == 1 or not paths:
+        return compiled.transform(data)
+
+    skeleton, detached = _detach(data, paths, in_place)
+    contexts = [_context(data, path) for path in paths]
+    logger.debug(
+        f"Transforming {sum(map(len, detached))} items of {len(paths)} lists "
+        f"with {workers} {executor} workers"
+    )
+
+    pool: Executor
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    with pool:
+        futures: list[list[Future[list[Any]]]] = []
+        for items, (parent_key, parent_type) in zip(detached, contexts, strict=True):
+            chunks = _chunks(items, workers * CHUNKS_PER_WORKER)
+            if executor == "thread":
+                futures.append(
+                    [
+                        pool.submit(compiled.transform_list, chunk, parent_key, parent_type)
+                        for chunk in chunks
+                    ]
+                )
+            else:
+                futures.append(
+                    [
+                        pool.submit(_transform_chunk, steps, custom, chunk, parent_key, parent_type)
+                        for chunk in chunks
+                    ]
+                )
+        # The rest of the document is transformed while the workers run
+        result = compiled.transform(skeleton)
+        for path, items, chunk_futures in zip(paths, detached, futures, strict=True):
+            transformed = [item for future in chunk_futures for item in future.result()]
+            if in_place:
+                items[:] = transformed
+                transformed = items
+            _container(result, path)[path[-1]] = transformed
+    return result
+
+
+def _transform_chunk(
+    steps: list[TransformConfig],
+    custom: list[LeafTransform] | None,
+    chunk: list[Any],
+    parent_key: str | None,
+    parent_type: str | None,
+) -> list[Any]:
+    """Transform the items of one chunk in a worker process.
+
+    The chunk is the worker's own unpickled copy, so it is transformed in
+    place.
+    """
+    compiled = CompiledTransform(steps, custom, in_place=True)
+    return compiled.transform_list(chunk, parent_key, parent_type)
+
+
+def _detach(
+    data: dict[str, Any], paths: list[PartitionPath], in_place: bool
+) -> tuple[dict[str, Any], list[list[Any]]]:
+    """Replace the partitioned lists with empty ones.
+
+    Without ``in_place`` the containers on the paths are shallow-copied
+    first, so ``data`` is left untouched.
+
+    Returns:
+        Tuple of (document without the lists, detached lists)
+    """
+    root = data if in_place else data.copy()
+    copies = {id(root)}
+    detached = []
+    for path in paths:
+        node: Any = root
+        for key in path[:-1]:
+            child = node[key]
+            if not in_place and id(child) not in copies:
+                child = node[key] = child.copy()
+                copies.add(id(child))
+            node = child
+        detached.append(node[path[-1]])
+        node[path[-1]] = []
+    return root, detached
+
+
+def _context(data: dict[str, Any], path: PartitionPath) -> tuple[str | None, str | None]:
+    """Key and nearest enclosing ``_type`` of the list at ``path``."""
+    node: Any = data
+    node_type = None
+    for key in path[:-1]:
+        if isinstance(node, dict):
+            node_type = node.get("_type", node_type)
+        node = node[key]
+    node_type = node.get("_type", node_type)
+    return str(path[-1]), node_type
+
+
+def _container(data: dict[str, Any], path: PartitionPath) -> Any:
+    """Container holding the last key of ``path``."""
+    node: Any = data
+    for key in path[:-1]:
+        node = node[key]
+    return node
+
+
+def _chunks(items: list[Any], count: int) -> list[list[Any]]:
+    """Split a list into at most ``count`` contiguous chunks of similar length."""
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(min(count, len(items))):
+        end = start + size + (i < extra)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
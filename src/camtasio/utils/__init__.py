@@ -2,6 +2,21 @@
 # this_file: src/camtasio/utils/__init__.py
 
 from camtasio.utils.color import RGBA, hex_to_rgb
-from camtasio.utils.timing import FrameStamp
+from camtasio.utils.fs import FileStatus, check_files
+from camtasio.utils.timing import (
+    FrameStamp,
+    batch_from_seconds,
+    batch_to_frame_rate,
+    batch_total_seconds,
+)
 
-__all__ = ["RGBA", "FrameStamp", "hex_to_rgb"]
+__all__ = [
+    "RGBA",
+    "FileStatus",
+    "FrameStamp",
+    "batch_from_seconds",
+    "batch_to_frame_rate",
+    "batch_total_seconds",
+    "check_files",
+    "hex_to_rgb",
+]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Concurrent existence and size checks for referenced media files."""
+# this_file: src/camtasio/utils/fs.py
+
+from __future__ import annotations
+
+import os
+import stat
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+# Upper bound on filesystem calls in flight; high enough to hide network
+# latency, low enough not to flood a file server
+DEFAULT_MAX_WORKERS = 16
+
+
+@dataclass(frozen=True, slots=True)
+class FileStatus:
+    """Result of checking one path.
+
+    Attributes:
+        exists: Whether the path exists
+        is_file: Whether the path is a regular file (following symlinks)
+        size: ``st_size`` of the path, or None if it doesn't exist
+    """
+
+    exists: bool = False
+    is_file: bool = False
+    size: int | None = None
+
+
+_MISSING = FileStatus()
+
+
+def _stat_path(path: str) -> FileStatus:
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return _MISSING
+    return FileStatus(True, stat.S_ISREG(st.st_mode), st.st_size)
+
+
+def _stat_entry(entry: os.DirEntry[str]) -> FileStatus:
+    try:
+        st = entry.stat()
+    except OSError:
+        return _MISSING  # Broken symlink
+    return FileStatus(True, stat.S_ISREG(st.st_mode), st.st_size)
+
+
+def _fold(name: str) -> str:
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+def _list_directory(directory: str) -> tuple[dict[str, os.DirEntry[str]], set[str]] | None:
+    """Entries of a directory by name, plus their case-folded names."""
+    try:
+        with os.scandir(directory) as it:
+            entries = {entry.name: entry for entry in it}
+    except (OSError, ValueError):
+        return None
+    return entries, {_fold(name) for name in entries}
+
+
+def check_files(
+    paths: Iterable[str | Path], max_workers: int | None = None
+) -> dict[str, FileStatus]:
+    """Check existence and size of many files concurrently.
+
+    Paths sharing a directory are resolved from a single ``scandir`` listing
+    of that directory, so names missing from the listing cost no further
+    system call. Listings and ``stat`` calls run on a bounded thread pool,
+    which hides the per-call latency of network filesystems. Names that are
+    only missing because of case or Unicode normalization differences (as on
+    macOS or Windows filesystems) are confirmed with a direct ``stat``.
+
+    Args:
+        paths: Paths to check, relative paths resolve against the working directory
+        max_workers: Maximum concurrent filesystem calls (default: ``DEFAULT_MAX_WORKERS``)
+
+    Returns:
+        Status of every distinct path, keyed by ``str(path)``
+    """
+    by_directory: dict[str, dict[str, str]] = defaultdict(dict)
+    for path in dict.fromkeys(str(p) for p in paths):
+        directory, name = os.path.split(os.fspath(Path(path)))
+        by_directory[directory or os.curdir][path] = name
+
+    results: dict[str, FileStatus] = {}
+    if not by_directory:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS) as executor:
+        # A listing only pays off for directories holding several of the paths
+        shared = [directory for directory, names in by_directory.items() if len(names) > 1]
+        listings = dict(zip(shared, executor.map(_list_directory, shared), strict=True))
+
+        pending: dict[str, Future[FileStatus]] = {}
+        for directory, names in by_directory.items():
+            listing = listings.get(directory)
+            for path, name in names.items():
+                if listing is None or name in ("", os.curdir, os.pardir):
+                    pending[path] = executor.submit(_stat_path, os.path.join(directory, name))
+                elif (entry := listing[0].get(name)) is not None:
+                    pending[path] = executor.submit(_stat_entry, entry)
+                elif _fold(name) in listing[1]:
+                    pending[path] = executor.submit(_stat_path, os.path.join(directory, name))
+                else:
+                    results[path] = _MISSING
+
+        for path, future in pending.items():
+            results[path] = future.result()
+
+    return results
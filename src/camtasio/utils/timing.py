@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Timing utilities for frame-based time calculations."""
+"""Timing utilities for frame-based time calculations.
+
+``FrameStamp`` converts one value at a time. The ``batch_*`` functions
+convert whole arrays of frame numbers with NumPy integer math, e.g. every
+keyframe and clip time of a project from the 705600000 edit rate to 60 fps
+in one call. NumPy is optional; install ``camtasio[fast]`` to use them.
+"""
 # this_file: src/camtasio/utils/timing.py
 
 from __future__ import annotations
@@ -7,9 +13,21 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any
+
+# NumPy is imported by the first batch conversion, not with this module
+HAS_NUMPY = find_spec("numpy") is not None
+
+_INT64_MAX = 2**63 - 1
 
+# Frame rates whose conversions are precomputed: video frame rates, audio
+# sample rates and the ``ProjectVersion.edit_rate`` values (60 and 705600000)
+COMMON_FRAME_RATES = (24, 25, 30, 48, 50, 60, 120, 44100, 48000, 705600000)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FrameStamp:
     """Timestamp representation using frame number and frame rate.
 
@@ -140,31 +158,200 @@ class FrameStamp:
         The result uses the least common multiple of the frame rates
         to maintain precision.
         """
-        # Find least common multiple of frame rates
-        common_frame_rate = _lcm(frame_rate_1, frame_rate_2)
-
-        # Convert frame numbers to common frame rate
-        frame_1_scaled = (common_frame_rate // frame_rate_1) * frame_number_1
-        frame_2_scaled = (common_frame_rate // frame_rate_2) * frame_number_2
+        if frame_rate_1 == frame_rate_2:
+            return FrameStamp(frame_number=frame_number_1 + frame_number_2, frame_rate=frame_rate_1)
 
+        # Convert frame numbers to the least common multiple of the frame rates
+        common_frame_rate, factor_1, factor_2 = _common_frame_rate(frame_rate_1, frame_rate_2)
         return FrameStamp(
-            frame_number=frame_1_scaled + frame_2_scaled, frame_rate=common_frame_rate
+            frame_number=factor_1 * frame_number_1 + factor_2 * frame_number_2,
+            frame_rate=common_frame_rate,
         )
 
     def to_frame_rate(self, new_frame_rate: int) -> FrameStamp:
         """Convert to a different frame rate.
 
+        The frame number is scaled exactly and rounded half to even.
+
         Args:
             new_frame_rate: Target frame rate
 
         Returns:
             New FrameStamp with converted frame rate
         """
-        seconds = self.total_seconds
-        new_frame_number = round(seconds * new_frame_rate)
+        if new_frame_rate == self.frame_rate:
+            return self
+        numerator, denominator = _conversion_ratio(self.frame_rate, new_frame_rate)
+        new_frame_number, remainder = divmod(self.frame_number * numerator, denominator)
+        if 2 * remainder > denominator or (2 * remainder == denominator and new_frame_number & 1):
+            new_frame_number += 1
         return FrameStamp(frame_number=new_frame_number, frame_rate=new_frame_rate)
 
 
+@lru_cache(maxsize=4096)
 def _lcm(a: int, b: int) -> int:
     """Calculate least common multiple of two integers."""
     return abs(a * b) // math.gcd(a, b)
+
+
+@lru_cache(maxsize=4096)
+def _common_frame_rate(frame_rate_1: int, frame_rate_2: int) -> tuple[int, int, int]:
+    """Least common multiple of two frame rates and the factor scaling each to it."""
+    common_frame_rate = _lcm(frame_rate_1, frame_rate_2)
+    return common_frame_rate, common_frame_rate // frame_rate_1, common_frame_rate // frame_rate_2
+
+
+@lru_cache(maxsize=4096)
+def _conversion_ratio(frame_rate: int, new_frame_rate: int) -> tuple[int, int]:
+    """``new_frame_rate / frame_rate`` in lowest terms as (numerator, denominator)."""
+    divisor = math.gcd(frame_rate, new_frame_rate)
+    return new_frame_rate // divisor, frame_rate // divisor
+
+
+def _precompute_common_frame_rates() -> None:
+    for frame_rate in COMMON_FRAME_RATES:
+        for other in COMMON_FRAME_RATES:
+            _common_frame_rate(frame_rate, other)
+            _conversion_ratio(frame_rate, other)
+
+
+_precompute_common_frame_rates()
+
+
+def _numpy() -> Any:
+    if not HAS_NUMPY:
+        raise ImportError(
+            "Batch frame conversion requires NumPy; install it with 'pip install camtasio[fast]'"
+        )
+    import numpy
+
+    return numpy
+
+
+def _check_frame_rate(frame_rate: int) -> None:
+    if frame_rate <= 0:
+        raise ValueError(f"Frame rate must be positive, got {frame_rate}")
+
+
+def _round_div(numerator: int, denominator: int) -> int:
+    """Divide Python integers, rounding half to even like ``round()``."""
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def _as_frame_numbers(frame_numbers: Any) -> Any:
+    """Frame numbers as an int64 array, or an object array of Python ints."""
+    np = _numpy()
+    values = np.asarray(frame_numbers)
+    if not values.size:
+        return values.astype(np.int64)
+    if values.dtype.kind == "O":
+        return np.array([int(v) for v in values.flat], dtype=object).reshape(values.shape)
+    if values.dtype.kind not in "iub":
+        raise TypeError(f"Frame numbers must be integers, got {values.dtype}")
+    if values.dtype.kind == "u" and int(values.max()) > _INT64_MAX:
+        return values.astype(object)
+    return values.astype(np.int64, copy=False)
+
+
+def batch_to_frame_rate(frame_numbers: Any, frame_rate: int, new_frame_rate: int) -> Any:
+    """Convert frame numbers to a different frame rate.
+
+    Matches ``FrameStamp.to_frame_rate()`` element by element: the result is
+    the exact quotient ``frame_number * new_frame_rate / frame_rate`` rounded
+    half to even. Negative frame numbers (time differences) are allowed.
+
+    Args:
+        frame_numbers: Integer array-like of frame numbers
+        frame_rate: Frame rate of the input
+        new_frame_rate: Target frame rate
+
+    Returns:
+        int64 array of the input's shape, or an object array of Python ints
+        if a value or intermediate product does not fit in int64
+
+    Raises:
+        ImportError: If NumPy is not installed
+        TypeError: If the frame numbers are not integers
+        ValueError: If a frame rate is not positive
+    """
+    np = _numpy()
+    _check_frame_rate(frame_rate)
+    _check_frame_rate(new_frame_rate)
+    numerator, denominator = _conversion_ratio(frame_rate, new_frame_rate)
+    values = _as_frame_numbers(frame_numbers)
+
+    if values.dtype == np.int64 and numerator * denominator <= _INT64_MAX // 2:
+        # Split off whole multiples of the denominator so the products stay small
+        whole, rest = np.divmod(values, denominator)
+        if (
+            not whole.size
+            or max(-int(whole.min()), int(whole.max())) <= (_INT64_MAX - numerator) // numerator
+        ):
+            quotient, remainder = np.divmod(rest * numerator, denominator)
+            quotient += whole * numerator
+            round_up = (2 * remainder > denominator) | (
+                (2 * remainder == denominator) & (quotient & 1 == 1)
+            )
+            return quotient + round_up
+
+    converted = [_round_div(int(v) * numerator, denominator) for v in values.flat]
+    return np.array(converted, dtype=object).reshape(values.shape)
+
+
+def batch_from_seconds(seconds: Any, frame_rate: int) -> Any:
+    """Convert times in seconds to frame numbers.
+
+    Matches ``FrameStamp.from_seconds()`` element by element: the float
+    product is rounded half to even.
+
+    Args:
+        seconds: Array-like of times in seconds
+        frame_rate: Frame rate to use
+
+    Returns:
+        int64 array, or an object array of Python ints if a frame number does
+        not fit in int64
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If the frame rate is not positive or a time is not finite
+    """
+    np = _numpy()
+    _check_frame_rate(frame_rate)
+    frames = np.rint(np.asarray(seconds, dtype=np.float64) * frame_rate)
+    if not np.isfinite(frames).all():
+        raise ValueError("Times must be finite")
+    if frames.size and np.abs(frames).max() >= 2.0**63:
+        return np.array([int(v) for v in frames.flat], dtype=object).reshape(frames.shape)
+    return frames.astype(np.int64)
+
+
+def batch_total_seconds(frame_numbers: Any, frame_rate: int) -> Any:
+    """Convert frame numbers to times in seconds.
+
+    Matches ``FrameStamp.total_seconds`` element by element.
+
+    Args:
+        frame_numbers: Integer array-like of frame numbers
+        frame_rate: Frame rate of the input
+
+    Returns:
+        float64 array
+
+    Raises:
+        ImportError: If NumPy is not installed
+        TypeError: If the frame numbers are not integers
+        ValueError: If the frame rate is not positive
+    """
+    np = _numpy()
+    _check_frame_rate(frame_rate)
+    values = _as_frame_numbers(frame_numbers)
+    if values.dtype == np.int64:
+        if not values.size or max(-int(values.min()), int(values.max())) <= 2**53:
+            return values / frame_rate
+    # Python's int division is correctly rounded for any magnitude
+    seconds = [int(v) / frame_rate for v in values.flat]
+    return np.array(seconds, dtype=np.float64).reshape(values.shape)
@@ -5,6 +5,15 @@ import pytest
 from camtasio.serialization import ProjectLoader
 
 
+@pytest.fixture(scope="session", autouse=True)
+def parse_cache_dir(tmp_path_factory):
+    "Keep the parse cache and summary sidecars of CLI commands out of the user's cache."
+    directory = tmp_path_factory.mktemp("parse-cache")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("CAMTASIO_CACHE_DIR", str(directory))
+        yield directory
+
+
 @pytest.fixture
 def media_root(pytestconfig):
     root = pathlib.Path(str(pytestconfig.rootdir))
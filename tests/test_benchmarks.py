@@ -0,0 +1,133 @@
+# this_file: tests/test_benchmarks.py
+"""Tests for the benchmark harness and synthetic project generator."""
+
+import json
+
+import pytest
+from benchmarks.import_time import IMPORT_PRESET, IMPORT_TARGETS, parse_importtime
+from benchmarks.run_benchmarks import (
+    BASELINES_PATH,
+    BENCHMARKS,
+    PRESETS,
+    BenchmarkResult,
+    find_regressions,
+    measure,
+    run_preset,
+)
+from benchmarks.synthetic import SyntheticSpec, generate_project, write_project
+
+from camtasio.serialization import ProjectLoader
+
+
+def _group_depth(media):
+    depth = 0
+    while media.get("_type") == "Group":
+        depth += 1
+        media = media["tracks"][0]["medias"][0]
+    return depth
+
+
+class TestSyntheticProject:
+    """Test the synthetic project generator."""
+
+    def test_shape(self):
+        """Tracks, clips and keyframes follow the spec."""
+        spec = SyntheticSpec(tracks=3, clips=5, keyframes=6, sources=2)
+        data = generate_project(spec)
+        tracks = data["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"]
+
+        assert len(data["sourceBin"]) == 2
+        assert [len(track["medias"]) for track in tracks] == [5, 5, 5]
+        assert tracks[0]["medias"][0]["_type"] == "AMFile"
+        video = tracks[1]["medias"][0]
+        assert len(video["parameters"]["translation0"]["keyframes"]) == 6
+
+    def test_group_nesting(self):
+        """Every n-th clip is a Group nested to the requested depth."""
+        spec = SyntheticSpec(tracks=1, clips=4, group_depth=3, group_every=2)
+        csml = generate_project(spec)["timeline"]["sceneTrack"]["scenes"][0]["csml"]
+        medias = csml["tracks"][0]["medias"]
+
+        assert [_group_depth(media) for media in medias] == [0, 3, 0, 3]
+
+    def test_unique_ids(self):
+        """Media ids are unique across nested groups."""
+        data = generate_project(SyntheticSpec(tracks=2, clips=6, group_depth=2, group_every=3))
+        ids = []
+
+        def collect(tracks):
+            for track in tracks:
+                for media in track["medias"]:
+                    ids.append(media["id"])
+                    collect(media.get("tracks", []))
+
+        collect(data["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"])
+        assert len(ids) == len(set(ids))
+
+    def test_loads_as_project(self, tmp_path):
+        """Synthetic files load with the regular loader."""
+        spec = SyntheticSpec(tracks=2, clips=3, group_depth=1, group_every=3)
+        path = write_project(tmp_path / "synthetic.tscproj", spec)
+        project = ProjectLoader().load_file(path)
+
+        assert project.timeline.track_count == 2
+        assert project.timeline.media_count == 6
+        assert project.canvas.width == 1920
+
+
+class TestBenchmarkHarness:
+    """Test measurement and baseline comparison."""
+
+    def test_measure(self):
+        """measure() reports time and peak memory."""
+        seconds, peak = measure(lambda: [0] * 100_000, repeat=2)
+        assert seconds >= 0
+        assert peak > 0.5
+
+    def test_run_preset(self):
+        """Every benchmark runs on a tiny project."""
+        results = run_preset("tiny", SyntheticSpec(tracks=2, clips=3, group_depth=1), repeat=1)
+        assert [r.name for r in results] == list(BENCHMARKS)
+        assert all(r.seconds >= 0 and r.peak_mib >= 0 for r in results)
+
+    def test_find_regressions(self):
+        """Slowdowns and memory growth beyond the tolerance are reported."""
+        baselines = {"small": {"load_file": {"seconds": 1.0, "peak_mib": 10.0}}}
+        results = [
+            BenchmarkResult("small", "load_file", 1.1, 20.0),
+            BenchmarkResult("small", "save_file", 9.0, 9.0),
+        ]
+
+        regressions = find_regressions(results, baselines, tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("small/load_file: peak_mib")
+
+    def test_baselines_cover_benchmarks(self):
+        """Stored baselines exist for every benchmark of the default presets."""
+        baselines = json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+        for preset in ("small", "medium"):
+            assert preset in PRESETS
+            assert set(baselines[preset]) == set(BENCHMARKS)
+
+
+class TestImportTime:
+    """Test the import time benchmark."""
+
+    def test_parse_importtime(self):
+        """The largest cumulative time of the module is reported in seconds."""
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        900 |     camtasio.cli.app\n"
+            "import time:        20 |       1500 |   camtasio.cli\n"
+            "import time:        10 |       2000 | camtasio.cli.app\n"
+        )
+
+        assert parse_importtime(stderr, "camtasio.cli.app") == 0.002
+        with pytest.raises(ValueError, match="No import time"):
+            parse_importtime(stderr, "numpy")
+
+    def test_baselines_cover_imports(self):
+        """Stored baselines exist for every tracked module."""
+        baselines = json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+        assert set(baselines[IMPORT_PRESET]) == set(IMPORT_TARGETS)
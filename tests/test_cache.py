@@ -0,0 +1,130 @@
+# this_file: tests/test_cache.py
+"""Tests for the on-disk parse cache."""
+
+import json
+import os
+
+import pytest
+
+from camtasio.serialization import ParseCache, cache, cache_enabled, load_json_cached
+
+
+@pytest.fixture
+def project_file(tmp_path):
+    """Small project file."""
+    path = tmp_path / "project.tscproj"
+    path.write_text(json.dumps({"sourceBin": [{"id": 1}], "version": "9.0"}), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def parse_cache(tmp_path):
+    """Cache in a private directory."""
+    return ParseCache(tmp_path / "cache")
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    loads = cache.loads_json
+
+    def counting_loads(raw):
+        calls.append(raw)
+        return loads(raw)
+
+    monkeypatch.setattr(cache, "loads_json", counting_loads)
+    return calls
+
+
+class TestParseCache:
+    """Test cache hits, invalidation and eviction."""
+
+    def test_hit_returns_fresh_copy(self, parse_cache, project_file, monkeypatch):
+        """The second load comes from the cache and is independent of the first."""
+        parses = _count_parses(monkeypatch)
+
+        first = parse_cache.load(project_file)
+        first["sourceBin"].clear()
+        second = parse_cache.load(project_file)
+
+        assert second == {"sourceBin": [{"id": 1}], "version": "9.0"}
+        assert len(parses) == 1
+        assert len(parse_cache) == 1
+
+    def test_changed_file_is_reparsed(self, parse_cache, project_file, monkeypatch):
+        """A different size or content invalidates the entry."""
+        parse_cache.load(project_file)
+        parses = _count_parses(monkeypatch)
+
+        project_file.write_text(json.dumps({"version": "8.0"}), encoding="utf-8")
+        assert parse_cache.load(project_file) == {"version": "8.0"}
+
+        # Same size, different content and mtime
+        project_file.write_text(json.dumps({"version": "7.0"}), encoding="utf-8")
+        os.utime(project_file, ns=(1, 1))
+        assert parse_cache.load(project_file) == {"version": "7.0"}
+        assert len(parses) == 2
+
+    def test_touched_file_is_not_reparsed(self, parse_cache, project_file, monkeypatch):
+        """A new mtime with unchanged content is recognized by the content hash."""
+        parse_cache.load(project_file)
+        parses = _count_parses(monkeypatch)
+
+        os.utime(project_file, ns=(10**18, 10**18))
+        parse_cache.load(project_file)
+        parse_cache.load(project_file)
+
+        assert parses == []
+
+    def test_corrupt_entry_is_discarded(self, parse_cache, project_file):
+        """Unreadable entries count as misses and are replaced."""
+        parse_cache.load(project_file)
+        (entry,) = parse_cache.directory.iterdir()
+        entry.write_bytes(b"not a pickle")
+
+        assert parse_cache.load(project_file)["version"] == "9.0"
+        assert len(parse_cache) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries are removed once the cap is exceeded."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"p{i}.tscproj"
+            path.write_text(json.dumps({"payload": "x" * 1000, "i": i}), encoding="utf-8")
+            paths.append(path)
+        parse_cache = ParseCache(tmp_path / "cache", max_bytes=2500)
+
+        parse_cache.load(paths[0])
+        parse_cache.load(paths[1])
+        entries = {p.name: p for p in parse_cache.directory.iterdir()}
+        for entry in entries.values():
+            os.utime(entry, ns=(1, 1))
+        parse_cache.load(paths[0])  # Refreshes the first entry
+        parse_cache.load(paths[2])  # Evicts the second
+
+        assert len(parse_cache) == 2
+        assert parse_cache.size() <= 2500
+        assert parse_cache._entry_path(paths[1].resolve()).name not in {
+            p.name for p in parse_cache.directory.iterdir()
+        }
+
+    def test_clear_and_invalidate(self, parse_cache, project_file):
+        """Entries can be dropped individually or all at once."""
+        parse_cache.load(project_file)
+        parse_cache.invalidate(project_file)
+        assert len(parse_cache) == 0
+
+        parse_cache.load(project_file)
+        assert parse_cache.clear() == 1
+        assert parse_cache.size() == 0
+
+    def test_environment(self, project_file, tmp_path, monkeypatch):
+        """The environment selects the directory and can disable the cache."""
+        monkeypatch.setenv("CAMTASIO_CACHE_DIR", str(tmp_path / "env-cache"))
+        load_json_cached(project_file)
+        assert len(ParseCache()) == 1
+
+        monkeypatch.setenv("CAMTASIO_CACHE", "off")
+        assert not cache_enabled()
+        monkeypatch.setattr(ParseCache, "load", None)
+        assert load_json_cached(project_file)["version"] == "9.0"
+        assert ParseCache(max_bytes=None).max_bytes == cache.DEFAULT_MAX_BYTES
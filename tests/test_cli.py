@@ -686,6 +686,57 @@ class TestModernCLI:
         finally:
             input_path.unlink(missing_ok=True)
 
+    def test_batch_parallel_xyscale(self, cli, tmp_path, capsys):
+        """Test batch xyscale with a process pool."""
+        data = Project.empty(width=1920, height=1080).to_dict()
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.tscproj").write_text(json.dumps(data), encoding="utf-8")
+
+        cli.batch(str(tmp_path / "*.tscproj"), "xyscale", 2.0, jobs=2, backup=False)
+        captured = capsys.readouterr()
+
+        assert "Workers: 2" in captured.out
+        assert "Successful: 3" in captured.out
+        for name in ("a", "b", "c"):
+            scaled = json.loads((tmp_path / f"{name}.scaled.tscproj").read_text())
+            assert scaled["width"] == 3840
+
+    def test_batch_unordered_reports_errors(self, cli, tmp_path, capsys):
+        """Test that failing files are reported per file in unordered mode."""
+        data = Project.empty().to_dict()
+        (tmp_path / "good.tscproj").write_text(json.dumps(data), encoding="utf-8")
+        (tmp_path / "bad.tscproj").write_text("{ invalid json", encoding="utf-8")
+
+        cli.batch(str(tmp_path / "*.tscproj"), "info", jobs=2, ordered=False)
+        captured = capsys.readouterr()
+
+        assert "Successful: 1" in captured.out
+        assert "Errors: 1" in captured.out
+        assert "Failed Files:" in captured.out
+        assert "bad.tscproj" in captured.out
+
+    @patch("builtins.input", side_effect=AssertionError("prompted"))
+    def test_batch_yes_skips_prompt(self, mock_input, cli, tmp_path, capsys):
+        """Test that --yes skips the confirmation prompt for large batches."""
+        data = Project.empty().to_dict()
+        for i in range(11):
+            (tmp_path / f"p{i}.tscproj").write_text(json.dumps(data), encoding="utf-8")
+
+        cli.batch(str(tmp_path / "*.tscproj"), "validate", yes=True)
+        captured = capsys.readouterr()
+
+        assert "Total: 11" in captured.out
+        mock_input.assert_not_called()
+
+    def test_batch_missing_scale_factor(self, cli, tmp_path, capsys):
+        """Test batch xyscale without a scale factor."""
+        (tmp_path / "a.tscproj").write_text(json.dumps(Project.empty().to_dict()))
+
+        cli.batch(str(tmp_path / "*.tscproj"), "xyscale")
+        captured = capsys.readouterr()
+
+        assert "xyscale requires scale factor" in captured.out
+
     def test_error_handling_corrupted_json(self, cli, capsys):
         """Test CLI commands with corrupted JSON."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".tscproj", delete=False) as f:
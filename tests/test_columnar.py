@@ -0,0 +1,132 @@
+# this_file: tests/test_columnar.py
+"""Tests for the NumPy-backed columnar timeline."""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.synthetic import SyntheticSpec, generate_project  # noqa: E402
+
+from camtasio.models import (  # noqa: E402
+    ColumnarTimeline,
+    Project,
+    Timeline,
+    Track,
+    VideoMedia,
+)
+
+
+@pytest.fixture
+def project_dict(simple_video_path):
+    """Real Camtasia project data."""
+    with open(simple_video_path / "project.tscproj", encoding="utf-8") as f:
+        return json.load(f)
+
+
+EXAMPLE_PATH = Path(__file__).parent.parent / "example" / "test_scaled.tscproj"
+
+
+@pytest.fixture
+def grouped_dict():
+    """Example project with media nested in a Group, StitchedMedia and UnifiedMedia."""
+    return json.loads(EXAMPLE_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def synthetic_dict():
+    """Synthetic project with video, audio and callout tracks."""
+    return generate_project(SyntheticSpec(tracks=4, clips=20, keyframes=3))
+
+
+class TestColumnarTimeline:
+    """Test vectorized timing edits against the object model."""
+
+    @pytest.mark.parametrize("source", ["project_dict", "synthetic_dict", "grouped_dict"])
+    @pytest.mark.parametrize("factor", [0.5, 1.37, 3.0])
+    def test_scale_matches_model(self, request, source, factor):
+        """Scaling the model in place gives the same result as scale_temporal()."""
+        data = request.getfixturevalue(source)
+        expected = Project.from_dict(copy.deepcopy(data)).timeline.scale_temporal(factor)
+        timeline = Project.from_dict(copy.deepcopy(data)).timeline
+
+        columnar = ColumnarTimeline.from_timeline(timeline)
+        columnar.scale_temporal(factor)
+        columnar.apply()
+
+        assert timeline.to_dict() == expected.to_dict()
+        assert timeline.duration == expected.duration
+
+    def test_scale_dict(self, synthetic_dict):
+        """Dictionary views write scaled timing back into the media dictionaries."""
+        expected = Timeline.from_dict(copy.deepcopy(synthetic_dict["timeline"]))
+        expected = expected.scale_temporal(2.5)
+
+        columnar = ColumnarTimeline.from_dict(synthetic_dict["timeline"])
+        columnar.scale_temporal(2.5)
+        columnar.apply()
+
+        assert Timeline.from_dict(synthetic_dict["timeline"]).to_dict() == expected.to_dict()
+
+    @pytest.mark.parametrize("factor", [0.37, 1.5])
+    def test_scale_nested_dict(self, grouped_dict, factor):
+        """Media nested in composites are scaled like the model does."""
+        timeline = grouped_dict["timeline"]
+        expected = Timeline.from_dict(copy.deepcopy(timeline)).scale_temporal(factor)
+
+        columnar = ColumnarTimeline.from_dict(timeline)
+        columnar.scale_temporal(factor)
+        columnar.apply()
+
+        assert any(track.nested for track in columnar.tracks)
+        assert Timeline.from_dict(timeline).to_dict() == expected.to_dict()
+
+    def test_missing_and_rational_values_are_kept(self):
+        """Absent keys stay absent and non-numeric values are not touched."""
+        media = {"_type": "VMFile", "start": 10, "duration": 20, "mediaStart": "1/3"}
+        data = {"sceneTrack": {"scenes": [{"csml": {"tracks": [{"medias": [media]}]}}]}}
+
+        columnar = ColumnarTimeline.from_dict(data)
+        columnar.scale_temporal(2.0)
+        columnar.apply()
+
+        assert media == {"_type": "VMFile", "start": 20, "duration": 40, "mediaStart": "1/3"}
+
+    def test_shift(self):
+        """Shifting moves start times of the selected tracks only."""
+        tracks = [
+            Track(track_index=i, medias=[VideoMedia(id=i, src=1, start=100, duration=50)])
+            for i in range(2)
+        ]
+        timeline = Timeline(id=1, tracks=tracks)
+        assert timeline.duration == 150
+
+        columnar = ColumnarTimeline.from_timeline(timeline)
+        columnar.shift(25, track_indices=[1])
+        columnar.apply()
+
+        assert [t.medias[0].start for t in tracks] == [100, 125]
+        assert timeline.duration == 175
+
+    def test_overlaps_and_stats(self):
+        """Overlapping media are reported and duration statistics computed."""
+        medias = [
+            VideoMedia(id=1, src=1, start=0, duration=100),
+            VideoMedia(id=2, src=1, start=100, duration=50),
+            VideoMedia(id=3, src=1, start=120, duration=10),
+            VideoMedia(id=4, src=1, start=125, duration=0),
+        ]
+        columnar = ColumnarTimeline.from_timeline(
+            Timeline(id=1, tracks=[Track(track_index=3, medias=medias)])
+        )
+
+        assert columnar.overlaps() == {3: [medias[2]]}
+        stats = columnar.duration_stats()
+        assert stats.media_count == 4
+        assert stats.timeline_duration == 150
+        assert stats.total_media_duration == 160
+        assert stats.max_media_duration == 100
+        assert ColumnarTimeline().duration_stats().media_count == 0
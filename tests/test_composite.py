@@ -0,0 +1,154 @@
+# this_file: tests/test_composite.py
+"""Tests for composite media and recursive media iteration."""
+
+import json
+from pathlib import Path
+
+from camtasio.models import (
+    AudioMedia,
+    GroupMedia,
+    StitchedMedia,
+    Timeline,
+    Track,
+    UnifiedMedia,
+    VideoMedia,
+    create_media_from_dict,
+    iter_media_dicts,
+)
+
+EXAMPLE_PATH = Path(__file__).parent.parent / "example" / "test_integer_preserved.tscproj"
+
+
+def _nested_timeline() -> Timeline:
+    """Timeline with a Group holding a StitchedMedia and a UnifiedMedia."""
+    stitched = StitchedMedia(id=3, src=0, medias=[VideoMedia(id=4, src=2)])
+    unified = UnifiedMedia(
+        id=6, src=0, video=VideoMedia(id=7, src=3), audio=AudioMedia(id=8, src=3)
+    )
+    group = GroupMedia(
+        id=2,
+        src=0,
+        start=100,
+        duration=400,
+        tracks=[Track(track_index=0, medias=[stitched]), Track(track_index=1, medias=[unified])],
+    )
+    return Timeline(
+        id=1,
+        tracks=[
+            Track(track_index=0, medias=[VideoMedia(id=1, src=1), group, VideoMedia(id=9, src=4)])
+        ],
+    )
+
+
+class TestCompositeFactory:
+    """Test decoding composite media."""
+
+    def test_types_and_round_trip(self):
+        """Groups, StitchedMedia and UnifiedMedia decode to composites and back."""
+        data = json.loads(EXAMPLE_PATH.read_text(encoding="utf-8"))
+        tracks = data["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"]
+
+        timeline = Timeline.from_dict(data["timeline"])
+        round_trip = timeline.to_dict()["sceneTrack"]["scenes"][0]["csml"]["tracks"]
+
+        types = {type(media) for _, media in timeline.iter_media()}
+        assert {GroupMedia, StitchedMedia, UnifiedMedia} <= types
+        assert [(m["id"], m["_type"]) for m in iter_media_dicts(round_trip)] == [
+            (m["id"], m["_type"]) for m in iter_media_dicts(tracks)
+        ]
+
+    def test_stitched_fields(self):
+        """StitchedMedia keeps its clips and minimum media start."""
+        media = create_media_from_dict(
+            {
+                "_type": "StitchedMedia",
+                "id": 1,
+                "minMediaStart": 30,
+                "medias": [{"_type": "VMFile", "id": 2, "src": 5}],
+            }
+        )
+
+        assert isinstance(media, StitchedMedia)
+        assert isinstance(media.medias[0], VideoMedia)
+        assert media.to_dict()["minMediaStart"] == 30
+
+
+class TestIterMedia:
+    """Test depth-first media iteration."""
+
+    def test_depth_first_order_and_paths(self):
+        """Containers come before their media; paths list the enclosing containers."""
+        timeline = _nested_timeline()
+        track = timeline.tracks[0]
+        group = track.medias[1]
+
+        items = [(path, media.id) for path, media in timeline.iter_media()]
+
+        assert [media_id for _, media_id in items] == [1, 2, 3, 4, 6, 7, 8, 9]
+        paths = {media_id: path for path, media_id in items}
+        assert paths[2] == (track,)
+        assert paths[4] == (track, group, group.tracks[0], group.tracks[0].medias[0])
+        assert paths[8] == (track, group, group.tracks[1], group.tracks[1].medias[0])
+
+    def test_not_recursive(self):
+        """Without recursion only the top-level media are yielded."""
+        timeline = _nested_timeline()
+        assert [media.id for _, media in timeline.iter_media(recursive=False)] == [1, 2, 9]
+
+    def test_lazy(self):
+        """Iteration is a generator; nothing past the first item is visited."""
+        timeline = _nested_timeline()
+        timeline.tracks[0].medias[1].tracks = None  # Would fail if visited
+
+        iterator = timeline.iter_media()
+        assert next(iterator)[1].id == 1
+
+    def test_deep_nesting(self):
+        """Deeply nested groups don't hit the recursion limit."""
+        media: VideoMedia = VideoMedia(id=0, src=1)
+        for depth in range(1, 2000):
+            media = GroupMedia(id=depth, src=0, tracks=[Track(track_index=0, medias=[media])])
+        timeline = Timeline(id=1, tracks=[Track(track_index=0, medias=[media])])
+
+        *_, (path, innermost) = timeline.iter_media()
+
+        assert innermost.id == 0
+        assert len(path) == 1 + 2 * 1999
+
+
+class TestCompositeScaling:
+    """Test scaling composite media recursively."""
+
+    def test_scale_temporal_reaches_nested_media(self):
+        """Nested media are scaled along with their containers."""
+        timeline = _nested_timeline()
+        for _, media in timeline.iter_media():
+            media.start, media.duration = 10, 20
+
+        scaled = timeline.scale_temporal(2.0)
+
+        starts = {media.id: (media.start, media.duration) for _, media in scaled.iter_media()}
+        assert starts[4] == (20, 40)
+        assert starts[7] == (20, 40)
+        assert starts[8] == (20, 20)  # Audio keeps its duration
+        assert [m.start for _, m in timeline.iter_media()] == [10] * 8
+
+    def test_scale_spatial_reaches_nested_media(self):
+        """Nested media are scaled spatially as well."""
+        group = GroupMedia(
+            id=1,
+            src=0,
+            parameters={"translation0": 10},
+            tracks=[
+                Track(
+                    track_index=0,
+                    medias=[VideoMedia(id=2, src=1, parameters={"translation0": 5})],
+                )
+            ],
+        )
+
+        scaled = group.scale_spatial(2.0)
+
+        assert scaled.parameters["translation0"] == 20
+        assert scaled.tracks[0].medias[0].parameters["translation0"] == 10
+        assert group.tracks[0].medias[0].parameters["translation0"] == 5
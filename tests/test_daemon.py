@@ -0,0 +1,204 @@
+# this_file: tests/test_daemon.py
+"""Tests for the CLI daemon and its RPC protocol."""
+
+import json
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from camtasio.cli.app import CamtasioCLI
+from camtasio.cli.daemon import (
+    FORWARDED_COMMANDS,
+    INVALID_REQUEST,
+    MAX_REQUEST_BYTES,
+    METHOD_NOT_FOUND,
+    DaemonError,
+    DaemonServer,
+    ProjectCache,
+    call,
+    forward,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix sockets")
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path; Unix socket paths are limited to about 100 bytes."""
+    with tempfile.TemporaryDirectory(prefix="camtasio-") as directory:
+        yield Path(directory) / "daemon.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """Daemon serving in a background thread."""
+    server = DaemonServer(socket_path, max_projects=2)
+    ready = threading.Event()
+    thread = threading.Thread(target=server.serve, kwargs={"ready": ready.set}, daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield server
+    if thread.is_alive():
+        call("shutdown", socket_path=socket_path)
+        thread.join(5)
+
+
+@pytest.fixture
+def project_file(tmp_path):
+    """Small project file."""
+    path = tmp_path / "project.tscproj"
+    data = {
+        "version": "9.0",
+        "sourceBin": [{"id": 1, "name": "a.mp4", "_type": "VideoSource", "src": "/fake/a.mp4"}],
+        "timeline": {"sceneTrack": {"scenes": [{"csml": {"tracks": [{"medias": []}]}}]}},
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestProjectCache:
+    """Test the LRU cache of loaded projects."""
+
+    def test_hits_misses_and_eviction(self, tmp_path):
+        """Unchanged files are hits; changed files reload; old entries are evicted."""
+        paths = [tmp_path / f"p{i}.tscproj" for i in range(3)]
+        for path in paths:
+            path.write_text("{}", encoding="utf-8")
+        cache = ProjectCache(max_entries=2)
+        loads = []
+
+        def load(path):
+            loads.append(path.name)
+            return path.read_text(encoding="utf-8")
+
+        cache.get(paths[0], "raw", load)
+        cache.get(paths[0], "raw", load)
+        paths[0].write_text('{"x": 1}', encoding="utf-8")
+        assert cache.get(paths[0], "raw", load) == '{"x": 1}'
+        cache.get(paths[1], "raw", load)
+        cache.get(paths[2], "raw", load)  # Evicts the first path
+
+        assert loads == ["p0.tscproj", "p0.tscproj", "p1.tscproj", "p2.tscproj"]
+        assert (cache.hits, cache.misses, len(cache)) == (1, 4, 2)
+
+
+class TestDaemon:
+    """Test the server, the client and command forwarding."""
+
+    def test_ping_stats_and_errors(self, daemon, socket_path):
+        """Control methods answer; unknown methods are JSON-RPC errors."""
+        assert call("ping", socket_path=socket_path)["pid"] > 0
+
+        with pytest.raises(DaemonError) as excinfo:
+            call("explode", socket_path=socket_path)
+        assert excinfo.value.code == METHOD_NOT_FOUND
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+            conn.sendall(b"not json\n")
+            response = json.loads(conn.makefile().readline())
+        assert response["error"]["code"] == -32700
+
+        assert call("stats", socket_path=socket_path)["requests"] == 2
+
+    def test_stalled_client_times_out(self, daemon, socket_path):
+        """A request that never ends is answered with an error; others get through."""
+        daemon.request_timeout = 0.2
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+            conn.sendall(b'{"jsonrpc": "2.0", "method": "ping"')
+            response = json.loads(conn.makefile().readline())
+        assert response["error"]["code"] == INVALID_REQUEST
+        assert "Timed out" in response["error"]["message"]
+
+        assert call("ping", socket_path=socket_path)["pid"] > 0
+
+    def test_large_output(self, daemon, socket_path, monkeypatch, capsys):
+        """Responses are not limited to the request size."""
+        output = "x" * (2 * MAX_REQUEST_BYTES)
+        monkeypatch.setattr(CamtasioCLI, "version", lambda self: print(output))
+
+        assert forward(["version"], socket_path) == 0
+        assert capsys.readouterr().out == output + "\n"
+
+    def test_forwarded_commands_reuse_projects(self, daemon, socket_path, project_file, capsys):
+        """Forwarded commands print the same output and share loaded projects."""
+        CamtasioCLI().track_ls(str(project_file))
+        local_output = capsys.readouterr().out
+
+        assert forward(["track_ls", str(project_file)], socket_path) == 0
+        assert forward(["track_ls", str(project_file)], socket_path) == 0
+        forwarded = capsys.readouterr().out
+
+        assert forwarded == local_output * 2
+        assert daemon.cache.hits == 1
+
+    def test_relative_paths_and_exit_codes(self, daemon, socket_path, project_file, monkeypatch):
+        """Paths resolve against the client's directory; usage errors exit 2."""
+        monkeypatch.chdir(project_file.parent)
+
+        result = call(
+            "run", {"argv": ["validate", project_file.name], "cwd": "."}, socket_path=socket_path
+        )
+        assert result["exit_code"] == 0
+        assert "Project loads successfully" in result["stdout"]
+
+        assert forward(["info"], socket_path) == 2
+
+    def test_client_environment(self, daemon, socket_path, monkeypatch, capsys, tmp_path):
+        """Commands see the client's cache settings; the daemon's own are restored."""
+        monkeypatch.setenv("CAMTASIO_CACHE", "0")
+        monkeypatch.setenv("CAMTASIO_CACHE_DIR", str(tmp_path / "client-cache"))
+
+        assert forward(["cache"], socket_path) == 0
+        output = capsys.readouterr().out
+        assert "Enabled: no" in output
+        assert "client-cache" in output
+
+        result = call("run", {"argv": ["cache"], "cwd": "."}, socket_path=socket_path)
+        assert "Enabled: yes" in result["stdout"]
+        assert "client-cache" not in result["stdout"]
+
+    def test_prompts_never_read_daemon_stdin(self, daemon, socket_path, project_file, monkeypatch):
+        """Prompting commands run locally; a forwarded prompt fails instead of blocking."""
+        assert "media_rm" not in FORWARDED_COMMANDS
+        assert forward(["media_rm", str(project_file)], socket_path) is None
+
+        monkeypatch.setattr(CamtasioCLI, "version", lambda self: input("Continue? "))
+        result = call("run", {"argv": ["version"], "cwd": "."}, socket_path=socket_path)
+
+        assert result["exit_code"] == 1
+        assert "EOFError" in result["stderr"]
+
+    def test_fallback_to_local(self, socket_path, monkeypatch):
+        """Without a daemon, or for local-only commands, forward() declines."""
+        assert forward(["info", "x.tscproj"], socket_path) is None
+        assert forward(["batch", "*.tscproj", "info"], socket_path) is None
+        assert forward([], socket_path) is None
+
+        monkeypatch.setenv("CAMTASIO_DAEMON", "0")
+        assert forward(["info", "x.tscproj"], socket_path) is None
+
+    def test_shutdown_and_stale_socket(self, socket_path):
+        """Shutdown removes the socket; a stale socket file is replaced."""
+        socket_path.touch()
+        server = DaemonServer(socket_path)
+        ready = threading.Event()
+        thread = threading.Thread(target=server.serve, kwargs={"ready": ready.set}, daemon=True)
+        thread.start()
+        assert ready.wait(5)
+
+        with pytest.raises(RuntimeError, match="already listening"):
+            DaemonServer(socket_path).serve()
+
+        assert call("shutdown", socket_path=socket_path) is True
+        thread.join(5)
+        assert not socket_path.exists()
+
+    def test_forwarded_commands_exist(self):
+        """Every forwarded command is a CLI command."""
+        assert all(callable(getattr(CamtasioCLI, name, None)) for name in FORWARDED_COMMANDS)
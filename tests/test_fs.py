@@ -0,0 +1,67 @@
+# this_file: tests/test_fs.py
+"""Tests for concurrent media file checks."""
+
+import os
+
+import pytest
+
+from camtasio.utils import fs
+from camtasio.utils.fs import FileStatus, check_files
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    """Directory with two media files and a subdirectory."""
+    (tmp_path / "a.mp4").write_bytes(b"x" * 10)
+    (tmp_path / "b.wav").write_bytes(b"x" * 20)
+    (tmp_path / "clips").mkdir()
+    return tmp_path
+
+
+class TestCheckFiles:
+    """Test existence and size checks."""
+
+    def test_statuses(self, media_dir):
+        """Files, directories and missing paths are told apart."""
+        paths = [media_dir / "a.mp4", str(media_dir / "b.wav"), media_dir / "clips"]
+        paths.append(media_dir / "gone.mp4")
+
+        statuses = check_files(paths)
+
+        assert statuses[str(media_dir / "a.mp4")] == FileStatus(True, True, 10)
+        assert statuses[str(media_dir / "b.wav")].size == 20
+        assert statuses[str(media_dir / "clips")].exists
+        assert not statuses[str(media_dir / "clips")].is_file
+        assert statuses[str(media_dir / "gone.mp4")] == FileStatus()
+        assert check_files([]) == {}
+
+    def test_shared_directory_is_listed_once(self, media_dir, monkeypatch):
+        """Paths in one directory use one listing; unlisted names aren't stat'ed."""
+        stat_calls = []
+        stat_path = fs._stat_path
+
+        def counting_stat(path):
+            stat_calls.append(path)
+            return stat_path(path)
+
+        monkeypatch.setattr(fs, "_stat_path", counting_stat)
+        names = ["a.mp4", "b.wav", "gone.mp4", "a.mp4"]
+
+        statuses = check_files(str(media_dir / name) for name in names)
+
+        assert len(statuses) == 3
+        assert statuses[str(media_dir / "a.mp4")].exists
+        assert stat_calls == []
+
+    def test_unusual_paths(self, media_dir, monkeypatch):
+        """Relative, broken and differently cased paths behave like ``os.stat``."""
+        monkeypatch.chdir(media_dir)
+        (media_dir / "link.mp4").symlink_to(media_dir / "missing.mp4")
+
+        statuses = check_files(["a.mp4", "link.mp4", "A.MP4", "", "bad\0name"])
+
+        assert statuses["a.mp4"].size == 10
+        assert not statuses["link.mp4"].exists
+        assert statuses["A.MP4"].exists == os.path.exists("A.MP4")
+        assert statuses[""].exists
+        assert not statuses["bad\0name"].exists
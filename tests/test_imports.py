@@ -0,0 +1,53 @@
+# this_file: tests/test_imports.py
+"""Tests for the lazily imported public API."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import camtasio
+from camtasio import models, operations, serialization
+
+
+def _loaded_modules(statement):
+    """Modules loaded by a statement in a fresh interpreter."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    return set(completed.stdout.split())
+
+
+class TestLazyImports:
+    """Test that names resolve on access and heavy modules stay unloaded."""
+
+    def test_import_is_cheap(self):
+        """Importing the package loads none of its subpackages or dependencies."""
+        loaded = _loaded_modules("import camtasio")
+
+        assert {"camtasio.models", "camtasio.cli", "numpy", "fire", "rich"}.isdisjoint(loaded)
+
+    def test_json_loading_skips_models(self):
+        """Loading JSON or a summary doesn't load the domain models or NumPy."""
+        loaded = _loaded_modules(
+            "from camtasio.serialization import load_json_file\n"
+            "from camtasio.operations import load_summary\n"
+            "import camtasio.cli.app"
+        )
+
+        assert {"camtasio.models", "numpy", "fire", "rich"}.isdisjoint(loaded)
+
+    @pytest.mark.parametrize("package", [camtasio, models, operations, serialization])
+    def test_all_names_resolve(self, package):
+        """Every exported name can be accessed and is listed by dir()."""
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+
+    def test_unknown_name(self):
+        """Unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = camtasio.missing
@@ -0,0 +1,128 @@
+# this_file: tests/test_intervals.py
+"""Tests for the track interval index."""
+
+import random
+
+import pytest
+
+from camtasio.models import IntervalIndex, Timeline, Track, VideoMedia
+
+
+def _media(media_id: int, start: int, duration: int) -> VideoMedia:
+    return VideoMedia(id=media_id, src=1, start=start, duration=duration)
+
+
+@pytest.fixture
+def random_medias():
+    """Overlapping media of random length, including empty ones."""
+    rng = random.Random(7)
+    return [_media(i, rng.randrange(1000), rng.randrange(0, 80)) for i in range(300)]
+
+
+def _brute_force(medias, start, end):
+    hits = [m for m in medias if m.start < end and m.start + m.duration > start]
+    return sorted(hits, key=lambda m: m.start)
+
+
+class TestIntervalIndex:
+    """Test queries against a linear scan."""
+
+    def test_queries_match_scan(self, random_medias):
+        """Point and range queries return exactly the overlapping media."""
+        index = IntervalIndex(random_medias)
+        for time in range(-5, 1100, 7):
+            assert index.at(time) == _brute_force(random_medias, time, time + 1)
+            assert index.overlapping(time, time + 37) == _brute_force(
+                random_medias, time, time + 37
+            )
+        assert index.overlapping(50, 50) == []
+        assert index.max_end == max(m.start + m.duration for m in random_medias)
+
+    def test_overlaps_match_scan(self, random_medias):
+        """Every overlapping pair is reported once; empty media overlap nothing."""
+        index = IntervalIndex(random_medias)
+        expected = {
+            frozenset((a.id, b.id))
+            for i, a in enumerate(random_medias)
+            for b in random_medias[i + 1 :]
+            if a.duration and b.duration
+            if a.start < b.start + b.duration and b.start < a.start + a.duration
+        }
+
+        pairs = index.overlaps()
+
+        assert {frozenset((a.id, b.id)) for a, b in pairs} == expected
+        assert len(pairs) == len(expected)
+
+    def test_append(self):
+        """Appending keeps queries correct and refuses out-of-order media."""
+        index = IntervalIndex()
+        assert index.max_end == 0
+        for i in range(20):
+            assert index.append(_media(i, i * 10, 15))
+
+        assert [m.id for m in index.at(100)] == [9, 10]
+        assert index.max_end == 205
+        assert not index.append(_media(99, 5, 1))
+        assert len(index.medias) == 20
+
+
+class TestTrackIntervals:
+    """Test the interval index cached on tracks."""
+
+    def test_track_queries(self):
+        """Track and timeline queries use the media time ranges."""
+        track = Track(track_index=0)
+        for i in range(5):
+            track.add_media(_media(i, i * 100, 100))
+        other = Track(track_index=1, medias=[_media(9, 150, 10)])
+        timeline = Timeline(id=1, tracks=[track, other])
+
+        assert [m.id for m in track.media_at(100)] == [1]
+        assert [m.id for m in track.media_in_range(150, 301)] == [1, 2, 3]
+        assert track.find_overlaps() == []
+        assert [(t.track_index, m.id) for t, m in timeline.media_at(155)] == [(0, 1), (1, 9)]
+        assert timeline.duration == 500
+
+    def test_add_media_updates_index(self):
+        """add_media extends the cached index instead of discarding it."""
+        track = Track(track_index=0, medias=[_media(0, 0, 100)])
+        index = track.intervals
+
+        track.add_media(_media(1, 100, 50))
+
+        assert track.intervals is index
+        assert track.duration == 150
+
+    def test_duration_follows_in_place_edits(self):
+        """Duration reflects timing edits and replaced items without invalidation."""
+        track = Track(track_index=0, medias=[_media(0, 0, 100), _media(1, 100, 50)])
+        timeline = Timeline(id=1, tracks=[track])
+        assert track.intervals.max_end == 150
+
+        track.medias[1].duration = 250
+        assert track.duration == 350
+        assert timeline.duration == 350
+
+        track.medias[1] = _media(2, 0, 40)
+        assert track.duration == 100
+        assert timeline.duration == 100
+
+    def test_other_changes_rebuild(self):
+        """Out-of-order adds, removals and direct list edits are detected."""
+        track = Track(track_index=0, medias=[_media(0, 100, 100)])
+        assert track.duration == 200
+
+        track.add_media(_media(1, 0, 300))
+        assert track.duration == 300
+        assert len(track.find_overlaps()) == 1
+
+        track.remove_media(track.medias[1])
+        assert track.duration == 200
+
+        track.medias.append(_media(2, 500, 10))
+        assert track.duration == 510
+
+        track.medias[0].duration = 1000
+        track.invalidate_intervals()
+        assert track.duration == 1100
@@ -0,0 +1,171 @@
+# this_file: tests/test_lazy.py
+"""Tests for the lazy Project mode."""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from camtasio.models import LazyList, Project, SourceItem, Track, VideoMedia
+from camtasio.serialization import ProjectLoader
+
+
+@pytest.fixture
+def project_data():
+    """Project dictionary with two tracks and one source item."""
+    project = Project.empty()
+    project.source_bin.add_item(
+        SourceItem(id=1, src="clip.mp4", rect=[0, 0, 1920, 1080], last_mod="")
+    )
+    for index in range(2):
+        track = Track(track_index=index)
+        track.add_media(VideoMedia(id=10 + index, src=1, start=0, duration=100 * (index + 1)))
+        project.timeline.add_track(track)
+    return project.to_dict()
+
+
+class TestLazyList:
+    """Test LazyList decoding behavior."""
+
+    def test_len_does_not_decode(self):
+        """len() works without decoding anything."""
+        calls = []
+        items = LazyList([1, 2, 3], lambda raw: calls.append(raw) or raw * 10)
+
+        assert len(items) == 3
+        assert calls == []
+        assert items.pending_count == 3
+
+    def test_index_decodes_once(self):
+        """Indexing decodes an item exactly once."""
+        calls = []
+        items = LazyList([1, 2, 3], lambda raw: calls.append(raw) or raw * 10)
+
+        assert items[1] == 20
+        assert items[-1] == 30
+        assert items[1] == 20
+        assert calls == [2, 3]
+        assert items.pending_count == 1
+
+    def test_iteration_and_slices(self):
+        """Iteration and slicing return decoded items."""
+        items = LazyList([1, 2, 3], lambda raw: raw * 10)
+
+        assert items[:2] == [10, 20]
+        assert list(items) == [10, 20, 30]
+        assert items.materialized or items.pending_count == 0
+
+    def test_index_out_of_range(self):
+        """Out-of-range access raises IndexError."""
+        items = LazyList([1], lambda raw: raw)
+        with pytest.raises(IndexError):
+            items[5]
+
+    def test_mutations(self):
+        """Mutations keep decoded semantics."""
+        items = LazyList([1, 2], lambda raw: raw * 10)
+
+        items.append(99)
+        assert items[2] == 99
+        items.insert(0, 5)
+        assert items == [5, 10, 20, 99]
+        del items[0]
+        assert items.pop() == 99
+        assert items == [10, 20]
+
+    def test_pickle_as_plain_list(self):
+        """Pickling produces a decoded plain list."""
+        items = LazyList([1, 2], lambda raw: raw * 10)
+        restored = pickle.loads(pickle.dumps(items))
+        assert type(restored) is list
+        assert restored == [10, 20]
+
+    def test_ordering_and_repetition(self):
+        """Comparisons and repetition see decoded items."""
+        items = LazyList([1, 2], lambda raw: raw * 10)
+
+        assert items < [10, 30] and items <= [10, 20]
+        assert items > [10] and items >= [10, 20]
+        assert [10, 30] > items
+        assert LazyList([1], lambda raw: raw * 10) < LazyList([2], lambda raw: raw * 10)
+        assert LazyList([1], lambda raw: raw * 10) * 2 == [10, 10]
+        assert 2 * LazyList([1], lambda raw: raw * 10) == [10, 10]
+        prefix = [5]
+        assert prefix + LazyList([1], lambda raw: raw * 10) == [5, 10]
+
+    def test_copies_and_plain_construction(self):
+        """Copies are decoded plain lists; without a decoder the list is plain."""
+        items = LazyList([1, 2], lambda raw: [raw * 10])
+
+        shallow = copy.copy(LazyList([1, 2], lambda raw: [raw * 10]))
+        deep = copy.deepcopy(items)
+        assert type(shallow) is list and shallow == [[10], [20]]
+        assert deep == [[10], [20]] and deep[0] is not items[0]
+
+        plain = LazyList(raw for raw in [1, 2])
+        assert plain.materialized
+        assert plain == [1, 2]
+
+
+class TestLazyProject:
+    """Test lazy project loading."""
+
+    def test_lazy_tracks(self, project_data):
+        """Tracks and media stay undecoded until touched."""
+        project = Project.from_dict(project_data, lazy=True)
+
+        assert isinstance(project.timeline.tracks, LazyList)
+        assert project.timeline.track_count == 2
+        assert project.timeline.tracks.pending_count == 2
+
+        track = project.timeline.tracks[0]
+        assert isinstance(track.medias, LazyList)
+        assert track.medias.pending_count == 1
+        assert project.timeline.tracks.pending_count == 1
+
+    def test_lazy_matches_eager(self, project_data):
+        """Lazy and eager projects serialize identically."""
+        lazy = Project.from_dict(project_data, lazy=True)
+        eager = Project.from_dict(project_data)
+
+        assert lazy.duration == eager.duration
+        assert lazy.timeline.media_count == eager.timeline.media_count
+        assert lazy.to_dict() == eager.to_dict()
+        assert lazy == eager
+
+    def test_lazy_tracks_match_eager_tracks(self, project_data):
+        """Copying, converting and repeating lazy tracks matches eager ones."""
+        lazy = Project.from_dict(project_data, lazy=True).timeline.tracks
+        eager = Project.from_dict(project_data).timeline.tracks
+
+        assert [dataclasses.asdict(track) for track in lazy] == [
+            dataclasses.asdict(track) for track in eager
+        ]
+        assert copy.copy(lazy) == eager
+        assert copy.deepcopy(lazy) == eager
+        assert lazy * 2 == eager * 2
+        assert 2 * lazy == eager + eager
+
+    def test_lazy_source_bin(self, project_data):
+        """Source bin items are decoded on lookup."""
+        project = Project.from_dict(project_data, lazy=True)
+
+        assert project.source_bin.items.pending_count == 1
+        assert project.source_bin.get_by_id(1).src == "clip.mp4"
+        assert project.source_bin.items.pending_count == 0
+
+    def test_lazy_scaling(self, project_data):
+        """Scaling a lazy project works like an eager one."""
+        lazy = Project.from_dict(project_data, lazy=True).scale_temporal(2.0)
+        eager = Project.from_dict(project_data).scale_temporal(2.0)
+        assert lazy.to_dict() == eager.to_dict()
+
+    def test_loader_lazy_option(self, simple_video_path):
+        """ProjectLoader(lazy=True) returns a lazily decoded project."""
+        path = simple_video_path / "project.tscproj"
+        lazy = ProjectLoader(lazy=True).load_file(path)
+        eager = ProjectLoader().load_file(path)
+
+        assert isinstance(lazy.timeline.tracks, LazyList)
+        assert lazy.to_dict() == eager.to_dict()
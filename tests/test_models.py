@@ -7,12 +7,14 @@ from camtasio.models import (
     AudioMedia,
     Callout,
     Canvas,
+    ImageMedia,
     Project,
     ProjectMetadata,
     SourceItem,
     SourceTrack,
     Timeline,
     Track,
+    Transition,
     VideoMedia,
 )
 
@@ -312,3 +314,98 @@ class TestProject:
         project.timeline.add_track(track)
 
         assert project.duration == pytest.approx(10.0)
+
+
+class TestSlottedModels:
+    """Test the compact slotted model classes."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            VideoMedia(id=1, src=1),
+            AudioMedia(id=1, src=1),
+            ImageMedia(id=1, src=1),
+            Callout(id=1, src=0),
+            Transition(name="Fade", duration=10),
+            Track(track_index=0),
+            SourceTrack(range=[0, 1], type=0, edit_rate=30, track_rect=[0, 0, 1, 1]),
+            SourceItem(id=1, src="a.mp4", rect=[0, 0, 1, 1], last_mod=""),
+        ],
+    )
+    def test_no_instance_dict(self, instance):
+        """Model instances store their fields in slots only."""
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.undeclared = 1
+
+    def test_subclass_to_dict(self):
+        """Subclass serialization still includes the base fields."""
+        audio = AudioMedia(id=3, src=2, start=5, channel_number="0")
+        image = ImageMedia(id=4, src=2, trim_start_sum=7)
+        callout = Callout.text("Hi")
+
+        assert audio.to_dict()["start"] == 5
+        assert audio.to_dict()["channelNumber"] == "0"
+        assert image.to_dict()["trimStartSum"] == 7
+        assert callout.to_dict()["def"]["text"] == "Hi"
+
+
+class TestStructuralSharing:
+    """Test that scaled copies share unchanged data with the original."""
+
+    def test_unscaled_containers_are_shared(self):
+        """Containers a scale does not touch are reused, not copied."""
+        media = VideoMedia(
+            id=1,
+            src=1,
+            duration=100,
+            attributes={"ident": "clip"},
+            parameters={"volume": 1.0, "translation0": {"keyframes": []}},
+            metadata={"note": "x"},
+        )
+
+        spatial = media.scale_spatial(2.0)
+        temporal = media.scale_temporal(2.0)
+
+        assert spatial.parameters is media.parameters
+        assert temporal.parameters is media.parameters
+        assert temporal.metadata is media.metadata
+        assert temporal.attributes is media.attributes
+        assert temporal.duration == 200
+
+    def test_scaled_track_transitions_are_independent(self):
+        """Adding a transition to a scaled track leaves the original alone."""
+        transition = Transition(name="Fade", duration=10)
+        track = Track(track_index=0, medias=[VideoMedia(id=1, src=1)], transitions=[transition])
+
+        for scaled in (track.scale_spatial(2.0), track.scale_temporal(2.0)):
+            scaled.add_transition(Transition(name="Wipe", duration=5))
+            assert len(scaled.transitions) == 2
+
+        assert track.transitions == [transition]
+        assert track.scale_spatial(2.0).transitions[0] is transition
+
+    def test_keyframes_of_original_are_not_mutated(self):
+        """Scaling animated parameters builds new dictionaries."""
+        animated = {"defaultValue": 10, "keyframes": [{"time": 10, "value": 5}]}
+        media = VideoMedia(id=1, src=1, parameters={"translation0": animated, "volume": 1.0})
+
+        scaled = media.scale_spatial(2.0).scale_temporal(3.0)
+
+        assert animated == {"defaultValue": 10, "keyframes": [{"time": 10, "value": 5}]}
+        assert scaled.parameters["translation0"]["keyframes"] == [{"time": 30, "value": 10.0}]
+        assert scaled.parameters["translation0"]["defaultValue"] == 10
+
+    def test_project_variants_share_source_bin(self):
+        """Temporal variants of a project share its source bin and canvas."""
+        item = SourceItem(id=1, src="a.mp4", rect=[0, 0, 1920, 1080], last_mod="")
+        project = Project.empty()
+        project.source_bin.add_item(item)
+        project.timeline.add_track(Track(track_index=0, medias=[VideoMedia(id=1, src=1)]))
+
+        slow = project.scale_temporal(2.0)
+        fast = project.scale_temporal(0.5)
+
+        assert slow.source_bin is fast.source_bin is project.source_bin
+        assert slow.canvas is project.canvas
+        assert project.scale_spatial(0.5).source_bin.items[0].metadata is item.metadata
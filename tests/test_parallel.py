@@ -0,0 +1,104 @@
+# this_file: tests/test_parallel.py
+"""Tests for transforming one project across several workers."""
+
+import copy
+
+import pytest
+from benchmarks.synthetic import SyntheticSpec, generate_project
+
+from camtasio.transforms import (
+    CompiledTransform,
+    CompositeTransformConfig,
+    PropertyTransformer,
+    TransformConfig,
+    TransformType,
+    partition_paths,
+    transform_parallel,
+)
+
+STEPS = [
+    TransformConfig(TransformType.SPATIAL, factor=1.5),
+    TransformConfig(TransformType.TEMPORAL, factor=2.0),
+]
+
+
+@pytest.fixture
+def project_dict():
+    """Synthetic project with nested groups and two scenes."""
+    data = generate_project(SyntheticSpec(tracks=3, clips=6, keyframes=2, group_depth=2))
+    scenes = data["timeline"]["sceneTrack"]["scenes"]
+    scenes.append(copy.deepcopy(scenes[0]))
+    return data
+
+
+class TestPartitionPaths:
+    """Test finding the lists that are split across workers."""
+
+    def test_source_bin_and_scene_tracks(self, project_dict):
+        """The source bin and the tracks of every scene are partitioned."""
+        scenes = ("timeline", "sceneTrack", "scenes")
+        assert partition_paths(project_dict) == [
+            ("sourceBin",),
+            (*scenes, 0, "csml", "tracks"),
+            (*scenes, 1, "csml", "tracks"),
+        ]
+
+    def test_malformed_parts_are_skipped(self):
+        """Missing or mistyped containers are left to the serial pass."""
+        data = {"sourceBin": {}, "timeline": {"sceneTrack": {"scenes": [None, {"csml": []}]}}}
+        assert partition_paths(data) == []
+
+
+class TestTransformParallel:
+    """Test the parallel transform against the serial one."""
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_matches_serial(self, project_dict, executor):
+        """Results equal the serial transform and the input is untouched."""
+        original = copy.deepcopy(project_dict)
+        expected = CompiledTransform(STEPS).transform(project_dict)
+
+        result = transform_parallel(project_dict, STEPS, workers=2, executor=executor)
+
+        assert result == expected
+        assert project_dict == original
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_in_place(self, project_dict, executor):
+        """In-place mode reassembles the transformed items into the input."""
+        expected = CompiledTransform(STEPS).transform(project_dict)
+        tracks = project_dict["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"]
+
+        result = transform_parallel(
+            project_dict, STEPS, in_place=True, workers=2, executor=executor
+        )
+
+        assert result is project_dict
+        assert result == expected
+        assert result["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"] is tracks
+
+    def test_custom_handlers_with_threads(self, project_dict):
+        """Custom handlers see the partitioned items too."""
+
+        def shift_src(key, value, node_type):
+            return value + 100 if key == "src" and isinstance(value, int) else value
+
+        expected = CompiledTransform(STEPS, [shift_src]).transform(project_dict)
+
+        result = transform_parallel(project_dict, STEPS, [shift_src], workers=3, executor="thread")
+
+        assert result == expected
+
+    def test_invalid_arguments(self, project_dict):
+        """Unknown executors and invalid steps are rejected."""
+        with pytest.raises(ValueError, match="Unknown executor"):
+            transform_parallel(project_dict, STEPS, executor="cluster")
+        with pytest.raises(ValueError, match="Scale factor must be positive"):
+            transform_parallel(project_dict, [TransformConfig(TransformType.SPATIAL, factor=0)])
+
+    def test_transformer_workers(self, project_dict):
+        """PropertyTransformer splits the work when its config asks for workers."""
+        serial = PropertyTransformer(CompositeTransformConfig(STEPS)).transform_dict(project_dict)
+        config = CompositeTransformConfig(STEPS, workers=2)
+
+        assert PropertyTransformer(config).transform_dict(project_dict) == serial
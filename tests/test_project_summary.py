@@ -0,0 +1,187 @@
+# this_file: tests/test_project_summary.py
+"""Tests for the precomputed project summary."""
+
+import json
+import os
+
+import pytest
+
+from camtasio.cli.app import CamtasioCLI
+from camtasio.operations import project_summary
+from camtasio.operations.project_summary import (
+    ProjectSummary,
+    load_summary,
+    sidecar_path,
+    summarize_project,
+)
+
+
+@pytest.fixture
+def project_data():
+    """Project with media, two tracks and a marker."""
+    clips = [{"name": f"Clip {i}", "start": i * 100, "duration": 100} for i in range(7)]
+    clips[0]["effects"] = [{"effectName": "Blur"}, {"effectName": "Glow"}]
+    return {
+        "version": "9.0",
+        "sourceBin": [
+            {"id": 1, "name": "a.mp4", "_type": "VideoSource", "src": "/fake/a.mp4"},
+            {"id": 2, "_type": "AudioSource"},
+        ],
+        "timeline": {
+            "sceneTrack": {
+                "timeline": {"width": 1920, "height": 1080, "framerate": 30},
+                "scenes": [
+                    {
+                        "csml": {
+                            "tracks": [
+                                {"trackType": "video", "medias": clips},
+                                {"medias": [{"start": 50, "duration": 2000}]},
+                            ]
+                        }
+                    }
+                ],
+            },
+            "markers": [{"name": "Intro", "time": 1500, "type": "chapter"}],
+        },
+    }
+
+
+@pytest.fixture
+def project_file(tmp_path, project_data):
+    """Project data written to a file."""
+    path = tmp_path / "project.tscproj"
+    path.write_text(json.dumps(project_data), encoding="utf-8")
+    return path
+
+
+def _count_summaries(monkeypatch):
+    calls = []
+    summarize = project_summary.summarize_project
+
+    def counting_summarize(data):
+        calls.append(data)
+        return summarize(data)
+
+    monkeypatch.setattr(project_summary, "summarize_project", counting_summarize)
+    return calls
+
+
+class TestSummarizeProject:
+    """Test the statistics extracted from project data."""
+
+    def test_statistics(self, project_data):
+        """Counts, durations and previews match the project data."""
+        summary = summarize_project(project_data)
+
+        assert (summary.version, summary.width, summary.height, summary.framerate) == (
+            "9.0",
+            1920,
+            1080,
+            30,
+        )
+        assert summary.media_types == {"VideoSource": 1, "AudioSource": 1}
+        assert [item.src for item in summary.media] == ["/fake/a.mp4", None]
+        assert summary.media[1].name == "Unnamed"
+        assert summary.track_types == {"video": 1, "Unknown": 1}
+        assert [track.duration for track in summary.tracks] == [700, 2050]
+        assert [len(track.clips) for track in summary.tracks] == [5, 1]
+        assert summary.total_clips == 8
+        assert summary.total_effects == 2
+        assert summary.markers[0].time == 1500
+
+    def test_empty_project(self):
+        """Missing sections give an empty summary."""
+        summary = summarize_project({})
+
+        assert not summary.has_scenes
+        assert summary.width == "Unknown"
+        assert summary.media_count == summary.total_clips == 0
+
+    def test_round_trip(self, project_data):
+        """Summaries survive serialization; other versions are rejected."""
+        summary = summarize_project(project_data)
+        data = json.loads(json.dumps(summary.to_dict()))
+
+        assert ProjectSummary.from_dict(data) == summary
+        with pytest.raises(ValueError, match="Unsupported summary version"):
+            ProjectSummary.from_dict({**data, "summaryVersion": 0})
+
+
+class TestSidecar:
+    """Test reuse and invalidation of the summary sidecar."""
+
+    def test_sidecar_is_reused(self, project_file, monkeypatch):
+        """The second load reads the sidecar instead of the project."""
+        calls = _count_summaries(monkeypatch)
+
+        first = load_summary(project_file)
+        second = load_summary(project_file)
+
+        assert first == second
+        assert len(calls) == 1
+        assert second.fingerprint["size"] == project_file.stat().st_size
+
+    def test_sidecar_in_cache_directory(self, project_file, tmp_path, monkeypatch, capsys):
+        """Sidecars go to the cache directory, never next to the project."""
+        monkeypatch.setenv("CAMTASIO_CACHE_DIR", str(tmp_path / "cache"))
+
+        CamtasioCLI().info(str(project_file))
+
+        sidecar = sidecar_path(project_file)
+        assert sidecar.is_relative_to(tmp_path / "cache" / "summaries")
+        assert sidecar.exists()
+        assert list(project_file.parent.glob("*.summary.json")) == []
+        assert sidecar_path(project_file.parent / "." / project_file.name) == sidecar
+
+        CamtasioCLI().cache(clear=True)
+        assert "1 summaries" in capsys.readouterr().out
+        assert not sidecar.exists()
+
+    def test_touch_and_change(self, project_file, project_data, monkeypatch):
+        """A touched file reuses the sidecar; changed content recomputes it."""
+        load_summary(project_file)
+        calls = _count_summaries(monkeypatch)
+
+        os.utime(project_file, ns=(10**18, 10**18))
+        load_summary(project_file)
+        assert calls == []
+
+        project_data["version"] = "8.0"
+        project_file.write_text(json.dumps(project_data), encoding="utf-8")
+        assert load_summary(project_file).version == "8.0"
+        assert len(calls) == 1
+
+    def test_disabled_and_unreadable(self, project_file, monkeypatch):
+        """No sidecar is written when disabled; broken sidecars are replaced."""
+        load_summary(project_file, use_sidecar=False)
+        assert not sidecar_path(project_file).exists()
+
+        sidecar_path(project_file).write_text("{broken", encoding="utf-8")
+        assert load_summary(project_file).media_count == 2
+
+        monkeypatch.setenv("CAMTASIO_CACHE", "0")
+        sidecar_path(project_file).unlink()
+        load_summary(project_file)
+        assert not sidecar_path(project_file).exists()
+
+    def test_cli_summarize(self, project_file, capsys):
+        """The summarize command prints the summary or its JSON form."""
+        cli = CamtasioCLI()
+
+        cli.summarize(str(project_file))
+        assert "Clips:" in capsys.readouterr().out
+
+        cli.summarize(str(project_file), json_output=True)
+        assert json.loads(capsys.readouterr().out)["markers"][0]["name"] == "Intro"
+
+    def test_commands_render_from_summary(self, project_file, capsys):
+        """Inspection commands show the summary statistics."""
+        cli = CamtasioCLI()
+
+        cli.track_ls(str(project_file), detailed=True)
+        output = capsys.readouterr().out
+        assert "Unknown - 1 clips" in output
+        assert "... and 2 more clips" in output
+
+        cli.marker_ls(str(project_file))
+        assert "Intro at 1.50s (chapter)" in capsys.readouterr().out
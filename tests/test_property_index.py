@@ -0,0 +1,167 @@
+# this_file: tests/test_property_index.py
+"""Tests for the precompiled property index."""
+
+import copy
+import json
+
+import pytest
+
+from camtasio.scaler import TscprojScaler
+from camtasio.transforms import (
+    CompositeTransformConfig,
+    PropertyIndex,
+    PropertyTransformer,
+    TransformConfig,
+    TransformType,
+    index_path,
+)
+
+
+@pytest.fixture
+def project_dict(simple_video_path):
+    """Real Camtasia project data."""
+    with open(simple_video_path / "project.tscproj", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def sample_dict():
+    """Small project-like dictionary with every kind of leaf."""
+    return {
+        "width": 1920,
+        "sourceBin": [{"rect": [0, 0, 1920, 1080]}],
+        "tracks": [
+            {
+                "_type": "VMFile",
+                "start": 10,
+                "parameters": {"translation0": {"keyframes": [{"time": 5, "value": 2}]}},
+            },
+            {"_type": "AMFile", "start": 10, "duration": 30, "range": [0, 30]},
+        ],
+        "a/b": {"_type": "IMFile", "markIn": 4},
+    }
+
+
+class TestPropertyIndex:
+    """Test building and applying property indexes."""
+
+    def test_build(self, sample_dict):
+        """Leaves are recorded as JSON pointers by category."""
+        index = PropertyIndex.build(sample_dict)
+
+        assert index.spatial == [
+            "/width",
+            "/sourceBin/0/rect/0",
+            "/sourceBin/0/rect/1",
+            "/sourceBin/0/rect/2",
+            "/sourceBin/0/rect/3",
+            "/tracks/0/parameters/translation0/keyframes/0/value",
+        ]
+        assert index.temporal == [
+            "/tracks/0/start",
+            "/tracks/0/parameters/translation0/keyframes/0/time",
+            "/tracks/1/start",
+            "/tracks/1/range/0",
+            "/tracks/1/range/1",
+            "/a~1b/markIn",
+        ]
+        assert index.temporal_audio == ["/tracks/1/duration"]
+        assert index.leaf_count == 13
+
+    @pytest.mark.parametrize("transform_type", [TransformType.SPATIAL, TransformType.TEMPORAL])
+    @pytest.mark.parametrize("preserve_audio", [True, False])
+    def test_matches_full_walk(self, project_dict, transform_type, preserve_audio):
+        """Indexed transforms equal the full recursive transform."""
+        index = PropertyIndex.build(project_dict)
+        config = TransformConfig(transform_type, 1.7, preserve_audio_duration=preserve_audio)
+        transformer = PropertyTransformer(config)
+
+        assert transformer.transform_dict(project_dict, index=index) == transformer.transform_dict(
+            project_dict
+        )
+
+    def test_reuse_for_several_factors(self, sample_dict):
+        """One index serves repeated transforms without touching the input."""
+        original = copy.deepcopy(sample_dict)
+        index = PropertyIndex.build(sample_dict)
+
+        for factor in (0.5, 2.0, 3.0):
+            result = index.scale_spatial(sample_dict, factor)
+            assert result["width"] == 1920 * factor
+            assert result["tracks"][1] is sample_dict["tracks"][1]  # Untouched, shared
+
+        assert sample_dict == original
+
+    def test_in_place(self, sample_dict):
+        """In-place application mutates the input."""
+        index = PropertyIndex.build(sample_dict)
+        result = index.scale_temporal(
+            sample_dict, 2.0, preserve_audio_duration=False, in_place=True
+        )
+
+        assert result is sample_dict
+        assert sample_dict["tracks"][1]["duration"] == 60
+        assert sample_dict["tracks"][1]["range"] == [0, 60]
+
+    def test_composite_with_index(self, project_dict):
+        """Composite configs apply each step through the index."""
+        steps = [
+            TransformConfig(TransformType.SPATIAL, 2.0),
+            TransformConfig(TransformType.TEMPORAL, 0.5),
+        ]
+        transformer = PropertyTransformer(CompositeTransformConfig(steps))
+        index = PropertyIndex.build(project_dict)
+
+        assert transformer.transform_dict(project_dict, index=index) == transformer.transform_dict(
+            project_dict
+        )
+
+    def test_scaler_rules(self, project_dict):
+        """Scaler indexes reproduce TscprojScaler results."""
+        index = PropertyIndex.build_for_scaler(project_dict)
+        scaler = TscprojScaler(1.5)
+
+        assert scaler.scale_data(project_dict, index) == scaler.scale_data(project_dict)
+
+    def test_rules_mismatch(self, sample_dict):
+        """Indexes are only accepted by the matching transformer."""
+        engine_index = PropertyIndex.build(sample_dict)
+        scaler_index = PropertyIndex.build_for_scaler(sample_dict)
+
+        with pytest.raises(ValueError, match="expected 'scaler'"):
+            TscprojScaler(2.0).scale_data(sample_dict, engine_index)
+        with pytest.raises(ValueError, match="expected 'engine'"):
+            PropertyTransformer(TransformConfig(TransformType.SPATIAL, 2.0)).transform_dict(
+                sample_dict, index=scaler_index
+            )
+
+
+class TestPropertyIndexPersistence:
+    """Test saving and loading indexes."""
+
+    def test_round_trip(self, sample_dict, tmp_path):
+        """Saved indexes load back unchanged."""
+        index = PropertyIndex.build(sample_dict)
+        index.save(tmp_path / "index.json")
+
+        assert PropertyIndex.load(tmp_path / "index.json") == index
+
+    def test_unsupported_version(self):
+        """Unknown index formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported property index version"):
+            PropertyIndex.from_dict({"version": 99})
+
+    def test_for_file_sidecar(self, sample_dict, tmp_path):
+        """for_file() stores a sidecar and rebuilds it when the project changes."""
+        project_path = tmp_path / "project.tscproj"
+        project_path.write_text(json.dumps(sample_dict), encoding="utf-8")
+
+        index = PropertyIndex.for_file(project_path)
+        assert index_path(project_path).exists()
+        assert PropertyIndex.for_file(project_path) == index
+
+        sample_dict["height"] = 1080
+        project_path.write_text(json.dumps(sample_dict, indent=2), encoding="utf-8")
+        rebuilt = PropertyIndex.for_file(project_path)
+        assert "/height" in rebuilt.spatial
+        assert rebuilt.fingerprint != index.fingerprint
@@ -0,0 +1,217 @@
+# this_file: tests/test_references.py
+"""Tests for the media reference index."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from camtasio.models import (
+    AudioMedia,
+    GroupMedia,
+    Project,
+    SourceItem,
+    StitchedMedia,
+    Track,
+    UnifiedMedia,
+    VideoMedia,
+    find_used_source_ids,
+    iter_media_dicts,
+)
+from camtasio.operations import find_media_references, remove_media, remove_unused_media
+
+EXAMPLE_PATH = Path(__file__).parent.parent / "example" / "test_integer_preserved.tscproj"
+
+
+def _project(sources: int, tracks: list[list[int]]) -> Project:
+    """Project with the given source IDs used by the media of each track."""
+    project = Project.empty()
+    for source_id in range(1, sources + 1):
+        project.source_bin.add_item(SourceItem(source_id, f"{source_id}.mp4", [0, 0, 1, 1], ""))
+    media_id = 100
+    for index, srcs in enumerate(tracks):
+        track = Track(track_index=index)
+        for src in srcs:
+            track.add_media(VideoMedia(id=media_id, src=src))
+            media_id += 1
+        project.timeline.add_track(track)
+    return project
+
+
+class TestMediaReferenceIndex:
+    """Test lookups and incremental maintenance."""
+
+    def test_find(self):
+        """References are reported per track in track order."""
+        project = _project(3, [[1, 2], [2, 2]])
+
+        refs = project.references.find(2)
+
+        assert [(position, media.id) for position, media in refs] == [(0, 101), (1, 102), (1, 103)]
+        assert project.references.find(3) == []
+        assert project.references.used_source_ids() == {1, 2}
+
+    def test_memoized(self):
+        """The index is built once per timeline."""
+        project = _project(1, [[1]])
+        assert project.references is project.references
+
+    def test_track_changes_are_detected(self):
+        """Edits through the track API or the media list are picked up."""
+        project = _project(3, [[1], [2]])
+        index = project.references
+        assert not index.is_used(3)
+
+        project.timeline.tracks[0].add_media(VideoMedia(id=200, src=3))
+        assert index.is_used(3)
+
+        project.timeline.tracks[1].medias.append(VideoMedia(id=201, src=3))
+        assert len(index.find(3)) == 2
+
+        project.timeline.tracks[1].remove_media(project.timeline.tracks[1].medias[0])
+        assert not index.is_used(2)
+
+        project.timeline.tracks.pop(0)
+        assert not index.is_used(1)
+        assert [position for position, _ in index.find(3)] == [0]
+
+    def test_incremental_edits(self, monkeypatch):
+        """Edits through the index update it without re-indexing the track."""
+        project = _project(2, [[1, 1]])
+        index = project.references
+        index.refresh()
+        monkeypatch.setattr(index, "_index_track", pytest.fail)
+        media = VideoMedia(id=300, src=2)
+
+        index.add_media(0, media)
+        index.remove_media(0, project.timeline.tracks[0].medias[0])
+
+        assert [m.id for _, m in index.find(1)] == [101]
+        assert index.find(2) == [(0, media)]
+        monkeypatch.undo()
+        fresh = _project(2, [])
+        fresh.timeline = project.timeline
+        assert fresh.references.used_source_ids() == index.used_source_ids()
+
+    def test_remove_missing_media(self):
+        """Removing media that is not on the track fails."""
+        project = _project(1, [[1]])
+        with pytest.raises(ValueError, match="is not on track 0"):
+            project.references.remove_media(0, VideoMedia(id=1, src=1))
+
+
+class TestProjectMediaOperations:
+    """Test media operations on Project instances."""
+
+    def test_find_media_references(self):
+        """Project references are returned as (track, media id) pairs."""
+        project = _project(2, [[1], [1, 2]])
+        assert find_media_references(project, 1) == [(0, 100), (1, 101)]
+        with pytest.raises(KeyError):
+            find_media_references(project, 9)
+
+    def test_remove_media(self):
+        """Removing a source item clears its media from the tracks."""
+        project = _project(2, [[1, 2], [1]])
+
+        with pytest.raises(ValueError, match="clear_tracks=False"):
+            remove_media(project, 1, clear_tracks=False)
+        remove_media(project, 1)
+
+        assert [item.id for item in project.source_bin.items] == [2]
+        assert [[m.src for m in t.medias] for t in project.timeline.tracks] == [[2], []]
+
+    def test_remove_unused_media(self):
+        """Unused source items are removed in one pass."""
+        project = _project(1000, [[2, 4], [998]])
+
+        removed = remove_unused_media(project)
+
+        assert len(removed) == 997
+        assert [item.id for item in project.source_bin.items] == [2, 4, 998]
+
+
+class TestMediaDicts:
+    """Test reference lookups on raw project dictionaries."""
+
+    def test_nested_media(self):
+        """Media inside Groups, StitchedMedia and UnifiedMedia are yielded."""
+        tracks = [
+            {
+                "medias": [
+                    {"id": 1, "src": 1},
+                    {"id": 2, "tracks": [{"medias": [{"id": 3, "src": 2}]}]},
+                    {"id": 4, "medias": [{"id": 5, "src": 3}]},
+                    {"id": 6, "video": {"id": 7, "src": 4}, "audio": {"id": 8, "src": 5}},
+                ]
+            }
+        ]
+        assert [m["id"] for m in iter_media_dicts(tracks)] == [1, 2, 3, 4, 5, 6, 7, 8]
+
+    def test_find_used_source_ids(self):
+        """Sources used only by nested media count as used."""
+        data = json.loads(EXAMPLE_PATH.read_text(encoding="utf-8"))
+        assert find_used_source_ids(data) == {item["id"] for item in data["sourceBin"]}
+        assert find_used_source_ids({"timeline": []}) == set()
+
+
+class TestNestedReferences:
+    """Test the index over media nested in composite media."""
+
+    def _project(self) -> Project:
+        project = _project(4, [[1]])
+        stitched = StitchedMedia(id=10, src=0, medias=[VideoMedia(id=11, src=2)])
+        unified = UnifiedMedia(
+            id=12, src=0, video=VideoMedia(id=13, src=3), audio=AudioMedia(id=14, src=4)
+        )
+        group = GroupMedia(id=15, src=0, tracks=[Track(track_index=0, medias=[stitched])])
+        project.timeline.tracks[0].add_media(group)
+        project.timeline.tracks[0].add_media(unified)
+        return project
+
+    def test_nested_media_are_indexed(self):
+        """Nested media count as references of their timeline track."""
+        project = self._project()
+
+        assert project.references.used_source_ids() == {1, 2, 3, 4}
+        assert [(position, m.id) for position, m in project.references.find(2)] == [(0, 11)]
+        assert remove_unused_media(project) == []
+
+    def test_remove_nested_media(self):
+        """Nested media are removed from their container; UnifiedMedia as a whole."""
+        project = self._project()
+        index = project.references
+        track = project.timeline.tracks[0]
+
+        index.remove_media(0, index.find(2)[0][1])
+        assert track.medias[1].tracks[0].medias[0].medias == []
+        assert not index.is_used(2)
+
+        index.remove_media(0, index.find(4)[0][1])
+        assert [media.id for media in track.medias] == [100, 15]
+        assert not index.is_used(3)
+
+    def test_remove_source_of_unified_media(self):
+        """A source used by both halves of a UnifiedMedia is removed completely."""
+        project = _project(3, [[1]])
+        unified = UnifiedMedia(
+            id=12, src=0, video=VideoMedia(id=13, src=3), audio=AudioMedia(id=14, src=3)
+        )
+        project.timeline.tracks[0].add_media(unified)
+
+        remove_media(project, 3)
+
+        assert [media.id for media in project.timeline.tracks[0].medias] == [100]
+        assert [item.id for item in project.source_bin.items] == [1, 2]
+        assert not project.references.is_used(3)
+
+    def test_add_composite(self):
+        """Adding a composite indexes the media nested in it."""
+        project = _project(2, [[1]])
+        group = GroupMedia(
+            id=20, src=0, tracks=[Track(track_index=0, medias=[VideoMedia(id=21, src=2)])]
+        )
+
+        project.references.add_media(0, group)
+
+        assert project.references.find(2) == [(0, group.tracks[0].medias[0])]
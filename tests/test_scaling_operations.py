@@ -1,14 +1,22 @@
 # this_file: tests/test_scaling_operations.py
 """Comprehensive tests for spatial and temporal scaling operations."""
 
+import copy
+import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from camtasio.models import Project
+from camtasio.scaler import TscprojScaler
 from camtasio.serialization import ProjectLoader, ProjectSaver
-from camtasio.transforms import PropertyTransformer, TransformConfig, TransformType
+from camtasio.transforms import (
+    CompositeTransformConfig,
+    PropertyTransformer,
+    TransformConfig,
+    TransformType,
+)
 
 
 class TestSpatialScaling:
@@ -489,3 +497,82 @@ class TestScalingIntegration:
         assert len(scaled["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"]) == 2
         assert scaled["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"][0]["trackIndex"] == 0
         assert scaled["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"][1]["trackIndex"] == 1
+
+
+class TestInPlaceScaling:
+    """Test in-place mutation mode of the dict scalers."""
+
+    @pytest.fixture
+    def project_dict(self, simple_video_path):
+        """Real Camtasia project data."""
+        with open(simple_video_path / "project.tscproj", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_scaler_in_place_matches_copy(self, project_dict):
+        """In-place TscprojScaler mutates the input and matches copy mode."""
+        expected = TscprojScaler(2.0)._scale_object(copy.deepcopy(project_dict))
+
+        result = TscprojScaler(2.0, in_place=True)._scale_object(project_dict)
+
+        assert result is project_dict
+        assert result == expected
+
+    def test_scaler_in_place_keyframes_and_defs(self):
+        """Keyframes, def objects and default values are mutated in place."""
+        data = {
+            "rect": [0, 0, 10, 20],
+            "def": {"width": 10, "height": 5},
+            "default-width": {"value": 4},
+            "translation0": {"keyframes": [{"time": 0, "value": 3}]},
+        }
+        keyframe = data["translation0"]["keyframes"][0]
+
+        TscprojScaler(2.0, in_place=True)._scale_object(data)
+
+        assert data["rect"] == [0, 0, 20, 40]
+        assert data["def"] == {"width": 20, "height": 10}
+        assert data["default-width"] == {"value": 8}
+        assert keyframe == {"time": 0, "value": 6}
+
+    @pytest.mark.parametrize("transform_type", [TransformType.SPATIAL, TransformType.TEMPORAL])
+    def test_transformer_in_place_matches_copy(self, project_dict, transform_type):
+        """In-place PropertyTransformer matches copy mode."""
+        original = copy.deepcopy(project_dict)
+        expected = PropertyTransformer(TransformConfig(transform_type, 1.5)).transform_dict(
+            project_dict
+        )
+        assert project_dict == original
+
+        config = TransformConfig(transform_type, 1.5, in_place=True)
+        result = PropertyTransformer(config).transform_dict(project_dict)
+
+        assert result is project_dict
+        assert result == expected
+
+    def test_composite_in_place(self, project_dict):
+        """Fused transforms support in-place mode too."""
+        steps = [
+            TransformConfig(TransformType.SPATIAL, 2.0),
+            TransformConfig(TransformType.TEMPORAL, 0.5),
+        ]
+        expected = PropertyTransformer(CompositeTransformConfig(steps)).transform_dict(project_dict)
+
+        config = CompositeTransformConfig(steps, in_place=True)
+        result = PropertyTransformer(config).transform_dict(project_dict)
+
+        assert result is project_dict
+        assert result == expected
+
+    def test_scaler_copies_untouched_dicts(self):
+        """Dicts of already classified plain keys are copied, not shared."""
+        data = {
+            "medias": [{"name": "a"}, {"name": "b"}],
+            "parameters": {"width": 10, "ident": "a"},
+        }
+
+        result = TscprojScaler(2.0)._scale_object(data)
+
+        assert result["medias"][1] is not data["medias"][1]
+        assert result["medias"] == data["medias"]
+        assert result["parameters"] == {"width": 20, "ident": "a"}
+        assert data["parameters"]["width"] == 10
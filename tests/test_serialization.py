@@ -2,9 +2,12 @@
 """Unit tests for serialization layer."""
 
 import json
+import os
+import stat
 import tempfile
 from pathlib import Path
 
+import orjson
 import pytest
 
 from camtasio.models import Project
@@ -12,9 +15,17 @@ from camtasio.serialization import (
     ProjectLoader,
     ProjectSaver,
     ProjectVersion,
+    TrackedDocument,
     detect_version,
+    dumps_json,
     get_version_features,
     is_supported_version,
+    iter_json_bytes,
+    json_handler,
+    make_pointer,
+    sanitize_floats,
+    save_json_file,
+    write_atomic,
 )
 
 
@@ -300,3 +311,247 @@ class TestProjectSaver:
             assert loaded.metadata.author == original.metadata.author
         finally:
             temp_path.unlink()
+
+
+class TestStreamingWriter:
+    """Test chunked serialization and atomic writes."""
+
+    @pytest.fixture
+    def project_dict(self, simple_video_path):
+        """Real Camtasia project data."""
+        with open(simple_video_path / "project.tscproj", "rb") as f:
+            return orjson.loads(f.read())
+
+    @pytest.mark.parametrize("indent", [2, 0])
+    def test_chunks_match_orjson(self, project_dict, indent):
+        """Chunked output is byte-identical to a single orjson.dumps call."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+        expected = orjson.dumps(project_dict, option=option)
+
+        chunks = list(iter_json_bytes(project_dict, indent=indent))
+
+        assert len(chunks) > 1
+        assert b"".join(chunks) == expected
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"sourceBin": []},
+            {"sourceBin": [1, {"src": "a\nb"}, []]},
+            {"timeline": {"sceneTrack": {"scenes": [{"csml": {"tracks": [{"medias": []}]}}]}}},
+            {"timeline": {1: "non-string key", "sceneTrack": {}}},
+        ],
+    )
+    def test_edge_cases_match_orjson(self, data):
+        """Empty containers, odd shapes and non-string keys serialize identically."""
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        assert b"".join(iter_json_bytes(data)) == orjson.dumps(data, option=option)
+
+    def test_save_replaces_file(self, project_dict, tmp_path):
+        """save_json_file writes the document and leaves no temporary files."""
+        path = tmp_path / "project.tscproj"
+        path.write_text("old", encoding="utf-8")
+
+        save_json_file(project_dict, path)
+
+        assert orjson.loads(path.read_bytes()) == project_dict
+        assert [p.name for p in tmp_path.iterdir()] == ["project.tscproj"]
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        """An error mid-write leaves the original file untouched."""
+        path = tmp_path / "project.tscproj"
+        path.write_text('{"keep": true}', encoding="utf-8")
+
+        def chunks():
+            yield b'{"partial": '
+            raise RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            write_atomic(path, chunks())
+
+        assert path.read_text(encoding="utf-8") == '{"keep": true}'
+        assert [p.name for p in tmp_path.iterdir()] == ["project.tscproj"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_preserves_mode_and_symlink(self, tmp_path):
+        """The target keeps its permissions and symlinks keep pointing at it."""
+        target = tmp_path / "real.tscproj"
+        target.write_text("{}", encoding="utf-8")
+        target.chmod(0o640)
+        link = tmp_path / "link.tscproj"
+        link.symlink_to(target)
+
+        save_json_file({"a": 1}, link)
+
+        assert link.is_symlink()
+        assert json.loads(target.read_text(encoding="utf-8")) == {"a": 1}
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+    def test_stdlib_fallback(self, monkeypatch, tmp_path):
+        """Without orjson the standard encoder is streamed instead."""
+        monkeypatch.setattr(json_handler, "HAS_ORJSON", False)
+        path = tmp_path / "project.tscproj"
+
+        save_json_file({"b": [1, 2], "a": "é"}, path)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            {"b": [1, 2], "a": "é"}, indent=2, ensure_ascii=False
+        )
+
+
+class TestFloatSanitization:
+    """Test replacement of NaN and infinite floats on save."""
+
+    def test_clean_data_is_not_copied(self):
+        """Data without special floats is returned as the same object."""
+        data = {"a": [1.5, {"b": None}], "c": "null"}
+        assert sanitize_floats(data) is data
+
+    def test_copies_only_affected_paths(self):
+        """Only containers on the path to a special float are copied."""
+        clean = {"x": [1.0, 2.0]}
+        data = {"clean": clean, "bad": [0.5, float("nan"), float("-inf")]}
+
+        result = sanitize_floats(data)
+
+        assert result["bad"] == [0.5, 0.0, -1.7976931348623157e308]
+        assert result["clean"] is clean
+        assert data["bad"][1] != data["bad"][1]  # Input still holds NaN
+
+    def test_save_replaces_special_floats(self, tmp_path):
+        """Saved files contain finite values in place of NaN and infinities."""
+        data = {
+            "sourceBin": [{"rect": [0, 0, float("inf"), 1080]}],
+            "timeline": {"sceneTrack": {"scenes": [{"csml": {"tracks": []}}]}},
+            "scale": float("nan"),
+            "missing": None,
+        }
+        path = tmp_path / "project.tscproj"
+
+        save_json_file(data, path)
+
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved["sourceBin"][0]["rect"] == [0, 0, 1.7976931348623157e308, 1080]
+        assert saved["scale"] == 0.0
+        assert saved["missing"] is None
+
+    def test_null_chunks_are_checked_not_copied(self, monkeypatch):
+        """Chunks with genuine nulls are serialized only once."""
+        dumped = []
+        dumps = orjson.dumps
+
+        def counting_dumps(value, **kwargs):
+            dumped.append(value)
+            return dumps(value, **kwargs)
+
+        monkeypatch.setattr(json_handler.orjson, "dumps", counting_dumps)
+        item = {"src": None}
+        data = {"sourceBin": [item], "title": None}
+
+        output = b"".join(iter_json_bytes(data))
+
+        assert json.loads(output) == data
+        assert sum(value is item for value in dumped) == 1
+
+    def test_sanitize_disabled(self):
+        """sanitize=False leaves orjson's null output for special floats."""
+        assert json.loads(dumps_json({"v": float("inf")}, sanitize=False)) == {"v": None}
+        assert json.loads(dumps_json({"v": float("inf")})) == {"v": 1.7976931348623157e308}
+
+
+class TestTrackedDocument:
+    """Test incremental re-saves that reuse the bytes of unchanged subtrees."""
+
+    @pytest.fixture
+    def saved_bytes(self, simple_video_path):
+        """Real project as written by save_json_file."""
+        with open(simple_video_path / "project.tscproj", "rb") as f:
+            return b"".join(iter_json_bytes(orjson.loads(f.read())))
+
+    def test_unchanged_document_is_reproduced(self, saved_bytes):
+        """Saving an untouched document yields the source bytes."""
+        document = TrackedDocument(saved_bytes)
+
+        assert document.data == orjson.loads(saved_bytes)
+        assert b"".join(document.iter_bytes()) == saved_bytes
+
+    def test_edits_match_full_save(self, saved_bytes):
+        """Marked, replaced, removed and added entries give the full-save output."""
+        document = TrackedDocument(saved_bytes)
+        data = document.data
+        data["sourceBin"][0]["src"] = "moved.trec"
+        document.mark_dirty("/sourceBin/0/src")
+        medias = data["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"][0]["medias"]
+        medias[0]["start"] += 10
+        document.mark_dirty(["timeline", "sceneTrack", "scenes", 0, "csml", "tracks", 0])
+        medias.append({"_type": "Callout", "id": 999})
+        data["title"] = "Edited"
+
+        assert b"".join(document.iter_bytes()) == b"".join(iter_json_bytes(data))
+        assert document.dirty_pointers == [
+            "/sourceBin/0/src",
+            "/timeline/sceneTrack/scenes/0/csml/tracks/0",
+        ]
+
+    def test_unmarked_in_place_edit_is_not_seen(self):
+        """In-place edits inside a loaded subtree need mark_dirty."""
+        document = TrackedDocument(b'{"sourceBin": [{"src": "a"}]}')
+        document.data["sourceBin"][0]["src"] = "b"
+        assert b'"a"' in b"".join(document.iter_bytes())
+
+        document.mark_dirty("/sourceBin/0")
+        assert json.loads(b"".join(document.iter_bytes())) == {"sourceBin": [{"src": "b"}]}
+
+    def test_removed_entries_keep_the_others_reused(self, saved_bytes):
+        """Deleting list entries needs no mark_dirty and keeps the rest reused."""
+        document = TrackedDocument(saved_bytes)
+        source_bin = document.data["sourceBin"]
+        kept_src = source_bin[1]["src"]
+        del source_bin[0]
+
+        assert b"".join(document.iter_bytes()) == b"".join(iter_json_bytes(document.data))
+
+        # An unmarked edit stays invisible only while the entry's span is reused
+        source_bin[0]["src"] = "unmarked.trec"
+        output = orjson.loads(b"".join(document.iter_bytes()))
+        assert [item["src"] for item in output["sourceBin"]] == [kept_src]
+
+    def test_foreign_formatting_and_special_floats(self):
+        """Other source formatting stays valid JSON and NaN is sanitized."""
+        source = '{ "sourceBin" : [ {"id": 1, "name": "é"} ,\n 2 ], "scale": NaN }'
+        document = TrackedDocument(source.encode("utf-8"))
+
+        output = json.loads(b"".join(document.iter_bytes()))
+        escaped = b"".join(document.iter_bytes(ensure_ascii=True))
+
+        assert output == {"sourceBin": [{"id": 1, "name": "é"}, 2], "scale": 0.0}
+        assert escaped.isascii()
+        assert json.loads(escaped) == output
+
+    def test_invalid_json(self):
+        """Malformed documents raise JSONDecodeError."""
+        for source in (b'{"a": 1', b'{"a" 1}', b"[1 2]", b"{} x", b'{"sourceBin": [1,]}'):
+            with pytest.raises(json.JSONDecodeError):
+                TrackedDocument(source)
+
+    def test_make_pointer(self):
+        """Pointer tokens are escaped as in RFC 6901."""
+        assert make_pointer(["a/b", "m~n", 0]) == "/a~1b/m~0n/0"
+        document = TrackedDocument(b'{"a/b": {"m~n": [1]}}')
+        document.mark_dirty("/a~1b/m~0n/0")
+        with pytest.raises(ValueError, match="Invalid JSON pointer"):
+            document.mark_dirty("a")
+
+    def test_saver_writes_document(self, saved_bytes, tmp_path):
+        """ProjectSaver.save_document writes back to the source file."""
+        path = tmp_path / "project.tscproj"
+        path.write_bytes(saved_bytes)
+        document = TrackedDocument.load(path)
+        document.data["title"] = "Saved"
+
+        ProjectSaver().save_document(document)
+
+        assert orjson.loads(path.read_bytes())["title"] == "Saved"
+        with pytest.raises(ValueError, match="No file path"):
+            ProjectSaver().save_document(TrackedDocument(b"{}"))
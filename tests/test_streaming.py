@@ -0,0 +1,169 @@
+# this_file: tests/test_streaming.py
+"""Tests for the streaming project loader."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from camtasio.models import AudioMedia, Project, SourceItem, Track, VideoMedia
+from camtasio.serialization import (
+    ProjectLoader,
+    StreamingProjectLoader,
+    iter_project_events,
+)
+
+
+def _write_project(tmp_path: Path, data: dict) -> Path:
+    path = tmp_path / "project.tscproj"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project_file(tmp_path):
+    """A small project with a source bin, two tracks and a transition."""
+    project = Project.empty(width=1280, height=720)
+    project.source_bin.add_item(
+        SourceItem(id=1, src="./media/clip.mp4", rect=[0, 0, 1280, 720], last_mod="20240101T000000")
+    )
+    video_track = Track(track_index=0)
+    video_track.add_media(VideoMedia(id=10, src=1, start=0, duration=300))
+    video_track.add_media(VideoMedia(id=11, src=1, start=300, duration=150))
+    audio_track = Track(track_index=1, ident="Voice")
+    audio_track.add_media(AudioMedia(id=12, src=1, start=0, duration=450))
+    project.timeline.add_track(video_track)
+    project.timeline.add_track(audio_track)
+
+    data = project.to_dict()
+    data["timeline"]["sceneTrack"]["scenes"][0]["csml"]["tracks"][0]["transitions"] = [
+        {"name": "Fade", "duration": 30, "leftMedia": 10, "rightMedia": 11, "attributes": {}}
+    ]
+    return _write_project(tmp_path, data)
+
+
+class TestIterProjectEvents:
+    """Test the event stream."""
+
+    def test_event_order(self, project_file):
+        """Media events arrive before their track, root comes last."""
+        kinds = [event.kind for event in iter_project_events(project_file)]
+
+        assert kinds.count("source_item") == 1
+        assert kinds.count("media") == 3
+        assert kinds.count("transition") == 1
+        assert kinds.count("track") == 2
+        assert kinds[-1] == "root"
+        assert kinds.index("media") < kinds.index("track")
+
+    def test_track_positions(self, project_file):
+        """Media events carry the position of their track."""
+        positions = [
+            (event.track_position, event.value.id)
+            for event in iter_project_events(project_file)
+            if event.kind == "media"
+        ]
+        assert positions == [(0, 10), (0, 11), (1, 12)]
+
+    def test_track_event_has_no_media(self, project_file):
+        """Track events only carry the track header."""
+        tracks = [e.value for e in iter_project_events(project_file) if e.kind == "track"]
+        assert [t.media_count for t in tracks] == [0, 0]
+        assert tracks[1].ident == "Voice"
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_small_chunks(self, project_file, chunk_size):
+        """Entries split across many refills are still decoded correctly."""
+        media = [
+            e.value.id
+            for e in iter_project_events(project_file, chunk_size=chunk_size)
+            if e.kind == "media"
+        ]
+        assert media == [10, 11, 12]
+
+    def test_invalid_json(self, tmp_path):
+        """Truncated documents raise JSONDecodeError."""
+        path = tmp_path / "broken.tscproj"
+        path.write_text('{"sourceBin": [{"id": 1, "src": "a"', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_project_events(path, chunk_size=8))
+
+
+class TestStreamingProjectLoader:
+    """Test assembling a Project from the event stream."""
+
+    def test_matches_regular_loader(self, project_file):
+        """Streaming and regular loading produce the same project."""
+        expected = ProjectLoader().load_file(project_file).to_dict()
+        actual = StreamingProjectLoader(chunk_size=16).load_file(project_file).to_dict()
+        assert actual == expected
+
+    def test_loaded_project(self, project_file):
+        """Loaded project exposes tracks, media and canvas."""
+        project = StreamingProjectLoader().load_file(project_file)
+
+        assert project.canvas.width == 1280
+        assert project.timeline.track_count == 2
+        assert project.timeline.media_count == 3
+        assert project.timeline.tracks[0].transitions[0].name == "Fade"
+        assert project.source_bin.get_by_id(1) is not None
+
+    def test_real_project(self, simple_video_path):
+        """Streaming matches the regular loader on a real Camtasia file."""
+        path = simple_video_path / "project.tscproj"
+        expected = ProjectLoader().load_file(path).to_dict()
+        assert StreamingProjectLoader(chunk_size=64).load_file(path).to_dict() == expected
+
+    def test_file_not_found(self, tmp_path):
+        """Missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            StreamingProjectLoader().load_file(tmp_path / "missing.tscproj")
+
+    def test_unsupported_version_strict(self, tmp_path):
+        """Strict loaders reject unsupported versions."""
+        path = _write_project(tmp_path, {"version": "1.0", "width": 10, "height": 10})
+
+        with pytest.raises(ValueError, match="Unsupported project version"):
+            StreamingProjectLoader(strict_version_check=True).load_file(path)
+
+    def test_invalid_source_bin_is_ignored(self, tmp_path):
+        """A non-list sourceBin is skipped with a warning."""
+        path = _write_project(
+            tmp_path, {"version": "9.0", "width": 10, "height": 10, "sourceBin": "bad"}
+        )
+        project = StreamingProjectLoader().load_file(path)
+        assert project.source_bin.items == []
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"version": "9.0", "width": 10, "height": 10},
+            {"version": "9.0", "editRate": 60, "width": 10, "height": 10, "sourceBin": "bad"},
+            {"version": "9.0", "editRate": 60, "width": 10, "height": 10, "timeline": []},
+            {
+                "version": "9.0",
+                "editRate": 60,
+                "width": 10,
+                "height": 10,
+                "sourceBin": [{"id": 1}, {"src": "a"}, 5],
+            },
+        ],
+    )
+    def test_validates_like_regular_loader(self, tmp_path, data):
+        """Strict loaders report the same structure errors for both paths."""
+        path = _write_project(tmp_path, data)
+
+        with pytest.raises(ValueError, match="Invalid project structure") as expected:
+            ProjectLoader(strict_version_check=True).load_file(path)
+        with pytest.raises(ValueError, match="Invalid project structure") as actual:
+            StreamingProjectLoader(strict_version_check=True, chunk_size=8).load_file(path)
+        assert str(actual.value) == str(expected.value)
+
+    def test_structure_event(self, project_file):
+        """The structure event outlines the streamed containers."""
+        events = list(iter_project_events(project_file))
+
+        assert events[-2].kind == "structure"
+        assert events[-2].value == {"sourceBin": [{"id": None}], "timeline": {}}
+        assert ProjectLoader().validate_structure({**events[-1].value, **events[-2].value}) == []
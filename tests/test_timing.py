@@ -3,10 +3,13 @@
 # this_file: tests/test_timing.py
 
 from datetime import timedelta
+from fractions import Fraction
 
 import pytest
 
-from camtasio.utils.timing import FrameStamp
+from camtasio.serialization import ProjectVersion
+from camtasio.utils import timing
+from camtasio.utils.timing import COMMON_FRAME_RATES, FrameStamp
 
 
 class TestFrameStamp:
@@ -394,3 +397,33 @@ class TestFrameStampInvalidOperations:
         # Subtracting larger from smaller should raise ValueError
         with pytest.raises(ValueError, match="Frame number must be non-negative"):
             fs1 - fs2
+
+
+class TestFrameRateConversionCache:
+    """Test the memoized frame rate conversions."""
+
+    def test_edit_rates_are_precomputed(self):
+        """Conversions between the project edit rates are cache hits."""
+        edit_rates = {version.edit_rate for version in ProjectVersion}
+        assert edit_rates <= set(COMMON_FRAME_RATES)
+
+        hits = timing._conversion_ratio.cache_info().hits
+        FrameStamp(705600000, 705600000).to_frame_rate(60)
+        assert timing._conversion_ratio.cache_info().hits == hits + 1
+
+    def test_same_frame_rate_fast_path(self, monkeypatch):
+        """Same-rate arithmetic and conversion skip the rate tables."""
+        monkeypatch.setattr(timing, "_common_frame_rate", None)
+        monkeypatch.setattr(timing, "_conversion_ratio", None)
+        fs = FrameStamp(100, 30)
+
+        assert fs + FrameStamp(20, 30) == FrameStamp(120, 30)
+        assert fs - FrameStamp(20, 30) == FrameStamp(80, 30)
+        assert fs.to_frame_rate(30) is fs
+
+    @pytest.mark.parametrize("frame_number", [1, 7, 11759999, 5880000, 17640000, 10**20 + 1])
+    def test_conversion_is_exact(self, frame_number):
+        """Conversions round the exact ratio half to even, even for huge values."""
+        result = FrameStamp(frame_number, 705600000).to_frame_rate(60)
+
+        assert result.frame_number == round(Fraction(frame_number * 60, 705600000))
@@ -0,0 +1,93 @@
+# this_file: tests/test_timing_batch.py
+"""Tests for the vectorized frame number conversions."""
+
+from fractions import Fraction
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+np = pytest.importorskip("numpy")
+
+from camtasio.utils.timing import (  # noqa: E402
+    FrameStamp,
+    batch_from_seconds,
+    batch_to_frame_rate,
+    batch_total_seconds,
+)
+
+EDIT_RATE = 705600000
+
+
+class TestBatchToFrameRate:
+    """Test exact rescaling between frame rates."""
+
+    def test_edit_rate_round_trip(self):
+        """Ticks at 60 fps survive a round trip through the edit rate."""
+        frames = np.arange(0, 100_000, 7)
+
+        ticks = batch_to_frame_rate(frames, 60, EDIT_RATE)
+
+        assert ticks.dtype == np.int64
+        assert ticks[1] == 7 * EDIT_RATE // 60
+        np.testing.assert_array_equal(batch_to_frame_rate(ticks, EDIT_RATE, 60), frames)
+
+    def test_half_to_even(self):
+        """Exact halves round to the even neighbour, negatives included."""
+        result = batch_to_frame_rate([1, 3, 5, -1, -3, 2], 2, 1)
+
+        assert result.tolist() == [0, 2, 2, 0, -2, 1]
+
+    @given(
+        st.lists(st.integers(min_value=-(2**62), max_value=2**62), max_size=20),
+        st.integers(min_value=1, max_value=10**9),
+        st.integers(min_value=1, max_value=10**9),
+    )
+    def test_matches_exact_fraction(self, frames, frame_rate, new_frame_rate):
+        """Every element equals the exactly rounded rational result."""
+        result = batch_to_frame_rate(np.array(frames, dtype=np.int64), frame_rate, new_frame_rate)
+
+        expected = [round(Fraction(f * new_frame_rate, frame_rate)) for f in frames]
+        assert [int(v) for v in result.tolist()] == expected
+
+    def test_overflow_falls_back_to_python_ints(self):
+        """Results beyond int64 come back as Python integers."""
+        result = batch_to_frame_rate([2**62, 1], 1, EDIT_RATE)
+
+        assert result.dtype == object
+        assert result.tolist() == [2**62 * EDIT_RATE, EDIT_RATE]
+
+    def test_shape_and_validation(self):
+        """The input shape is kept; bad rates and float input are rejected."""
+        assert batch_to_frame_rate(np.ones((2, 3), dtype=np.int32), 30, 60).shape == (2, 3)
+        assert batch_to_frame_rate([], 30, 60).size == 0
+        with pytest.raises(ValueError, match="Frame rate must be positive"):
+            batch_to_frame_rate([1], 0, 60)
+        with pytest.raises(TypeError, match="must be integers"):
+            batch_to_frame_rate([1.5], 30, 60)
+
+
+class TestBatchSeconds:
+    """Test conversion between seconds and frame numbers."""
+
+    @given(st.lists(st.floats(min_value=0, max_value=1e6), max_size=20))
+    def test_from_seconds_matches_framestamp(self, seconds):
+        """Rounding matches ``FrameStamp.from_seconds``."""
+        result = batch_from_seconds(seconds, 30)
+
+        assert result.tolist() == [FrameStamp.from_seconds(s, 30).frame_number for s in seconds]
+
+    def test_total_seconds_matches_framestamp(self):
+        """Seconds match ``FrameStamp.total_seconds``, including huge values."""
+        frames = [0, 1, 29, 12345, 2**60]
+
+        result = batch_total_seconds(frames, 30)
+
+        assert result.tolist() == [FrameStamp(f, 30).total_seconds for f in frames]
+        assert batch_total_seconds([2**64], 30).tolist() == [2**64 / 30]
+
+    def test_invalid_seconds(self):
+        """Non-finite times are rejected."""
+        with pytest.raises(ValueError, match="finite"):
+            batch_from_seconds([1.0, float("nan")], 30)
+        assert batch_from_seconds([1e30], 1).dtype == object
@@ -1,6 +1,9 @@
 # this_file: tests/test_transforms.py
 """Unit tests for transform engine."""
 
+import copy
+import json
+
 import pytest
 
 from camtasio.models import (
@@ -9,7 +12,14 @@ from camtasio.models import (
     Track,
     VideoMedia,
 )
-from camtasio.transforms import PropertyTransformer, TransformConfig, TransformType
+from camtasio.transforms import (
+    CompiledTransform,
+    CompositeTransformConfig,
+    PropertyIndex,
+    PropertyTransformer,
+    TransformConfig,
+    TransformType,
+)
 
 
 class TestTransformConfig:
@@ -235,3 +245,203 @@ class TestPropertyTransformer:
 
         with pytest.raises(ValueError, match="Unknown transform type"):
             transformer.transform_project(project)
+
+
+class TestCompositeTransform:
+    """Test fused multi-step transforms."""
+
+    @pytest.fixture
+    def project_dict(self, simple_video_path):
+        """Real Camtasia project data."""
+        with open(simple_video_path / "project.tscproj", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _sequential(self, data, configs):
+        for config in configs:
+            data = PropertyTransformer(config).transform_dict(data)
+        return data
+
+    def test_matches_sequential(self, project_dict):
+        """One fused pass equals running each transform in turn."""
+        steps = [
+            TransformConfig(TransformType.SPATIAL, factor=2.0),
+            TransformConfig(TransformType.TEMPORAL, factor=0.5),
+            TransformConfig(TransformType.TEMPORAL, factor=3.0, preserve_audio_duration=False),
+            TransformConfig(TransformType.SPATIAL, factor=1.5),
+        ]
+        fused = PropertyTransformer(CompositeTransformConfig(transforms=steps))
+
+        assert fused.transform_dict(project_dict) == self._sequential(project_dict, steps)
+
+    def test_keyframes_and_audio(self):
+        """Keyframes, rects and AMFile media follow the single-step rules."""
+        data = {
+            "rect": [0, 0, 100, 50],
+            "tracks": [
+                {
+                    "_type": "VMFile",
+                    "start": 10,
+                    "duration": 30,
+                    "parameters": {
+                        "translation0": {"keyframes": [{"time": 10, "value": 5}]},
+                    },
+                },
+                {"_type": "AMFile", "start": 10, "duration": 30},
+            ],
+        }
+        steps = [
+            TransformConfig(TransformType.SPATIAL, factor=2.0),
+            TransformConfig(TransformType.TEMPORAL, factor=2.0),
+        ]
+        fused = PropertyTransformer(CompositeTransformConfig(transforms=steps))
+        result = fused.transform_dict(data)
+
+        assert result["rect"] == [0, 0, 200, 100]
+        video, audio = result["tracks"]
+        assert (video["start"], video["duration"]) == (20, 60)
+        assert video["parameters"]["translation0"]["keyframes"] == [{"time": 20, "value": 10}]
+        assert (audio["start"], audio["duration"]) == (20, 30)
+        assert data["tracks"][0]["start"] == 10  # Input untouched
+
+    def test_custom_handler(self):
+        """Custom handlers see every scalar after the built-in steps."""
+        seen = []
+
+        def rename(key, value, node_type):
+            seen.append((key, node_type))
+            if key == "src" and node_type == "VMFile":
+                return value + 100
+            return value
+
+        data = {"tracks": [{"_type": "VMFile", "src": 1, "width": 10}]}
+        config = CompositeTransformConfig(
+            transforms=[TransformConfig(TransformType.SPATIAL, factor=3.0)], custom=[rename]
+        )
+        result = PropertyTransformer(config).transform_dict(data)
+
+        assert result == {"tracks": [{"_type": "VMFile", "src": 101, "width": 30.0}]}
+        assert ("width", "VMFile") in seen
+
+    def test_invalid_step(self):
+        """Invalid steps are rejected before the walk."""
+        config = CompositeTransformConfig(
+            transforms=[TransformConfig(TransformType.SPATIAL, factor=0)]
+        )
+        with pytest.raises(ValueError, match="Scale factor must be positive"):
+            PropertyTransformer(config).transform_dict({})
+
+    def test_transform_project(self):
+        """Composite configs apply each step to project models."""
+        project = Project.empty(width=100, height=50)
+        config = CompositeTransformConfig(
+            transforms=[
+                TransformConfig(TransformType.SPATIAL, factor=2.0),
+                TransformConfig(TransformType.TEMPORAL, factor=2.0),
+            ]
+        )
+        result = PropertyTransformer(config).transform_project(project)
+        assert (result.canvas.width, result.canvas.height) == (200, 100)
+
+        config.custom.append(lambda key, value, node_type: value)
+        with pytest.raises(ValueError, match="Custom leaf transforms"):
+            PropertyTransformer(config).transform_project(project)
+
+
+class TestCompiledTransform:
+    """Test transforms compiled into per-type handler tables."""
+
+    @pytest.fixture
+    def project_dict(self, simple_video_path):
+        """Real Camtasia project data."""
+        with open(simple_video_path / "project.tscproj", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_matches_property_index(self, project_dict):
+        """Compiled transforms follow the same rules as the property index."""
+        index = PropertyIndex.build(project_dict)
+        spatial = CompiledTransform([TransformConfig(TransformType.SPATIAL, factor=1.5)])
+        temporal = CompiledTransform([TransformConfig(TransformType.TEMPORAL, factor=0.5)])
+
+        assert spatial.transform(project_dict) == index.scale_spatial(project_dict, 1.5)
+        assert temporal.transform(project_dict) == index.scale_temporal(project_dict, 0.5)
+
+    def test_tables_compiled_once_per_type(self):
+        """Each _type gets one table, reused across nodes and calls."""
+        compiled = CompiledTransform([TransformConfig(TransformType.TEMPORAL, factor=2.0)])
+        data = {
+            "start": 5,
+            "medias": [
+                {"_type": "VMFile", "start": 10, "duration": 4},
+                {"_type": "VMFile", "start": 20, "duration": 4},
+                {"_type": "AMFile", "start": 30, "duration": 4},
+            ],
+        }
+
+        result = compiled.transform(data)
+        table = compiled.table("VMFile")
+        compiled.transform(data)
+
+        assert result["start"] == 5  # Untyped nodes keep their timing
+        assert [(m["start"], m["duration"]) for m in result["medias"]] == [
+            (20, 8),
+            (40, 8),
+            (60, 4),
+        ]
+        assert compiled.table("VMFile") is table
+        assert "duration" not in compiled.table("AMFile")
+
+    def test_result_is_independent_copy(self):
+        """Untouched dicts, lists and keyframes are copied, not shared."""
+        data = {
+            "attributes": {"name": "clip", "locked": False},
+            "ids": [1, 2, 3],
+            "parameters": {"scale0": {"keyframes": [{"time": 0, "value": 1.0}]}},
+            "opacity": {"keyframes": [{"time": 0, "value": 1.0}]},
+        }
+        original = copy.deepcopy(data)
+        compiled = CompiledTransform([TransformConfig(TransformType.SPATIAL, factor=2.0)])
+
+        result = compiled.transform(data)
+        result["attributes"]["name"] = "edited"
+        result["ids"].append(4)
+        result["opacity"]["keyframes"][0]["value"] = 0.5
+
+        assert result["parameters"]["scale0"]["keyframes"] == [{"time": 0, "value": 2.0}]
+        assert data == original
+
+    def test_in_place_keeps_containers(self):
+        """In-place mode returns the input containers themselves."""
+        data = {"attributes": {"name": "clip"}, "ids": [1, 2], "width": 10}
+        compiled = CompiledTransform(
+            [TransformConfig(TransformType.SPATIAL, factor=2.0)], in_place=True
+        )
+        attributes, ids = data["attributes"], data["ids"]
+
+        result = compiled.transform(data)
+
+        assert result is data
+        assert result["attributes"] is attributes
+        assert result["ids"] is ids
+        assert result["width"] == 20
+
+    def test_unhashable_type(self):
+        """Nodes with a malformed _type are still transformed."""
+        compiled = CompiledTransform([TransformConfig(TransformType.SPATIAL, factor=2.0)])
+
+        assert compiled.transform({"_type": ["bad"], "width": 10}) == {
+            "_type": ["bad"],
+            "width": 20.0,
+        }
+
+    def test_transformer_reuses_compiled(self):
+        """PropertyTransformer compiles its configuration once."""
+        config = TransformConfig(TransformType.SPATIAL, factor=2.0)
+        transformer = PropertyTransformer(config)
+
+        transformer.transform_dict({"width": 1})
+        compiled = transformer._compiled()
+        transformer.transform_dict({"width": 1})
+
+        assert transformer._compiled() is compiled
+        config.factor = 3.0
+        assert transformer._compiled() is not compiled